@@ -30,6 +30,16 @@ def run_migrations_offline() -> None:
 
 
 def run_migrations_online() -> None:
+    # Callers (e.g. the test suite) may hand in an existing connection
+    # through config.attributes instead of using settings.database_url.
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -3,7 +3,14 @@ from sqlalchemy.orm import sessionmaker, declarative_base
 
 from app.config import settings
 
-engine = create_engine(settings.database_url)
+# psycopg2 fast-execution helpers: multi-row VALUES for INSERT executemany,
+# execute_batch for UPDATE/DELETE executemany.
+engine = create_engine(
+    settings.database_url,
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
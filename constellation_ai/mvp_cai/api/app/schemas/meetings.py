@@ -24,6 +24,32 @@ class AttendeeInput(BaseModel):
         return normalize_empty_string(v)
 
 
+def _to_attendee_input(item) -> AttendeeInput:
+    """Coerce a dict, AttendeeInput, or bare UUID into an AttendeeInput."""
+    if isinstance(item, dict):
+        return AttendeeInput(**item)
+    if isinstance(item, AttendeeInput):
+        return item
+    if isinstance(item, (str, uuid.UUID)):
+        # Just a UUID, no role
+        person_id = uuid.UUID(str(item)) if isinstance(item, str) else item
+        return AttendeeInput(person_id=person_id)
+    raise ValueError(f"Invalid attendee format: {item}")
+
+
+def dedupe_attendees(items: list) -> list[AttendeeInput]:
+    """
+    Normalize attendees and deduplicate by person_id.
+
+    Keeps the first occurrence of each person_id, in input order.
+    """
+    unique: dict[uuid.UUID, AttendeeInput] = {}
+    for item in items:
+        attendee = _to_attendee_input(item)
+        unique.setdefault(attendee.person_id, attendee)
+    return list(unique.values())
+
+
 class MeetingAttendeeRead(BaseModel):
     """Schema for reading attendee info in meeting responses."""
 
@@ -78,26 +104,7 @@ class MeetingCreate(MeetingBase):
         if v is None:
             return None
 
-        seen: set[uuid.UUID] = set()
-        normalized: list[AttendeeInput] = []
-
-        for item in v:
-            if isinstance(item, dict):
-                attendee = AttendeeInput(**item)
-            elif isinstance(item, AttendeeInput):
-                attendee = item
-            elif isinstance(item, (str, uuid.UUID)):
-                # Just a UUID, no role
-                person_id = uuid.UUID(str(item)) if isinstance(item, str) else item
-                attendee = AttendeeInput(person_id=person_id)
-            else:
-                raise ValueError(f"Invalid attendee format: {item}")
-
-            # Deduplicate by person_id
-            if attendee.person_id not in seen:
-                seen.add(attendee.person_id)
-                normalized.append(attendee)
-
+        normalized = dedupe_attendees(v)
         return normalized if normalized else None
 
 
@@ -124,26 +131,8 @@ class MeetingUpdate(MeetingBase):
         if v is None:
             return None
 
-        seen: set[uuid.UUID] = set()
-        normalized: list[AttendeeInput] = []
-
-        for item in v:
-            if isinstance(item, dict):
-                attendee = AttendeeInput(**item)
-            elif isinstance(item, AttendeeInput):
-                attendee = item
-            elif isinstance(item, (str, uuid.UUID)):
-                person_id = uuid.UUID(str(item)) if isinstance(item, str) else item
-                attendee = AttendeeInput(person_id=person_id)
-            else:
-                raise ValueError(f"Invalid attendee format: {item}")
-
-            if attendee.person_id not in seen:
-                seen.add(attendee.person_id)
-                normalized.append(attendee)
-
         # Return the list as-is (even if empty) to allow clearing attendees
-        return normalized
+        return dedupe_attendees(v)
 
 
 class MeetingRead(BaseModel):
@@ -309,21 +309,27 @@ class MeetingsService:
         """
         Validate that all person IDs exist.
 
+        Issues a single ``SELECT id FROM people WHERE id IN (...)`` and
+        reports every missing id at once.
+
         Raises:
             InvalidAttendeeError: If any person_id doesn't exist.
         """
         if not person_ids:
             return
 
-        unique_ids = list(set(person_ids))
-        existing = (
-            self.db.query(Person.id).filter(Person.id.in_(unique_ids)).all()
-        )
-        existing_ids = {p.id for p in existing}
-
-        missing = [pid for pid in unique_ids if pid not in existing_ids]
-        if missing:
-            raise InvalidAttendeeError(missing)
+        requested = set(person_ids)
+        existing_ids = {
+            pid
+            for (pid,) in self.db.query(Person.id).filter(Person.id.in_(requested))
+        }
+
+        missing_ids = requested - existing_ids
+        if missing_ids:
+            # Report in request order for a stable error message
+            raise InvalidAttendeeError(
+                [pid for pid in dict.fromkeys(person_ids) if pid in missing_ids]
+            )
 
     def _load_meeting_with_attendees(self, meeting_id: uuid.UUID) -> Optional[Meeting]:
         """Load a meeting with its attendees eagerly loaded."""
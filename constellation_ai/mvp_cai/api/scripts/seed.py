@@ -4,37 +4,44 @@ Seed script to populate the database with sample People and Meetings data.
 
 Usage:
     python -m scripts.seed
+    python -m scripts.seed --people 100000 --meetings 50000
 
 Idempotency:
     This script checks for existing data by email before inserting.
     Running multiple times will skip existing records and only add missing ones.
+
+Scale data:
+    --people/--meetings generate additional synthetic rows for performance
+    testing. Rows are streamed through multi-row INSERTs in chunks of
+    BATCH_SIZE and never materialized in full. Generated ids are derived
+    from the row index, so re-running with the same counts is a no-op.
 """
+import argparse
+import random
 import sys
+import uuid
 from datetime import datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from app.database import SessionLocal, engine
 from app.models import Base, Meeting, MeetingAttendee, Person
 
+# Rows per INSERT statement. Larger batches plateau on Postgres.
+BATCH_SIZE = 1000
+# Commit after this many batches to bound transaction size.
+COMMIT_EVERY = 10
 
-def get_or_create_person(db: Session, email: str, **kwargs) -> tuple[Person, bool]:
-    """
-    Get existing person by email or create new one.
-    Returns (person, created) tuple.
-    """
-    existing = db.query(Person).filter(Person.primary_email == email).first()
-    if existing:
-        return existing, False
-
-    person = Person(primary_email=email, **kwargs)
-    db.add(person)
-    db.flush()
-    return person, True
+GENERATED_NAMESPACE = uuid.UUID("6f1c2b1e-3d4a-4c55-9a8e-2f7d0b9c1e42")
+GENERATED_TAGS = ["enterprise", "investor", "partner", "finance", "saas", "community"]
+GENERATED_MEETING_TYPES = ["coffee", "call", "zoom", "in-person"]
 
 
 def seed_people(db: Session) -> list[Person]:
@@ -87,12 +94,29 @@ def seed_people(db: Session) -> list[Person]:
         },
     ]
 
+    # One SELECT for every sample email, then one INSERT ... RETURNING for
+    # the missing ones.
+    all_emails = [d["primary_email"] for d in people_data]
+    existing = {
+        p.primary_email: p
+        for p in db.query(Person).filter(Person.primary_email.in_(all_emails))
+    }
+
+    new_rows = [d for d in people_data if d["primary_email"] not in existing]
+    created = {}
+    if new_rows:
+        created = {
+            p.primary_email: p
+            for p in db.scalars(
+                insert(Person).returning(Person, sort_by_parameter_order=True),
+                new_rows,
+            )
+        }
+
     people = []
-    for data in people_data:
-        person, created = get_or_create_person(db, data["primary_email"], **{
-            k: v for k, v in data.items() if k != "primary_email"
-        })
-        status = "created" if created else "exists"
+    for email in all_emails:
+        person = existing.get(email) or created[email]
+        status = "exists" if email in existing else "created"
         print(f"  [{status}] {person.first_name} {person.last_name}")
         people.append(person)
 
@@ -145,7 +169,9 @@ def seed_meetings(db: Session, people: list[Person]) -> list[Meeting]:
         },
     ]
 
-    meetings = []
+    meetings: list[Meeting] = []
+    new_rows: list[dict] = []
+    new_attendees: list[list[dict]] = []
     for data in meetings_data:
         # Check if a meeting with same type and occurred_at exists
         existing = db.query(Meeting).filter(
@@ -158,19 +184,32 @@ def seed_meetings(db: Session, people: list[Person]) -> list[Meeting]:
             meetings.append(existing)
             continue
 
-        attendees_data = data.pop("attendees")
-        meeting = Meeting(**data)
-        db.add(meeting)
-        db.flush()
+        new_attendees.append(data.pop("attendees"))
+        new_rows.append(data)
 
-        for attendee_info in attendees_data:
-            attendee = MeetingAttendee(
-                meeting_id=meeting.id,
-                person_id=attendee_info["person"].id,
-                role=attendee_info["role"],
-            )
-            db.add(attendee)
+    if not new_rows:
+        return meetings
+
+    # One INSERT ... RETURNING for all meetings, then one INSERT for all
+    # attendees, instead of a flush per meeting to learn its id.
+    created = db.scalars(
+        insert(Meeting).returning(Meeting, sort_by_parameter_order=True),
+        new_rows,
+    ).all()
+
+    attendee_rows = [
+        {
+            "meeting_id": meeting.id,
+            "person_id": attendee_info["person"].id,
+            "role": attendee_info["role"],
+        }
+        for meeting, attendees_data in zip(created, new_attendees)
+        for attendee_info in attendees_data
+    ]
+    if attendee_rows:
+        db.execute(insert(MeetingAttendee), attendee_rows)
 
+    for meeting, attendees_data in zip(created, new_attendees):
         print(f"  [created] {meeting.type} on {meeting.occurred_at.date()} "
               f"with {len(attendees_data)} attendee(s)")
         meetings.append(meeting)
@@ -178,8 +217,113 @@ def seed_meetings(db: Session, people: list[Person]) -> list[Meeting]:
     return meetings
 
 
-def main():
+def _chunked(iterable: Iterable[dict], n: int) -> Iterator[list[dict]]:
+    """Yield successive lists of at most n items without materializing the input."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, n)):
+        yield chunk
+
+
+def _generated_id(kind: str, index: int) -> uuid.UUID:
+    """Deterministic id for the index-th generated row of a given kind."""
+    return uuid.uuid5(GENERATED_NAMESPACE, f"{kind}-{index}")
+
+
+def _generate_people(count: int, rng: random.Random) -> Iterator[dict]:
+    for i in range(count):
+        yield {
+            "id": _generated_id("person", i),
+            "first_name": f"Person{i}",
+            "last_name": f"Generated{i % 1000}",
+            "primary_email": f"person{i}@seed.example.com",
+            "employer": f"Company {i % 500}",
+            "title": None,
+            "notes": None,
+            "tags": rng.sample(GENERATED_TAGS, k=rng.randint(0, 3)),
+        }
+
+
+def _generate_meetings(count: int, rng: random.Random) -> Iterator[dict]:
+    now = datetime.now(timezone.utc)
+    for i in range(count):
+        yield {
+            "id": _generated_id("meeting", i),
+            "occurred_at": now - timedelta(minutes=rng.randint(0, 365 * 24 * 60)),
+            "type": rng.choice(GENERATED_MEETING_TYPES),
+            "location": None,
+            "agenda": None,
+            "notes": None,
+            "next_steps": None,
+        }
+
+
+def _generate_attendees(
+    meeting_count: int, people_count: int, rng: random.Random
+) -> Iterator[dict]:
+    for i in range(meeting_count):
+        meeting_id = _generated_id("meeting", i)
+        for person_index in rng.sample(
+            range(people_count), k=min(people_count, rng.randint(1, 3))
+        ):
+            yield {
+                "id": uuid.uuid4(),
+                "meeting_id": meeting_id,
+                "person_id": _generated_id("person", person_index),
+                "role": None,
+            }
+
+
+def _bulk_insert(db: Session, model, rows: Iterable[dict], label: str) -> None:
+    """Stream rows into model's table in BATCH_SIZE chunks, skipping conflicts."""
+    stmt = insert(model).on_conflict_do_nothing()
+    total = 0
+    for batch_number, chunk in enumerate(_chunked(rows, BATCH_SIZE), start=1):
+        db.execute(stmt, chunk)
+        total += len(chunk)
+        if batch_number % COMMIT_EVERY == 0:
+            db.commit()
+            print(f"  ... {total} {label}")
+    db.commit()
+    print(f"  [done] {total} {label}")
+
+
+def seed_generated(db: Session, people_count: int, meeting_count: int) -> None:
+    """Insert synthetic people and meetings for performance testing."""
+    if meeting_count and not people_count:
+        raise ValueError("--meetings requires --people to pick attendees from")
+
+    rng = random.Random(42)
+    _bulk_insert(db, Person, _generate_people(people_count, rng), "people")
+    _bulk_insert(db, Meeting, _generate_meetings(meeting_count, rng), "meetings")
+    _bulk_insert(
+        db,
+        MeetingAttendee,
+        _generate_attendees(meeting_count, people_count, rng),
+        "attendees",
+    )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--people",
+        type=int,
+        default=0,
+        help="Number of synthetic people to generate (default: 0)",
+    )
+    parser.add_argument(
+        "--meetings",
+        type=int,
+        default=0,
+        help="Number of synthetic meetings to generate (default: 0)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
     """Run the seed script."""
+    args = parse_args(argv)
+
     print("=" * 50)
     print("CRM Database Seed Script")
     print("=" * 50)
@@ -196,6 +340,11 @@ def main():
         seed_meetings(db, people)
 
         db.commit()
+
+        if args.people or args.meetings:
+            print(f"\nGenerating {args.people} people and {args.meetings} meetings...")
+            seed_generated(db, args.people, args.meetings)
+
         print("\n" + "=" * 50)
         print("Seed completed successfully!")
         print("=" * 50)
@@ -1,18 +1,27 @@
 """
 Pytest configuration and fixtures for API tests.
 
-Uses transactional rollback for test isolation - each test runs in a
-transaction that is rolled back after the test completes.
+The engine and schema are built once per session. Tests use transactional
+rollback for isolation - each test class runs in a transaction that is rolled
+back when the class completes, and each test runs in a SAVEPOINT inside it
+that is rolled back after the test.
 """
 import os
+from pathlib import Path
 
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from alembic import command
+from alembic.config import Config
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.database import Base, get_db
 from app.main import app
+from app.models import Person
+from app.schemas.people import PersonRead
 
 # Use test database URL from environment or default
 # Inside Docker, the host is 'db'; locally it would be 'localhost'
@@ -21,51 +30,233 @@ TEST_DATABASE_URL = os.getenv(
     "postgresql://crm_user:crm_password@db:5432/crm_db_test",
 )
 
-engine = create_engine(TEST_DATABASE_URL)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Under pytest-xdist each worker gets its own database (crm_db_test_gw0, ...)
+# so workers never contend on rows, unique indexes, or migrations.
+WORKER_ID = os.getenv("PYTEST_XDIST_WORKER", "master")
+
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+
+def _worker_database_url() -> URL:
+    url = make_url(TEST_DATABASE_URL)
+    if WORKER_ID == "master":
+        return url
+    return url.set(database=f"{url.database}_{WORKER_ID}")
+
+
+def _ensure_database(url: URL) -> None:
+    """Create the test database if it doesn't exist yet."""
+    admin_engine = create_engine(
+        url.set(database="postgres"), isolation_level="AUTOCOMMIT", poolclass=NullPool
+    )
+    with admin_engine.connect() as connection:
+        exists = connection.execute(
+            text("SELECT 1 FROM pg_database WHERE datname = :name"),
+            {"name": url.database},
+        ).scalar()
+        if not exists:
+            connection.execute(text(f'CREATE DATABASE "{url.database}"'))
+    admin_engine.dispose()
+
+
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+
+def _tune_test_connection(dbapi_connection, connection_record) -> None:
+    """
+    Drop durability guarantees the throwaway test database doesn't need.
+
+    - synchronous_commit=off: commits don't wait for the WAL to reach disk.
+    - jit=off: JIT compilation only adds latency to tiny test queries.
+    """
+    autocommit = dbapi_connection.autocommit
+    dbapi_connection.autocommit = True
+    with dbapi_connection.cursor() as cursor:
+        cursor.execute("SET synchronous_commit TO OFF")
+        cursor.execute("SET jit TO OFF")
+    dbapi_connection.autocommit = autocommit
+
+
+def _run_alembic_upgrade(engine) -> None:
+    """Bring the test database to the latest migration (no-op if already there)."""
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "alembic"))
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
 
 
 @pytest.fixture(scope="session", autouse=True)
-def setup_database():
-    """Create all tables at the start of the test session."""
-    Base.metadata.create_all(bind=engine)
-    yield
-    Base.metadata.drop_all(bind=engine)
+def engine():
+    """
+    Create the test engine and schema once per test session (per worker).
 
+    The schema is migrated once and kept between runs; at the end of the
+    session the tables are emptied with TRUNCATE, which avoids the catalog
+    churn of dropping and recreating every table.
+    """
+    database_url = _worker_database_url()
+    _ensure_database(database_url)
 
-@pytest.fixture
-def db():
+    # NullPool: connections are opened per test class and closed afterwards,
+    # so no pooled connection outlives the process or leaks into forked workers.
+    engine = create_engine(
+        database_url,
+        poolclass=NullPool,
+        executemany_mode="values_plus_batch",
+        insertmanyvalues_page_size=1000,
+        executemany_batch_page_size=500,
+    )
+    event.listen(engine, "connect", _tune_test_connection)
+    _run_alembic_upgrade(engine)
+
+    yield engine
+
+    table_names = ", ".join(t.name for t in Base.metadata.sorted_tables)
+    with engine.begin() as connection:
+        connection.execute(text(f"TRUNCATE {table_names} RESTART IDENTITY CASCADE"))
+    engine.dispose()
+
+
+@pytest.fixture(scope="class")
+def connection(engine):
     """
-    Provide a transactional database session for each test.
+    Provide a connection with an outer transaction per test class.
 
-    Rolls back all changes after each test for isolation.
+    Class-scoped fixtures insert through this connection so their rows are
+    shared by every test in the class, then discarded at class teardown.
     """
     connection = engine.connect()
     transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
 
-    yield session
+    yield connection
 
-    session.close()
     transaction.rollback()
     connection.close()
 
 
-@pytest.fixture
-def client(db):
-    """
-    Provide a TestClient with the test database session.
-    """
+def _session_for(connection):
+    """Bind a session that commits into SAVEPOINTs instead of the real transaction."""
+    return TestingSessionLocal(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
+
 
+def _override_get_db(session):
     def override_get_db():
         try:
-            yield db
+            yield session
         finally:
             pass
 
-    app.dependency_overrides[get_db] = override_get_db
+    return override_get_db
+
+
+@pytest.fixture(scope="session")
+async def asgi_client():
+    """
+    One client for the whole session, dispatching straight into the ASGI app.
 
-    with TestClient(app) as test_client:
+    The app is imported once; per-test fixtures only swap the get_db
+    override instead of building a new client and transport.
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as test_client:
         yield test_client
 
+
+@pytest.fixture(scope="class")
+def class_db(connection):
+    """
+    Provide a session for building class-scoped sample data.
+
+    Writes land in the class-level transaction, so they are visible to
+    every test in the class and rolled back once the class finishes.
+    """
+    session = _session_for(connection)
+
+    yield session
+
+    session.close()
+
+
+@pytest.fixture(scope="class")
+def class_client(class_db, asgi_client):
+    """
+    Provide a client for building class-scoped sample data through the API.
+    """
+    app.dependency_overrides[get_db] = _override_get_db(class_db)
+
+    yield asgi_client
+
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def db(connection):
+    """
+    Provide a transactional database session for each test.
+
+    Each test runs inside a SAVEPOINT on the class connection which is
+    rolled back afterwards, so tests never see each other's changes.
+    """
+    savepoint = connection.begin_nested()
+    session = _session_for(connection)
+
+    yield session
+
+    session.close()
+    savepoint.rollback()
+
+
+class _NoDatabase:
+    """Stand-in session for no_db tests; any use of it is a test bug."""
+
+    def __getattr__(self, name):
+        raise RuntimeError(f"Test marked no_db used the database (Session.{name})")
+
+
+def _no_db():
+    # FastAPI resolves dependencies before reporting validation errors, so
+    # this must be injectable; it only fails once something touches it.
+    yield _NoDatabase()
+
+
+@pytest.fixture
+def client(request, asgi_client):
+    """
+    Provide the shared async client wired to the test database session.
+
+    Tests marked ``no_db`` (pure request-validation checks) skip the
+    connection/SAVEPOINT setup entirely; any attempt to reach the database
+    from such a test fails loudly.
+    """
+    if request.node.get_closest_marker("no_db"):
+        app.dependency_overrides[get_db] = _no_db
+    else:
+        db = request.getfixturevalue("db")
+        app.dependency_overrides[get_db] = _override_get_db(db)
+
+    yield asgi_client
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def person_factory(db):
+    """
+    Insert people straight through the ORM, bypassing HTTP.
+
+    For tests that only need an existing person to act on. Returns a dict
+    shaped like the API response; tests of POST /people itself should keep
+    going through the client.
+    """
+
+    def make_person(first_name: str = "John", last_name: str = "Doe", **fields) -> dict:
+        person = Person(first_name=first_name, last_name=last_name, **fields)
+        db.add(person)
+        db.flush()
+        return PersonRead.model_validate(person).model_dump(mode="json")
+
+    return make_person
@@ -14,23 +14,26 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
+# Share one event loop between tests and the class-scoped async fixtures.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
 
 class TestCreateMeeting:
     """Tests for POST /meetings."""
 
     @pytest.fixture
-    def sample_people(self, client):
+    async def sample_people(self, client):
         """Create sample people for meeting tests."""
         people = []
         for i, name in enumerate(["Alice", "Bob", "Charlie"]):
-            response = client.post(
+            response = await client.post(
                 "/people",
                 json={"first_name": name, "last_name": "Test", "primary_email": f"{name.lower()}@test.com"},
             )
             people.append(response.json())
         return people
 
-    def test_create_meeting_no_attendees(self, client):
+    async def test_create_meeting_no_attendees(self, client):
         """Create a meeting with no attendees."""
         payload = {
             "occurred_at": "2025-01-15T10:00:00Z",
@@ -39,7 +42,7 @@ class TestCreateMeeting:
             "notes": "Initial discussion",
         }
 
-        response = client.post("/meetings", json=payload)
+        response = await client.post("/meetings", json=payload)
 
         assert response.status_code == 201
         data = response.json()
@@ -50,7 +53,7 @@ class TestCreateMeeting:
         assert "id" in data
         assert "created_at" in data
 
-    def test_create_meeting_with_attendees(self, client, sample_people):
+    async def test_create_meeting_with_attendees(self, client, sample_people):
         """Create a meeting with attendees and verify join rows."""
         alice_id = sample_people[0]["id"]
         bob_id = sample_people[1]["id"]
@@ -64,7 +67,7 @@ class TestCreateMeeting:
             ],
         }
 
-        response = client.post("/meetings", json=payload)
+        response = await client.post("/meetings", json=payload)
 
         assert response.status_code == 201
         data = response.json()
@@ -75,7 +78,7 @@ class TestCreateMeeting:
         assert attendee_map[alice_id]["first_name"] == "Alice"
         assert attendee_map[bob_id]["role"] == "attendee"
 
-    def test_create_meeting_attendees_as_uuid_list(self, client, sample_people):
+    async def test_create_meeting_attendees_as_uuid_list(self, client, sample_people):
         """Create meeting with attendees as simple UUID list (no roles)."""
         alice_id = sample_people[0]["id"]
         bob_id = sample_people[1]["id"]
@@ -86,7 +89,7 @@ class TestCreateMeeting:
             "attendees": [alice_id, bob_id],
         }
 
-        response = client.post("/meetings", json=payload)
+        response = await client.post("/meetings", json=payload)
 
         assert response.status_code == 201
         data = response.json()
@@ -95,7 +98,7 @@ class TestCreateMeeting:
         for attendee in data["attendees"]:
             assert attendee["role"] is None
 
-    def test_create_meeting_deduplicates_attendees(self, client, sample_people):
+    async def test_create_meeting_deduplicates_attendees(self, client, sample_people):
         """Duplicate attendee IDs should be deduplicated."""
         alice_id = sample_people[0]["id"]
 
@@ -105,13 +108,13 @@ class TestCreateMeeting:
             "attendees": [alice_id, alice_id, alice_id],
         }
 
-        response = client.post("/meetings", json=payload)
+        response = await client.post("/meetings", json=payload)
 
         assert response.status_code == 201
         data = response.json()
         assert len(data["attendees"]) == 1
 
-    def test_create_meeting_invalid_attendee_id(self, client, sample_people):
+    async def test_create_meeting_invalid_attendee_id(self, client, sample_people):
         """Return 422 when attendee person_id doesn't exist."""
         fake_id = str(uuid.uuid4())
 
@@ -121,12 +124,12 @@ class TestCreateMeeting:
             "attendees": [sample_people[0]["id"], fake_id],
         }
 
-        response = client.post("/meetings", json=payload)
+        response = await client.post("/meetings", json=payload)
 
         assert response.status_code == 422
         assert fake_id in response.json()["detail"]
 
-    def test_create_meeting_empty_strings_normalized(self, client):
+    async def test_create_meeting_empty_strings_normalized(self, client):
         """Empty strings should be normalized to null."""
         payload = {
             "occurred_at": "2025-01-15T10:00:00Z",
@@ -135,7 +138,7 @@ class TestCreateMeeting:
             "notes": "   ",
         }
 
-        response = client.post("/meetings", json=payload)
+        response = await client.post("/meetings", json=payload)
 
         assert response.status_code == 201
         data = response.json()
@@ -147,21 +150,21 @@ class TestGetMeeting:
     """Tests for GET /meetings/{id}."""
 
     @pytest.fixture
-    def sample_people(self, client):
+    async def sample_people(self, client):
         """Create sample people."""
         people = []
         for name in ["Alice", "Bob"]:
-            response = client.post(
+            response = await client.post(
                 "/people",
                 json={"first_name": name, "last_name": "Test"},
             )
             people.append(response.json())
         return people
 
-    def test_get_meeting_with_attendees(self, client, sample_people):
+    async def test_get_meeting_with_attendees(self, client, sample_people):
         """Get a meeting and verify attendees are included."""
         # Create meeting with attendees
-        create_response = client.post(
+        create_response = await client.post(
             "/meetings",
             json={
                 "occurred_at": "2025-01-15T14:00:00Z",
@@ -174,7 +177,7 @@ class TestGetMeeting:
         )
         meeting_id = create_response.json()["id"]
 
-        response = client.get(f"/meetings/{meeting_id}")
+        response = await client.get(f"/meetings/{meeting_id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -183,11 +186,11 @@ class TestGetMeeting:
         # Verify attendee info includes person details
         assert any(a["first_name"] == "Alice" for a in data["attendees"])
 
-    def test_get_meeting_not_found(self, client):
+    async def test_get_meeting_not_found(self, client):
         """Return 404 for non-existent meeting."""
         fake_id = str(uuid.uuid4())
 
-        response = client.get(f"/meetings/{fake_id}")
+        response = await client.get(f"/meetings/{fake_id}")
 
         assert response.status_code == 404
 
@@ -195,13 +198,19 @@ class TestGetMeeting:
 class TestListMeetings:
     """Tests for GET /meetings."""
 
-    @pytest.fixture
-    def sample_data(self, client):
-        """Create sample people and meetings for list tests."""
+    @pytest.fixture(scope="class")
+    async def sample_data(self, class_client):
+        """
+        Create sample people and meetings for list tests.
+
+        Class-scoped: every test here is read-only, so the rows are inserted
+        once and shared across the class.
+        """
+        client = class_client
         # Create people
         people = []
         for name in ["Alice", "Bob", "Charlie"]:
-            response = client.post(
+            response = await client.post(
                 "/people",
                 json={"first_name": name, "last_name": "Test"},
             )
@@ -218,12 +227,16 @@ class TestListMeetings:
             {"days_ago": 1, "type": "in-person", "attendees": [people[0]["id"], people[2]["id"]]},
         ]
 
+        iso_times = {
+            md["days_ago"]: (now - timedelta(days=md["days_ago"])).isoformat()
+            for md in meeting_data
+        }
+
         for md in meeting_data:
-            occurred_at = (now - timedelta(days=md["days_ago"])).isoformat()
-            response = client.post(
+            response = await client.post(
                 "/meetings",
                 json={
-                    "occurred_at": occurred_at,
+                    "occurred_at": iso_times[md["days_ago"]],
                     "type": md["type"],
                     "attendees": md["attendees"],
                 },
@@ -232,9 +245,9 @@ class TestListMeetings:
 
         return {"people": people, "meetings": meetings, "now": now}
 
-    def test_list_meetings_unfiltered(self, client, sample_data):
+    async def test_list_meetings_unfiltered(self, client, sample_data):
         """List all meetings, ordered by occurred_at DESC."""
-        response = client.get("/meetings")
+        response = await client.get("/meetings")
 
         assert response.status_code == 200
         data = response.json()
@@ -245,11 +258,11 @@ class TestListMeetings:
         dates = [item["occurred_at"] for item in data["items"]]
         assert dates == sorted(dates, reverse=True)
 
-    def test_list_meetings_by_person_id(self, client, sample_data):
+    async def test_list_meetings_by_person_id(self, client, sample_data):
         """Filter meetings by person_id (attendee)."""
         alice_id = sample_data["people"][0]["id"]
 
-        response = client.get("/meetings", params={"person_id": alice_id})
+        response = await client.get("/meetings", params={"person_id": alice_id})
 
         assert response.status_code == 200
         data = response.json()
@@ -261,46 +274,46 @@ class TestListMeetings:
             attendee_ids = [a["person_id"] for a in meeting["attendees"]]
             assert alice_id in attendee_ids
 
-    def test_list_meetings_from_date(self, client, sample_data):
+    async def test_list_meetings_from_date(self, client, sample_data):
         """Filter meetings with occurred_at >= from date."""
         now = sample_data["now"]
         from_date = (now - timedelta(days=10)).isoformat()
 
-        response = client.get("/meetings", params={"from": from_date})
+        response = await client.get("/meetings", params={"from": from_date})
 
         assert response.status_code == 200
         data = response.json()
         # Meetings from 7 days ago and 1 day ago
         assert data["total"] == 2
 
-    def test_list_meetings_to_date(self, client, sample_data):
+    async def test_list_meetings_to_date(self, client, sample_data):
         """Filter meetings with occurred_at <= to date."""
         now = sample_data["now"]
         to_date = (now - timedelta(days=10)).isoformat()
 
-        response = client.get("/meetings", params={"to": to_date})
+        response = await client.get("/meetings", params={"to": to_date})
 
         assert response.status_code == 200
         data = response.json()
         # Meetings from 30 days ago and 14 days ago
         assert data["total"] == 2
 
-    def test_list_meetings_date_range(self, client, sample_data):
+    async def test_list_meetings_date_range(self, client, sample_data):
         """Filter meetings within a date range (from and to)."""
         now = sample_data["now"]
         from_date = (now - timedelta(days=20)).isoformat()
         to_date = (now - timedelta(days=5)).isoformat()
 
-        response = client.get("/meetings", params={"from": from_date, "to": to_date})
+        response = await client.get("/meetings", params={"from": from_date, "to": to_date})
 
         assert response.status_code == 200
         data = response.json()
         # Meetings from 14 days ago and 7 days ago
         assert data["total"] == 2
 
-    def test_list_meetings_pagination(self, client, sample_data):
+    async def test_list_meetings_pagination(self, client, sample_data):
         """Test limit and offset pagination."""
-        response = client.get("/meetings", params={"limit": 2, "offset": 1})
+        response = await client.get("/meetings", params={"limit": 2, "offset": 1})
 
         assert response.status_code == 200
         data = response.json()
@@ -309,13 +322,13 @@ class TestListMeetings:
         assert data["limit"] == 2
         assert data["offset"] == 1
 
-    def test_list_meetings_combined_filters(self, client, sample_data):
+    async def test_list_meetings_combined_filters(self, client, sample_data):
         """Combine person_id and date filters."""
         alice_id = sample_data["people"][0]["id"]
         now = sample_data["now"]
         from_date = (now - timedelta(days=20)).isoformat()
 
-        response = client.get(
+        response = await client.get(
             "/meetings",
             params={"person_id": alice_id, "from": from_date},
         )
@@ -330,11 +343,11 @@ class TestUpdateMeeting:
     """Tests for PATCH /meetings/{id}."""
 
     @pytest.fixture
-    def sample_people(self, client):
+    async def sample_people(self, client):
         """Create sample people."""
         people = []
         for name in ["Alice", "Bob", "Charlie"]:
-            response = client.post(
+            response = await client.post(
                 "/people",
                 json={"first_name": name, "last_name": "Test"},
             )
@@ -342,9 +355,9 @@ class TestUpdateMeeting:
         return people
 
     @pytest.fixture
-    def sample_meeting(self, client, sample_people):
+    async def sample_meeting(self, client, sample_people):
         """Create a sample meeting with attendees."""
-        response = client.post(
+        response = await client.post(
             "/meetings",
             json={
                 "occurred_at": "2025-01-15T14:00:00Z",
@@ -358,11 +371,11 @@ class TestUpdateMeeting:
         )
         return response.json()
 
-    def test_update_meeting_text_fields(self, client, sample_meeting):
+    async def test_update_meeting_text_fields(self, client, sample_meeting):
         """Update only text fields, attendees unchanged."""
         meeting_id = sample_meeting["id"]
 
-        response = client.patch(
+        response = await client.patch(
             f"/meetings/{meeting_id}",
             json={
                 "notes": "Great conversation!",
@@ -379,12 +392,12 @@ class TestUpdateMeeting:
         # Original fields unchanged
         assert data["location"] == "Starbucks"
 
-    def test_update_meeting_replace_attendees(self, client, sample_meeting, sample_people):
+    async def test_update_meeting_replace_attendees(self, client, sample_meeting, sample_people):
         """Replace attendees entirely."""
         meeting_id = sample_meeting["id"]
         charlie_id = sample_people[2]["id"]
 
-        response = client.patch(
+        response = await client.patch(
             f"/meetings/{meeting_id}",
             json={
                 "attendees": [{"person_id": charlie_id, "role": "solo"}],
@@ -398,11 +411,11 @@ class TestUpdateMeeting:
         assert data["attendees"][0]["role"] == "solo"
         assert data["attendees"][0]["first_name"] == "Charlie"
 
-    def test_update_meeting_clear_attendees(self, client, sample_meeting):
+    async def test_update_meeting_clear_attendees(self, client, sample_meeting):
         """Clear all attendees by passing empty array."""
         meeting_id = sample_meeting["id"]
 
-        response = client.patch(
+        response = await client.patch(
             f"/meetings/{meeting_id}",
             json={"attendees": []},
         )
@@ -411,23 +424,23 @@ class TestUpdateMeeting:
         data = response.json()
         assert len(data["attendees"]) == 0
 
-    def test_update_meeting_invalid_attendee_id(self, client, sample_meeting):
+    async def test_update_meeting_invalid_attendee_id(self, client, sample_meeting):
         """Return 422 when new attendee ID doesn't exist."""
         meeting_id = sample_meeting["id"]
         fake_id = str(uuid.uuid4())
 
-        response = client.patch(
+        response = await client.patch(
             f"/meetings/{meeting_id}",
             json={"attendees": [fake_id]},
         )
 
         assert response.status_code == 422
 
-    def test_update_meeting_not_found(self, client):
+    async def test_update_meeting_not_found(self, client):
         """Return 404 for non-existent meeting."""
         fake_id = str(uuid.uuid4())
 
-        response = client.patch(f"/meetings/{fake_id}", json={"notes": "test"})
+        response = await client.patch(f"/meetings/{fake_id}", json={"notes": "test"})
 
         assert response.status_code == 404
 
@@ -435,28 +448,28 @@ class TestUpdateMeeting:
 class TestDeleteMeeting:
     """Tests for DELETE /meetings/{id}."""
 
-    def test_delete_meeting(self, client):
+    async def test_delete_meeting(self, client):
         """Delete a meeting."""
         # Create a meeting
-        create_response = client.post(
+        create_response = await client.post(
             "/meetings",
             json={"occurred_at": "2025-01-15T14:00:00Z", "type": "test"},
         )
         meeting_id = create_response.json()["id"]
 
-        response = client.delete(f"/meetings/{meeting_id}")
+        response = await client.delete(f"/meetings/{meeting_id}")
 
         assert response.status_code == 204
 
         # Verify deleted
-        get_response = client.get(f"/meetings/{meeting_id}")
+        get_response = await client.get(f"/meetings/{meeting_id}")
         assert get_response.status_code == 404
 
-    def test_delete_meeting_not_found(self, client):
+    async def test_delete_meeting_not_found(self, client):
         """Return 404 for deleting non-existent meeting."""
         fake_id = str(uuid.uuid4())
 
-        response = client.delete(f"/meetings/{fake_id}")
+        response = await client.delete(f"/meetings/{fake_id}")
 
         assert response.status_code == 404
 
@@ -465,11 +478,11 @@ class TestAttendeeEndpoints:
     """Tests for POST/DELETE /meetings/{id}/attendees endpoints."""
 
     @pytest.fixture
-    def sample_people(self, client):
+    async def sample_people(self, client):
         """Create sample people."""
         people = []
         for name in ["Alice", "Bob", "Charlie"]:
-            response = client.post(
+            response = await client.post(
                 "/people",
                 json={"first_name": name, "last_name": "Test"},
             )
@@ -477,9 +490,9 @@ class TestAttendeeEndpoints:
         return people
 
     @pytest.fixture
-    def sample_meeting(self, client, sample_people):
+    async def sample_meeting(self, client, sample_people):
         """Create a meeting with one attendee."""
-        response = client.post(
+        response = await client.post(
             "/meetings",
             json={
                 "occurred_at": "2025-01-15T14:00:00Z",
@@ -489,12 +502,12 @@ class TestAttendeeEndpoints:
         )
         return response.json()
 
-    def test_add_attendee(self, client, sample_meeting, sample_people):
+    async def test_add_attendee(self, client, sample_meeting, sample_people):
         """Add a new attendee to a meeting."""
         meeting_id = sample_meeting["id"]
         bob_id = sample_people[1]["id"]
 
-        response = client.post(
+        response = await client.post(
             f"/meetings/{meeting_id}/attendees",
             json={"person_id": bob_id, "role": "guest"},
         )
@@ -505,13 +518,13 @@ class TestAttendeeEndpoints:
         bob_attendee = next(a for a in data["attendees"] if a["person_id"] == bob_id)
         assert bob_attendee["role"] == "guest"
 
-    def test_add_attendee_idempotent(self, client, sample_meeting, sample_people):
+    async def test_add_attendee_idempotent(self, client, sample_meeting, sample_people):
         """Adding existing attendee updates their role (idempotent)."""
         meeting_id = sample_meeting["id"]
         alice_id = sample_people[0]["id"]
 
         # Alice is already an attendee with no role
-        response = client.post(
+        response = await client.post(
             f"/meetings/{meeting_id}/attendees",
             json={"person_id": alice_id, "role": "organizer"},
         )
@@ -523,56 +536,56 @@ class TestAttendeeEndpoints:
         # Role updated
         assert data["attendees"][0]["role"] == "organizer"
 
-    def test_add_attendee_invalid_person_id(self, client, sample_meeting):
+    async def test_add_attendee_invalid_person_id(self, client, sample_meeting):
         """Return 422 for invalid person_id."""
         meeting_id = sample_meeting["id"]
         fake_id = str(uuid.uuid4())
 
-        response = client.post(
+        response = await client.post(
             f"/meetings/{meeting_id}/attendees",
             json={"person_id": fake_id},
         )
 
         assert response.status_code == 422
 
-    def test_add_attendee_meeting_not_found(self, client, sample_people):
+    async def test_add_attendee_meeting_not_found(self, client, sample_people):
         """Return 404 when meeting doesn't exist."""
         fake_meeting_id = str(uuid.uuid4())
 
-        response = client.post(
+        response = await client.post(
             f"/meetings/{fake_meeting_id}/attendees",
             json={"person_id": sample_people[0]["id"]},
         )
 
         assert response.status_code == 404
 
-    def test_remove_attendee(self, client, sample_meeting, sample_people):
+    async def test_remove_attendee(self, client, sample_meeting, sample_people):
         """Remove an attendee from a meeting."""
         meeting_id = sample_meeting["id"]
         alice_id = sample_people[0]["id"]
 
-        response = client.delete(f"/meetings/{meeting_id}/attendees/{alice_id}")
+        response = await client.delete(f"/meetings/{meeting_id}/attendees/{alice_id}")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data["attendees"]) == 0
 
-    def test_remove_attendee_idempotent(self, client, sample_meeting, sample_people):
+    async def test_remove_attendee_idempotent(self, client, sample_meeting, sample_people):
         """Removing non-existent attendee doesn't error (idempotent)."""
         meeting_id = sample_meeting["id"]
         bob_id = sample_people[1]["id"]  # Bob is not an attendee
 
-        response = client.delete(f"/meetings/{meeting_id}/attendees/{bob_id}")
+        response = await client.delete(f"/meetings/{meeting_id}/attendees/{bob_id}")
 
         assert response.status_code == 200
         # Original attendee still there
         assert len(response.json()["attendees"]) == 1
 
-    def test_remove_attendee_meeting_not_found(self, client, sample_people):
+    async def test_remove_attendee_meeting_not_found(self, client, sample_people):
         """Return 404 when meeting doesn't exist."""
         fake_meeting_id = str(uuid.uuid4())
 
-        response = client.delete(
+        response = await client.delete(
             f"/meetings/{fake_meeting_id}/attendees/{sample_people[0]['id']}"
         )
 
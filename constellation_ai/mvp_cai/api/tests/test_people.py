@@ -11,65 +11,129 @@ Covers:
 - Delete person
 """
 import uuid
+from typing import Final
 
 import pytest
+from sqlalchemy import insert
+
+from app.models import Person
+from app.schemas.people import PersonRead
+from app.services.people import PeopleService
+
+# Share one event loop between tests and the class-scoped async fixtures.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# A well-formed UUID that is never assigned to a row.
+MISSING_ID: Final[str] = "00000000-0000-4000-8000-000000000000"
+
+# Search fixture rows, already in normalized form (lowercase tags, no empty
+# strings) so they can be inserted directly without going through the API.
+SAMPLE_PEOPLE: Final[tuple[dict, ...]] = (
+    {"id": uuid.UUID("00000000-0000-4000-8000-000000000001"), "first_name": "Alice", "last_name": "Anderson", "employer": "Tech Corp", "tags": ["engineering"]},
+    {"id": uuid.UUID("00000000-0000-4000-8000-000000000002"), "first_name": "Bob", "last_name": "Brown", "primary_email": "bob@startup.io", "tags": ["sales"]},
+    {"id": uuid.UUID("00000000-0000-4000-8000-000000000003"), "first_name": "Charlie", "last_name": "Chen", "employer": "Tech Corp", "tags": ["engineering", "vip"]},
+    {"id": uuid.UUID("00000000-0000-4000-8000-000000000004"), "first_name": "Diana", "last_name": "Davis", "employer": "Finance Inc", "tags": ["sales"]},
+    {"id": uuid.UUID("00000000-0000-4000-8000-000000000005"), "first_name": "Eve", "last_name": "Edwards", "primary_email": "eve@tech.com", "tags": ["engineering"]},
+)
 
 
 class TestCreatePerson:
     """Tests for POST /people."""
 
-    def test_create_person_success(self, client):
-        """Successfully create a person with all fields."""
-        payload = {
-            "first_name": "John",
-            "last_name": "Doe",
-            "primary_email": "john.doe@example.com",
-            "employer": "Acme Corp",
-            "title": "Engineer",
-            "notes": "Met at conference",
-            "tags": ["VIP", "engineering"],
-        }
-
-        response = client.post("/people", json=payload)
+    @pytest.mark.parametrize(
+        "payload, expected_status, expected_fields",
+        [
+            pytest.param(
+                {
+                    "first_name": "John",
+                    "last_name": "Doe",
+                    "primary_email": "john.doe@example.com",
+                    "employer": "Acme Corp",
+                    "title": "Engineer",
+                    "notes": "Met at conference",
+                    "tags": ["VIP", "engineering"],
+                },
+                201,
+                {
+                    "first_name": "John",
+                    "last_name": "Doe",
+                    "primary_email": "john.doe@example.com",
+                    "employer": "Acme Corp",
+                    "title": "Engineer",
+                    "notes": "Met at conference",
+                    # Tags should be normalized to lowercase
+                    "tags": ["vip", "engineering"],
+                },
+                id="success",
+            ),
+            pytest.param(
+                {"first_name": "Jane", "last_name": "Smith"},
+                201,
+                {
+                    "first_name": "Jane",
+                    "last_name": "Smith",
+                    "primary_email": None,
+                    "employer": None,
+                },
+                id="minimal",
+            ),
+            pytest.param(
+                {"first_name": "John", "last_name": "Doe", "employer": "", "title": "   "},
+                201,
+                # Empty strings should be normalized to null
+                {"employer": None, "title": None},
+                id="empty_string_normalized",
+            ),
+            pytest.param(
+                {"first_name": "John", "last_name": "Doe", "primary_email": "not-an-email"},
+                422,
+                {},
+                id="invalid_email",
+                marks=pytest.mark.no_db,
+            ),
+            pytest.param(
+                {
+                    "first_name": "John",
+                    "last_name": "Doe",
+                    "tags": ["  VIP  ", "vip", "Engineering", ""],
+                },
+                201,
+                # Tags should be trimmed, lowercased, and deduplicated
+                {"tags": ["vip", "engineering"]},
+                id="tags_normalized",
+            ),
+            pytest.param(
+                {"first_name": "John"},
+                422,
+                {},
+                id="missing_required_fields",
+                marks=pytest.mark.no_db,
+            ),
+        ],
+    )
+    async def test_create_person(self, client, payload, expected_status, expected_fields):
+        """Create a person and check status code and normalized fields."""
+        response = await client.post("/people", json=payload)
+
+        assert response.status_code == expected_status
+        if expected_status != 201:
+            return
 
-        assert response.status_code == 201
         data = response.json()
-        assert data["first_name"] == "John"
-        assert data["last_name"] == "Doe"
-        assert data["primary_email"] == "john.doe@example.com"
-        assert data["employer"] == "Acme Corp"
-        assert data["title"] == "Engineer"
-        assert data["notes"] == "Met at conference"
-        # Tags should be normalized to lowercase
-        assert set(data["tags"]) == {"vip", "engineering"}
+        for field, expected in expected_fields.items():
+            assert data[field] == expected, field
         assert "id" in data
         assert "created_at" in data
         assert "updated_at" in data
 
-    def test_create_person_minimal(self, client):
-        """Create person with only required fields."""
-        payload = {
-            "first_name": "Jane",
-            "last_name": "Smith",
-        }
-
-        response = client.post("/people", json=payload)
-
-        assert response.status_code == 201
-        data = response.json()
-        assert data["first_name"] == "Jane"
-        assert data["last_name"] == "Smith"
-        assert data["primary_email"] is None
-        assert data["employer"] is None
-
-    def test_create_person_duplicate_email(self, client):
+    async def test_create_person_duplicate_email(self, client):
         """Reject duplicate email (case-insensitive)."""
         payload = {
             "first_name": "John",
             "last_name": "Doe",
             "primary_email": "duplicate@example.com",
         }
-        client.post("/people", json=payload)
+        await client.post("/people", json=payload)
 
         # Try to create another person with same email (different case)
         payload2 = {
@@ -78,74 +142,20 @@ class TestCreatePerson:
             "primary_email": "DUPLICATE@example.com",
         }
 
-        response = client.post("/people", json=payload2)
+        response = await client.post("/people", json=payload2)
 
         assert response.status_code == 409
         assert "already exists" in response.json()["detail"]
 
-    def test_create_person_empty_string_normalized(self, client):
-        """Empty strings should be normalized to null."""
-        payload = {
-            "first_name": "John",
-            "last_name": "Doe",
-            "employer": "",
-            "title": "   ",
-        }
-
-        response = client.post("/people", json=payload)
-
-        assert response.status_code == 201
-        data = response.json()
-        assert data["employer"] is None
-        assert data["title"] is None
-
-    def test_create_person_invalid_email(self, client):
-        """Reject invalid email format."""
-        payload = {
-            "first_name": "John",
-            "last_name": "Doe",
-            "primary_email": "not-an-email",
-        }
-
-        response = client.post("/people", json=payload)
-
-        assert response.status_code == 422
-
-    def test_create_person_tags_normalized(self, client):
-        """Tags should be trimmed, lowercased, and deduplicated."""
-        payload = {
-            "first_name": "John",
-            "last_name": "Doe",
-            "tags": ["  VIP  ", "vip", "Engineering", ""],
-        }
-
-        response = client.post("/people", json=payload)
-
-        assert response.status_code == 201
-        data = response.json()
-        # Should be deduplicated and normalized
-        assert set(data["tags"]) == {"vip", "engineering"}
-
-    def test_create_person_missing_required_fields(self, client):
-        """Reject missing required fields."""
-        response = client.post("/people", json={"first_name": "John"})
-
-        assert response.status_code == 422
-
 
 class TestGetPerson:
     """Tests for GET /people/{id}."""
 
-    def test_get_person_success(self, client):
+    async def test_get_person_success(self, client, person_factory):
         """Successfully retrieve a person by ID."""
-        # Create a person first
-        create_response = client.post(
-            "/people",
-            json={"first_name": "John", "last_name": "Doe"},
-        )
-        person_id = create_response.json()["id"]
+        person_id = person_factory(first_name="John", last_name="Doe")["id"]
 
-        response = client.get(f"/people/{person_id}")
+        response = await client.get(f"/people/{person_id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -153,41 +163,36 @@ class TestGetPerson:
         assert data["first_name"] == "John"
         assert data["last_name"] == "Doe"
 
-    def test_get_person_not_found(self, client):
-        """Return 404 for non-existent person."""
-        fake_id = str(uuid.uuid4())
-
-        response = client.get(f"/people/{fake_id}")
+    @pytest.mark.parametrize(
+        "person_id, expected_status",
+        [
+            pytest.param(MISSING_ID, 404, id="not_found"),
+            pytest.param("not-a-uuid", 422, id="invalid_id", marks=pytest.mark.no_db),
+        ],
+    )
+    async def test_get_person_error(self, client, person_id, expected_status):
+        """Return 404 for a non-existent person and 422 for a malformed UUID."""
+        response = await client.get(f"/people/{person_id}")
 
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
-
-    def test_get_person_invalid_id(self, client):
-        """Return 422 for invalid UUID format."""
-        response = client.get("/people/not-a-uuid")
-
-        assert response.status_code == 422
+        assert response.status_code == expected_status
+        if expected_status == 404:
+            assert "not found" in response.json()["detail"].lower()
 
 
 class TestUpdatePerson:
     """Tests for PATCH /people/{id}."""
 
-    def test_update_person_partial(self, client):
+    async def test_update_person_partial(self, client, person_factory):
         """Partial update should only modify provided fields."""
-        # Create a person
-        create_response = client.post(
-            "/people",
-            json={
-                "first_name": "John",
-                "last_name": "Doe",
-                "employer": "Old Corp",
-                "title": "Junior Dev",
-            },
-        )
-        person_id = create_response.json()["id"]
+        person_id = person_factory(
+            first_name="John",
+            last_name="Doe",
+            employer="Old Corp",
+            title="Junior Dev",
+        )["id"]
 
         # Update only employer
-        response = client.patch(
+        response = await client.patch(
             f"/people/{person_id}",
             json={"employer": "New Corp"},
         )
@@ -200,19 +205,11 @@ class TestUpdatePerson:
         assert data["last_name"] == "Doe"
         assert data["title"] == "Junior Dev"
 
-    def test_update_person_email(self, client):
+    async def test_update_person_email(self, client, person_factory):
         """Update email address."""
-        create_response = client.post(
-            "/people",
-            json={
-                "first_name": "John",
-                "last_name": "Doe",
-                "primary_email": "old@example.com",
-            },
-        )
-        person_id = create_response.json()["id"]
+        person_id = person_factory(primary_email="old@example.com")["id"]
 
-        response = client.patch(
+        response = await client.patch(
             f"/people/{person_id}",
             json={"primary_email": "new@example.com"},
         )
@@ -220,44 +217,34 @@ class TestUpdatePerson:
         assert response.status_code == 200
         assert response.json()["primary_email"] == "new@example.com"
 
-    def test_update_person_duplicate_email(self, client):
+    async def test_update_person_duplicate_email(self, client, person_factory):
         """Reject update to duplicate email."""
-        # Create two people
-        client.post(
-            "/people",
-            json={"first_name": "John", "last_name": "Doe", "primary_email": "john@example.com"},
-        )
-        create_response = client.post(
-            "/people",
-            json={"first_name": "Jane", "last_name": "Smith", "primary_email": "jane@example.com"},
-        )
-        jane_id = create_response.json()["id"]
+        person_factory(first_name="John", last_name="Doe", primary_email="john@example.com")
+        jane_id = person_factory(
+            first_name="Jane", last_name="Smith", primary_email="jane@example.com"
+        )["id"]
 
         # Try to update Jane's email to John's
-        response = client.patch(
+        response = await client.patch(
             f"/people/{jane_id}",
             json={"primary_email": "john@example.com"},
         )
 
         assert response.status_code == 409
 
-    def test_update_person_not_found(self, client):
+    async def test_update_person_not_found(self, client):
         """Return 404 for updating non-existent person."""
-        fake_id = str(uuid.uuid4())
+        fake_id = MISSING_ID
 
-        response = client.patch(f"/people/{fake_id}", json={"first_name": "Updated"})
+        response = await client.patch(f"/people/{fake_id}", json={"first_name": "Updated"})
 
         assert response.status_code == 404
 
-    def test_update_person_set_null(self, client):
+    async def test_update_person_set_null(self, client, person_factory):
         """Set optional fields to null explicitly."""
-        create_response = client.post(
-            "/people",
-            json={"first_name": "John", "last_name": "Doe", "employer": "Acme"},
-        )
-        person_id = create_response.json()["id"]
+        person_id = person_factory(employer="Acme")["id"]
 
-        response = client.patch(
+        response = await client.patch(
             f"/people/{person_id}",
             json={"employer": None},
         )
@@ -267,27 +254,32 @@ class TestUpdatePerson:
 
 
 class TestSearchPeople:
-    """Tests for GET /people (search/list)."""
+    """Tests for GET /people (search/list) and PeopleService.search."""
+
+    @pytest.fixture(scope="class")
+    def sample_people(self, class_db):
+        """
+        Insert the sample people for search tests.
+
+        Class-scoped: every test here is read-only, so the rows are inserted
+        once, in a single multi-row INSERT, and shared across the class.
+        """
+        people = class_db.scalars(
+            insert(Person).returning(Person, sort_by_parameter_order=True),
+            [dict(row) for row in SAMPLE_PEOPLE],
+        ).all()
+        return [PersonRead.model_validate(p).model_dump(mode="json") for p in people]
 
     @pytest.fixture
-    def sample_people(self, client):
-        """Create sample people for search tests."""
-        people_data = [
-            {"first_name": "Alice", "last_name": "Anderson", "employer": "Tech Corp", "tags": ["engineering"]},
-            {"first_name": "Bob", "last_name": "Brown", "primary_email": "bob@startup.io", "tags": ["sales"]},
-            {"first_name": "Charlie", "last_name": "Chen", "employer": "Tech Corp", "tags": ["engineering", "vip"]},
-            {"first_name": "Diana", "last_name": "Davis", "employer": "Finance Inc", "tags": ["sales"]},
-            {"first_name": "Eve", "last_name": "Edwards", "primary_email": "eve@tech.com", "tags": ["engineering"]},
-        ]
-        created = []
-        for data in people_data:
-            response = client.post("/people", json=data)
-            created.append(response.json())
-        return created
-
-    def test_list_people_default(self, client, sample_people):
+    def service(self, db):
+        """PeopleService on the per-test session, for pure-query assertions."""
+        return PeopleService(db)
+
+    # HTTP smoke tests: routing, query-param parsing, and response shape.
+
+    async def test_list_people_default(self, client, sample_people):
         """List all people with default pagination."""
-        response = client.get("/people")
+        response = await client.get("/people")
 
         assert response.status_code == 200
         data = response.json()
@@ -296,139 +288,111 @@ class TestSearchPeople:
         assert data["limit"] == 20
         assert data["offset"] == 0
 
-    def test_search_by_first_name(self, client, sample_people):
-        """Search by first name (case-insensitive)."""
-        response = client.get("/people", params={"query": "alice"})
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["total"] == 1
-        assert data["items"][0]["first_name"] == "Alice"
-
-    def test_search_by_last_name(self, client, sample_people):
-        """Search by last name."""
-        response = client.get("/people", params={"query": "chen"})
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["total"] == 1
-        assert data["items"][0]["last_name"] == "Chen"
-
-    def test_search_by_email(self, client, sample_people):
-        """Search by email (partial match)."""
-        response = client.get("/people", params={"query": "startup"})
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["total"] == 1
-        assert data["items"][0]["first_name"] == "Bob"
-
-    def test_search_by_employer(self, client, sample_people):
-        """Search by employer."""
-        response = client.get("/people", params={"query": "tech corp"})
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["total"] == 2
-        employers = {item["first_name"] for item in data["items"]}
-        assert employers == {"Alice", "Charlie"}
-
-    def test_filter_by_tag(self, client, sample_people):
-        """Filter by exact tag match."""
-        response = client.get("/people", params={"tag": "engineering"})
+    async def test_search_smoke_http(self, client, sample_people):
+        """Query, tag, limit and offset are passed through and echoed back."""
+        response = await client.get(
+            "/people",
+            params={"query": "tech", "tag": "ENGINEERING", "limit": 2, "offset": 1},
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 3
-        names = {item["first_name"] for item in data["items"]}
-        assert names == {"Alice", "Charlie", "Eve"}
+        assert [item["first_name"] for item in data["items"]] == ["Charlie", "Eve"]
+        assert data["limit"] == 2
+        assert data["offset"] == 1
 
-    def test_filter_by_tag_case_insensitive(self, client, sample_people):
-        """Tag filter should be case-insensitive."""
-        response = client.get("/people", params={"tag": "ENGINEERING"})
+    @pytest.mark.no_db
+    async def test_limit_clamped_to_max(self, client):
+        """Limit should be clamped to max 100."""
+        response = await client.get("/people", params={"limit": 200})
 
-        assert response.status_code == 200
-        assert response.json()["total"] == 3
+        assert response.status_code == 422  # FastAPI validates Query params
 
-    def test_search_and_filter_combined(self, client, sample_people):
+    # Service-level tests: same query logic without the ASGI round trip.
+
+    @pytest.mark.parametrize(
+        "query, field, expected",
+        [
+            pytest.param("alice", "first_name", {"Alice"}, id="first_name"),
+            pytest.param("chen", "last_name", {"Chen"}, id="last_name"),
+            pytest.param("startup", "first_name", {"Bob"}, id="email_partial"),
+            pytest.param("tech corp", "first_name", {"Alice", "Charlie"}, id="employer"),
+        ],
+    )
+    async def test_search_by_query(self, service, sample_people, query, field, expected):
+        """Free-text search across name, email and employer (case-insensitive)."""
+        people, total = service.search(query=query)
+
+        assert total == len(expected)
+        assert {getattr(p, field) for p in people} == expected
+
+    @pytest.mark.parametrize("tag", ["engineering", "ENGINEERING"])
+    async def test_filter_by_tag(self, service, sample_people, tag):
+        """Filter by exact tag match, case-insensitive."""
+        people, total = service.search(tag=tag)
+
+        assert total == 3
+        assert {p.first_name for p in people} == {"Alice", "Charlie", "Eve"}
+
+    async def test_search_and_filter_combined(self, service, sample_people):
         """Combine text search with tag filter."""
-        response = client.get("/people", params={"query": "tech", "tag": "engineering"})
+        _, total = service.search(query="tech", tag="engineering")
 
-        assert response.status_code == 200
-        data = response.json()
         # Alice and Charlie have "engineering" tag and work at "Tech Corp"
         # Eve has "engineering" tag and email at tech.com
-        assert data["total"] == 3
-
-    def test_pagination_limit(self, client, sample_people):
-        """Limit number of results."""
-        response = client.get("/people", params={"limit": 2})
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["total"] == 5  # Total count unchanged
-        assert len(data["items"]) == 2
-        assert data["limit"] == 2
-
-    def test_pagination_offset(self, client, sample_people):
-        """Skip results with offset."""
-        response = client.get("/people", params={"limit": 2, "offset": 2})
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["total"] == 5
-        assert len(data["items"]) == 2
-        assert data["offset"] == 2
-
-    def test_stable_ordering(self, client, sample_people):
+        assert total == 3
+
+    @pytest.mark.parametrize(
+        "limit, offset, expected_count",
+        [
+            pytest.param(2, 0, 2, id="limit"),
+            pytest.param(2, 2, 2, id="offset"),
+            pytest.param(2, 4, 1, id="last_page"),
+        ],
+    )
+    async def test_pagination(self, service, sample_people, limit, offset, expected_count):
+        """Limit and offset page through results; total is unaffected."""
+        people, total = service.search(limit=limit, offset=offset)
+
+        assert total == 5  # Total count unchanged
+        assert len(people) == expected_count
+
+    async def test_stable_ordering(self, service, sample_people):
         """Results should be consistently ordered by last_name, first_name."""
-        response = client.get("/people")
+        people, _ = service.search()
 
-        data = response.json()
-        last_names = [item["last_name"] for item in data["items"]]
+        last_names = [p.last_name for p in people]
         assert last_names == sorted(last_names)
 
-    def test_limit_clamped_to_max(self, client, sample_people):
-        """Limit should be clamped to max 100."""
-        response = client.get("/people", params={"limit": 200})
-
-        assert response.status_code == 422  # FastAPI validates Query params
-
-    def test_empty_search_results(self, client, sample_people):
+    async def test_empty_search_results(self, service, sample_people):
         """Return empty list for no matches."""
-        response = client.get("/people", params={"query": "nonexistent"})
+        people, total = service.search(query="nonexistent")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["total"] == 0
-        assert data["items"] == []
+        assert total == 0
+        assert people == []
 
 
 class TestDeletePerson:
     """Tests for DELETE /people/{id}."""
 
-    def test_delete_person_success(self, client):
+    async def test_delete_person_success(self, client, person_factory):
         """Successfully delete a person."""
-        # Create a person
-        create_response = client.post(
-            "/people",
-            json={"first_name": "John", "last_name": "Doe"},
-        )
-        person_id = create_response.json()["id"]
+        person_id = person_factory()["id"]
 
         # Delete
-        response = client.delete(f"/people/{person_id}")
+        response = await client.delete(f"/people/{person_id}")
 
         assert response.status_code == 204
 
         # Verify deleted
-        get_response = client.get(f"/people/{person_id}")
+        get_response = await client.get(f"/people/{person_id}")
         assert get_response.status_code == 404
 
-    def test_delete_person_not_found(self, client):
+    async def test_delete_person_not_found(self, client):
         """Return 404 for deleting non-existent person."""
-        fake_id = str(uuid.uuid4())
+        fake_id = MISSING_ID
 
-        response = client.delete(f"/people/{fake_id}")
+        response = await client.delete(f"/people/{fake_id}")
 
         assert response.status_code == 404
@@ -5,9 +5,10 @@ Revises:
 Create Date: 2024-01-01 00:00:00.000000
 
 """
+from datetime import date
 from typing import Sequence, Union
 
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
@@ -17,35 +18,178 @@ down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Foreign keys as (table, column, referenced table); all reference the
+# parent's id. Added after the tables so creation doesn't wait on them.
+# FKs to users/organizations cross aggregates and are DEFERRABLE INITIALLY
+# DEFERRED, so bulk loads can insert in any order and check once at COMMIT.
+FOREIGN_KEYS = (
+    ('organizations', 'owner_id', 'users'),
+    ('organizations', 'created_by', 'users'),
+    ('contacts', 'organization_id', 'organizations'),
+    ('contacts', 'owner_id', 'users'),
+    ('contacts', 'created_by', 'users'),
+    ('tags', 'tag_set_id', 'tag_sets'),
+    ('activities', 'owner_id', 'users'),
+    ('activities', 'created_by', 'users'),
+    ('contact_tags', 'contact_id', 'contacts'),
+    ('contact_tags', 'tag_id', 'tags'),
+    ('contact_tags', 'tagged_by', 'users'),
+    ('organization_tags', 'organization_id', 'organizations'),
+    ('organization_tags', 'tag_id', 'tags'),
+    ('organization_tags', 'tagged_by', 'users'),
+    ('activity_attendees', 'activity_id', 'activities'),
+    ('activity_attendees', 'contact_id', 'contacts'),
+    ('activity_tags', 'activity_id', 'activities'),
+    ('activity_tags', 'tag_id', 'tags'),
+    ('activity_tags', 'tagged_by', 'users'),
+    ('activity_versions', 'activity_id', 'activities'),
+    ('activity_versions', 'changed_by', 'users'),
+    ('attachments', 'activity_id', 'activities'),
+    ('attachments', 'parent_attachment_id', 'attachments'),
+    ('attachments', 'uploaded_by', 'users'),
+    ('followups', 'activity_id', 'activities'),
+    ('followups', 'assigned_to', 'users'),
+    ('followups', 'created_by', 'users'),
+    ('audit_log', 'user_id', 'users'),
+)
+DEFERRED_REFERENCES = {'users', 'organizations'}
 
-def upgrade() -> None:
-    # Create enums
-    user_role = postgresql.ENUM('ADMIN', 'MANAGER', 'ANALYST', 'VIEWER', name='user_role', create_type=False)
-    user_role.create(op.get_bind(), checkfirst=True)
+# Append-only tables, range-partitioned by month on their timestamp column.
+# Postgres can't add NOT VALID FKs to partitioned tables, so theirs are
+# added already validated.
+PARTITIONED_TABLES = {
+    'activity_versions': 'changed_at',
+    'audit_log': 'created_at',
+}
+PARTITION_MONTHS = 24
+
+# Update-heavy tables leave free space on each page so UPDATEs of non-indexed
+# columns (status, updated_at, ...) can stay HOT and skip index maintenance.
+FILLFACTOR = {
+    'users': 85,
+    'organizations': 85,
+    'contacts': 85,
+    'activities': 85,
+    'followups': 85,
+}
+
+
+def _add_foreign_keys(foreign_keys: Sequence[tuple[str, str, str]]) -> None:
+    """Attach FKs as NOT VALID (no table scan), one ALTER TABLE per table.
+
+    FKs a previous, interrupted run already added are skipped.
+    """
+    existing = set(op.get_bind().scalars(sa.text("SELECT conname FROM pg_constraint WHERE contype = 'f'")))
+    by_table: dict[str, list[str]] = {}
+    for table, column, referenced in foreign_keys:
+        if f"{table}_{column}_fkey" in existing:
+            continue
+        deferred = " DEFERRABLE INITIALLY DEFERRED" if referenced in DEFERRED_REFERENCES else ""
+        not_valid = "" if table in PARTITIONED_TABLES else " NOT VALID"
+        by_table.setdefault(table, []).append(
+            f"ADD CONSTRAINT {table}_{column}_fkey FOREIGN KEY ({column}) "
+            f"REFERENCES {referenced} (id){deferred}{not_valid}"
+        )
+    for table, clauses in by_table.items():
+        op.execute(f"ALTER TABLE {table} " + ", ".join(clauses))
+
+
+def _validate_foreign_keys(foreign_keys: Sequence[tuple[str, str, str]]) -> None:
+    """Validate the NOT VALID FKs added above, one ALTER TABLE per table."""
+    by_table: dict[str, list[str]] = {}
+    for table, column, _ in foreign_keys:
+        if table in PARTITIONED_TABLES:
+            continue
+        by_table.setdefault(table, []).append(f"VALIDATE CONSTRAINT {table}_{column}_fkey")
+    for table, clauses in by_table.items():
+        op.execute(f"ALTER TABLE {table} " + ", ".join(clauses))
+
+
+# Enum types, declared once and referenced by every column that uses them.
+# create_type=False: the types are created up front by _create_enums().
+USER_ROLE = postgresql.ENUM('ADMIN', 'MANAGER', 'ANALYST', 'VIEWER', name='user_role', create_type=False)
+ORG_TYPE = postgresql.ENUM('ASSET_MANAGER', 'BROKER', 'CONSULTANT', 'CORPORATE', 'OTHER', name='org_type', create_type=False)
+CLASSIFICATION = postgresql.ENUM('INTERNAL', 'CONFIDENTIAL', 'RESTRICTED', name='classification', create_type=False)
+ACTIVITY_TYPE = postgresql.ENUM('MEETING', 'CALL', 'EMAIL', 'NOTE', 'LLM_INTERACTION', 'SLACK_NOTE', name='activity_type', create_type=False)
+FOLLOWUP_STATUS = postgresql.ENUM('OPEN', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED', name='followup_status', create_type=False)
+AUDIT_ACTION = postgresql.ENUM('CREATE', 'READ', 'UPDATE', 'DELETE', name='audit_action', create_type=False)
 
-    org_type = postgresql.ENUM('ASSET_MANAGER', 'BROKER', 'CONSULTANT', 'CORPORATE', 'OTHER', name='org_type', create_type=False)
-    org_type.create(op.get_bind(), checkfirst=True)
 
-    classification = postgresql.ENUM('INTERNAL', 'CONFIDENTIAL', 'RESTRICTED', name='classification', create_type=False)
-    classification.create(op.get_bind(), checkfirst=True)
+# Time-ordered UUIDs for primary keys, so inserts append to the right edge of
+# the btree. Postgres 18 ships uuidv7(); older servers get an SQL version
+# built from gen_random_uuid() with the timestamp and version bits set.
+UUID_GENERATE_V7 = """
+DO $$ BEGIN
+IF current_setting('server_version_num')::int >= 180000 THEN
+    CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid
+    LANGUAGE sql VOLATILE AS 'SELECT uuidv7()';
+ELSE
+    CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid
+    LANGUAGE sql VOLATILE AS $fn$
+        SELECT encode(
+            set_bit(set_bit(
+                overlay(uuid_send(gen_random_uuid())
+                        placing substring(int8send((extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                        FROM 1 FOR 6),
+            52, 1), 53, 1),
+            'hex')::uuid
+    $fn$;
+END IF;
+END $$
+"""
+
+
+def _set_fillfactor(fillfactor: dict[str, int]) -> None:
+    """Apply per-table fillfactor (free on the still-empty tables)."""
+    for table, percent in fillfactor.items():
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = {percent})")
+
+
+def _create_monthly_partitions(table: str, months: int = PARTITION_MONTHS) -> None:
+    """Create `months` monthly partitions from the current month, plus a default.
 
-    activity_type = postgresql.ENUM('MEETING', 'CALL', 'EMAIL', 'NOTE', 'LLM_INTERACTION', 'SLACK_NOTE', name='activity_type', create_type=False)
-    activity_type.create(op.get_bind(), checkfirst=True)
+    Rows outside the pre-created range land in ``<table>_default``; add new
+    partitions ahead of time (before rows for that month arrive) to keep it empty.
+    """
+    start = date.today().replace(day=1)
+    for _ in range(months):
+        end = date(start.year + start.month // 12, start.month % 12 + 1, 1)
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS {table}_y{start.year}m{start.month:02d} "
+            f"PARTITION OF {table} FOR VALUES FROM ('{start}') TO ('{end}')"
+        )
+        start = end
+    op.execute(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT")
 
-    followup_status = postgresql.ENUM('OPEN', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED', name='followup_status', create_type=False)
-    followup_status.create(op.get_bind(), checkfirst=True)
 
-    audit_action = postgresql.ENUM('CREATE', 'READ', 'UPDATE', 'DELETE', name='audit_action', create_type=False)
-    audit_action.create(op.get_bind(), checkfirst=True)
+def _create_enums(*enums: postgresql.ENUM) -> None:
+    """Create any missing enum types in a single DO block (one round-trip)."""
+    statements = []
+    for enum in enums:
+        labels = ', '.join(f"'{label}'" for label in enum.enums)
+        statements.append(
+            f"IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = '{enum.name}') THEN "
+            f"CREATE TYPE {enum.name} AS ENUM ({labels}); END IF;"
+        )
+    op.execute("DO $$ BEGIN\n" + "\n".join(statements) + "\nEND $$;")
 
+
+def _create_table(name: str, *elements, **kw) -> None:
+    """op.create_table, skipping a table a previous, interrupted run already created."""
+    if not sa.inspect(op.get_bind()).has_table(name):
+        op.create_table(name, *elements, **kw)
+
+
+def _create_parent_tables() -> None:
+    """Tables that only reference users or each other."""
     # Users table
-    op.create_table(
+    _create_table(
         'users',
-        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('entra_object_id', sa.String(255), nullable=True),
         sa.Column('email', sa.String(255), nullable=False),
         sa.Column('display_name', sa.String(255), nullable=False),
-        sa.Column('role', postgresql.ENUM('ADMIN', 'MANAGER', 'ANALYST', 'VIEWER', name='user_role', create_type=False), nullable=False),
+        sa.Column('role', USER_ROLE, nullable=False),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
@@ -55,37 +199,35 @@ def upgrade() -> None:
     )
 
     # Organizations table
-    op.create_table(
+    _create_table(
         'organizations',
-        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('name', sa.String(255), nullable=False),
         sa.Column('short_name', sa.String(100), nullable=True),
-        sa.Column('org_type', postgresql.ENUM('ASSET_MANAGER', 'BROKER', 'CONSULTANT', 'CORPORATE', 'OTHER', name='org_type', create_type=False), nullable=True),
+        sa.Column('org_type', ORG_TYPE, nullable=True),
         sa.Column('website', sa.String(500), nullable=True),
         sa.Column('notes', sa.Text(), nullable=True),
-        sa.Column('classification', postgresql.ENUM('INTERNAL', 'CONFIDENTIAL', 'RESTRICTED', name='classification', create_type=False), nullable=False, server_default='INTERNAL'),
+        sa.Column('classification', CLASSIFICATION, nullable=False, server_default='INTERNAL'),
         sa.Column('owner_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('is_deleted', sa.Boolean(), nullable=False, server_default='false'),
         sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['owner_id'], ['users.id']),
-        sa.ForeignKeyConstraint(['created_by'], ['users.id']),
         sa.PrimaryKeyConstraint('id')
     )
 
     # Contacts table
-    op.create_table(
+    _create_table(
         'contacts',
-        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('first_name', sa.String(255), nullable=False),
         sa.Column('last_name', sa.String(255), nullable=False),
         sa.Column('email', sa.String(255), nullable=True),
         sa.Column('phone', sa.String(50), nullable=True),
         sa.Column('title', sa.String(255), nullable=True),
         sa.Column('organization_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('classification', postgresql.ENUM('INTERNAL', 'CONFIDENTIAL', 'RESTRICTED', name='classification', create_type=False), nullable=False, server_default='INTERNAL'),
+        sa.Column('classification', CLASSIFICATION, nullable=False, server_default='INTERNAL'),
         sa.Column('owner_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('notes', sa.Text(), nullable=True),
         sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=False),
@@ -93,16 +235,13 @@ def upgrade() -> None:
         sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id']),
-        sa.ForeignKeyConstraint(['owner_id'], ['users.id']),
-        sa.ForeignKeyConstraint(['created_by'], ['users.id']),
         sa.PrimaryKeyConstraint('id')
     )
 
     # Tag sets table
-    op.create_table(
+    _create_table(
         'tag_sets',
-        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('name', sa.String(100), nullable=False),
         sa.Column('description', sa.Text(), nullable=True),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
@@ -113,57 +252,30 @@ def upgrade() -> None:
     )
 
     # Tags table
-    op.create_table(
+    _create_table(
         'tags',
-        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('tag_set_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('value', sa.String(100), nullable=False),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['tag_set_id'], ['tag_sets.id']),
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('tag_set_id', 'value', name='uq_tag_set_value')
     )
 
-    # Contact tags table
-    op.create_table(
-        'contact_tags',
-        sa.Column('contact_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('tag_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('tagged_by', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('tagged_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['contact_id'], ['contacts.id']),
-        sa.ForeignKeyConstraint(['tag_id'], ['tags.id']),
-        sa.ForeignKeyConstraint(['tagged_by'], ['users.id']),
-        sa.PrimaryKeyConstraint('contact_id', 'tag_id')
-    )
-
-    # Organization tags table
-    op.create_table(
-        'organization_tags',
-        sa.Column('organization_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('tag_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('tagged_by', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('tagged_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id']),
-        sa.ForeignKeyConstraint(['tag_id'], ['tags.id']),
-        sa.ForeignKeyConstraint(['tagged_by'], ['users.id']),
-        sa.PrimaryKeyConstraint('organization_id', 'tag_id')
-    )
-
     # Activities table
-    op.create_table(
+    _create_table(
         'activities',
-        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
-        sa.Column('activity_type', postgresql.ENUM('MEETING', 'CALL', 'EMAIL', 'NOTE', 'LLM_INTERACTION', 'SLACK_NOTE', name='activity_type', create_type=False), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
+        sa.Column('activity_type', ACTIVITY_TYPE, nullable=False),
         sa.Column('title', sa.String(500), nullable=False),
         sa.Column('description', sa.Text(), nullable=True),
         sa.Column('occurred_at', sa.DateTime(timezone=True), nullable=False),
         sa.Column('location', sa.String(500), nullable=True),
         sa.Column('summary', sa.Text(), nullable=True),
         sa.Column('key_points', sa.Text(), nullable=True),
-        sa.Column('classification', postgresql.ENUM('INTERNAL', 'CONFIDENTIAL', 'RESTRICTED', name='classification', create_type=False), nullable=False, server_default='INTERNAL'),
+        sa.Column('classification', CLASSIFICATION, nullable=False, server_default='INTERNAL'),
         sa.Column('owner_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('is_deleted', sa.Boolean(), nullable=False, server_default='false'),
@@ -171,54 +283,70 @@ def upgrade() -> None:
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True),
-        sa.ForeignKeyConstraint(['owner_id'], ['users.id']),
-        sa.ForeignKeyConstraint(['created_by'], ['users.id']),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_activities_search_vector', 'activities', ['search_vector'], postgresql_using='gin')
+
+
+def _create_child_tables() -> None:
+    """Junction, history and child tables hanging off the parent tables."""
+    # Contact tags table
+    _create_table(
+        'contact_tags',
+        sa.Column('contact_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tag_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tagged_by', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tagged_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('contact_id', 'tag_id')
+    )
+
+    # Organization tags table
+    _create_table(
+        'organization_tags',
+        sa.Column('organization_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tag_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tagged_by', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tagged_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('organization_id', 'tag_id')
+    )
 
     # Activity attendees table
-    op.create_table(
+    _create_table(
         'activity_attendees',
         sa.Column('activity_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('contact_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('role', sa.String(50), nullable=True),
-        sa.ForeignKeyConstraint(['activity_id'], ['activities.id']),
-        sa.ForeignKeyConstraint(['contact_id'], ['contacts.id']),
         sa.PrimaryKeyConstraint('activity_id', 'contact_id')
     )
 
     # Activity tags table
-    op.create_table(
+    _create_table(
         'activity_tags',
         sa.Column('activity_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('tag_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('tagged_by', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('tagged_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['activity_id'], ['activities.id']),
-        sa.ForeignKeyConstraint(['tag_id'], ['tags.id']),
-        sa.ForeignKeyConstraint(['tagged_by'], ['users.id']),
         sa.PrimaryKeyConstraint('activity_id', 'tag_id')
     )
 
     # Activity versions table
-    op.create_table(
+    _create_table(
         'activity_versions',
-        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('activity_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('version_number', sa.Integer(), nullable=False),
         sa.Column('snapshot', postgresql.JSONB(), nullable=False),
         sa.Column('changed_by', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['activity_id'], ['activities.id']),
-        sa.ForeignKeyConstraint(['changed_by'], ['users.id']),
-        sa.PrimaryKeyConstraint('id')
+        # The partition key must be part of the primary key
+        sa.PrimaryKeyConstraint('id', 'changed_at'),
+        postgresql_partition_by='RANGE (changed_at)',
     )
+    _create_monthly_partitions('activity_versions')
 
     # Attachments table
-    op.create_table(
+    _create_table(
         'attachments',
-        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('activity_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('filename', sa.Text(), nullable=False),
         sa.Column('content_type', sa.String(255), nullable=False),
@@ -227,74 +355,115 @@ def upgrade() -> None:
         sa.Column('checksum', sa.String(64), nullable=True),
         sa.Column('version_number', sa.Integer(), nullable=False, server_default='1'),
         sa.Column('parent_attachment_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('classification', postgresql.ENUM('INTERNAL', 'CONFIDENTIAL', 'RESTRICTED', name='classification', create_type=False), nullable=False, server_default='INTERNAL'),
+        sa.Column('classification', CLASSIFICATION, nullable=False, server_default='INTERNAL'),
         sa.Column('uploaded_by', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('is_deleted', sa.Boolean(), nullable=False, server_default='false'),
         sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['activity_id'], ['activities.id']),
-        sa.ForeignKeyConstraint(['parent_attachment_id'], ['attachments.id']),
-        sa.ForeignKeyConstraint(['uploaded_by'], ['users.id']),
         sa.PrimaryKeyConstraint('id')
     )
 
     # Follow-ups table
-    op.create_table(
+    _create_table(
         'followups',
-        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('activity_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('description', sa.Text(), nullable=False),
         sa.Column('assigned_to', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('due_date', sa.Date(), nullable=True),
-        sa.Column('status', postgresql.ENUM('OPEN', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED', name='followup_status', create_type=False), nullable=False, server_default='OPEN'),
+        sa.Column('status', FOLLOWUP_STATUS, nullable=False, server_default='OPEN'),
         sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['activity_id'], ['activities.id']),
-        sa.ForeignKeyConstraint(['assigned_to'], ['users.id']),
-        sa.ForeignKeyConstraint(['created_by'], ['users.id']),
         sa.PrimaryKeyConstraint('id')
     )
 
     # Audit log table
-    op.create_table(
+    _create_table(
         'audit_log',
-        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('action', postgresql.ENUM('CREATE', 'READ', 'UPDATE', 'DELETE', name='audit_action', create_type=False), nullable=False),
+        sa.Column('action', AUDIT_ACTION, nullable=False),
         sa.Column('entity_type', sa.String(100), nullable=False),
         sa.Column('entity_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('details', postgresql.JSONB(), nullable=True),
         sa.Column('ip_address', sa.String(45), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
-        sa.PrimaryKeyConstraint('id')
+        # The partition key must be part of the primary key
+        sa.PrimaryKeyConstraint('id', 'created_at'),
+        postgresql_partition_by='RANGE (created_at)',
+    )
+    _create_monthly_partitions('audit_log')
+
+
+def _create_indexes() -> None:
+    """Secondary indexes, built once every table exists."""
+    op.create_index('ix_audit_log_entity', 'audit_log', ['entity_type', 'entity_id'], if_not_exists=True)
+    # audit_log is append-only, so created_at tracks physical order: a BRIN
+    # index covers time-range scans at a fraction of a btree's size.
+    # Indexes on the partitioned parent cascade to every partition; Postgres
+    # can't build those CONCURRENTLY.
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_log_user ON audit_log (user_id)")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_log_created_brin "
+        "ON audit_log USING BRIN (created_at) WITH (pages_per_range = 32)"
+    )
+
+
+def create_search_indexes() -> None:
+    """Full-text GIN indexes, built last.
+
+    fastupdate=off keeps query latency predictable (no pending list to
+    flush). Data-migration revisions that bulk-load activities should drop
+    these first and call this afterwards, instead of paying per-row GIN upkeep.
+    """
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_activities_search_vector "
+        "ON activities USING GIN (search_vector) WITH (fastupdate = off)"
     )
-    op.create_index('ix_audit_log_entity', 'audit_log', ['entity_type', 'entity_id'])
-    op.create_index('ix_audit_log_user_created', 'audit_log', ['user_id', 'created_at'])
+
+
+def upgrade() -> None:
+    # Inside autocommit_block() every statement commits on its own, so no
+    # lock is held past its statement, but the blocks are only grouping, not
+    # transactions. Alembic stamps 001 only once upgrade() returns, so after a
+    # failure the whole upgrade reruns: every step therefore skips what
+    # already exists (tables, FKs, enums, partitions, indexes) and a rerun
+    # picks up where the failed one stopped.
+    # synchronous_commit is a session setting, so it spans every block.
+    ctx = context.get_context()
+    with ctx.autocommit_block():
+        op.execute("SET synchronous_commit = off")
+        op.execute(UUID_GENERATE_V7)
+        _create_enums(USER_ROLE, ORG_TYPE, CLASSIFICATION, ACTIVITY_TYPE, FOLLOWUP_STATUS, AUDIT_ACTION)
+
+    with ctx.autocommit_block():
+        _create_parent_tables()
+
+    with ctx.autocommit_block():
+        _create_child_tables()
+        _set_fillfactor(FILLFACTOR)
+
+    with ctx.autocommit_block():
+        _add_foreign_keys(FOREIGN_KEYS)
+        _validate_foreign_keys(FOREIGN_KEYS)
+
+    with ctx.autocommit_block():
+        _create_indexes()
+        create_search_indexes()
+        op.execute("RESET synchronous_commit")
 
 
 def downgrade() -> None:
-    op.drop_table('audit_log')
-    op.drop_table('followups')
-    op.drop_table('attachments')
-    op.drop_table('activity_versions')
-    op.drop_table('activity_tags')
-    op.drop_table('activity_attendees')
-    op.drop_table('activities')
-    op.drop_table('organization_tags')
-    op.drop_table('contact_tags')
-    op.drop_table('tags')
-    op.drop_table('tag_sets')
-    op.drop_table('contacts')
-    op.drop_table('organizations')
-    op.drop_table('users')
-
-    # Drop enums
-    op.execute('DROP TYPE IF EXISTS audit_action')
-    op.execute('DROP TYPE IF EXISTS followup_status')
-    op.execute('DROP TYPE IF EXISTS activity_type')
-    op.execute('DROP TYPE IF EXISTS classification')
-    op.execute('DROP TYPE IF EXISTS org_type')
-    op.execute('DROP TYPE IF EXISTS user_role')
+    # One statement each for tables and types; Postgres orders the drops itself.
+    op.execute(
+        "DROP TABLE IF EXISTS audit_log, followups, attachments, activity_versions, "
+        "activity_tags, activity_attendees, activities, organization_tags, contact_tags, "
+        "tags, tag_sets, contacts, organizations, users CASCADE"
+    )
+    op.execute(
+        "DROP TYPE IF EXISTS audit_action, followup_status, activity_type, "
+        "classification, org_type, user_role"
+    )
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
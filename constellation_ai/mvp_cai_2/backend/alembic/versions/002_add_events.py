@@ -17,27 +17,77 @@ down_revision: Union[str, None] = '001'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Enum types, declared once per revision. classification already exists
+# (created in 001); event_type is created at the top of upgrade().
+CLASSIFICATION = postgresql.ENUM('INTERNAL', 'CONFIDENTIAL', 'RESTRICTED', name='classification', create_type=False)
+EVENT_TYPE = postgresql.ENUM('RETREAT', 'DINNER', 'LUNCH', 'OTHER', name='event_type', create_type=False)
+
+# Foreign keys as (table, column, referenced table); all reference the
+# parent's id. Added after the tables so creation doesn't wait on them.
+# FKs to users/organizations cross aggregates and are DEFERRABLE INITIALLY
+# DEFERRED, so bulk loads can insert in any order and check once at COMMIT.
+FOREIGN_KEYS = (
+    ('events', 'owner_id', 'users'),
+    ('events', 'created_by', 'users'),
+    ('event_attendees', 'event_id', 'events'),
+    ('event_attendees', 'contact_id', 'contacts'),
+    ('event_pitches', 'event_id', 'events'),
+    ('event_pitches', 'pitched_by', 'contacts'),
+    ('event_pitches', 'created_by', 'users'),
+    ('event_tags', 'event_id', 'events'),
+    ('event_tags', 'tag_id', 'tags'),
+    ('event_tags', 'tagged_by', 'users'),
+    ('event_versions', 'event_id', 'events'),
+    ('event_versions', 'changed_by', 'users'),
+)
+DEFERRED_REFERENCES = {'users', 'organizations'}
+
+
+def _add_foreign_keys(foreign_keys: Sequence[tuple[str, str, str]]) -> None:
+    """Attach FKs as NOT VALID (no table scan), one ALTER TABLE per table."""
+    by_table: dict[str, list[str]] = {}
+    for table, column, referenced in foreign_keys:
+        deferred = " DEFERRABLE INITIALLY DEFERRED" if referenced in DEFERRED_REFERENCES else ""
+        by_table.setdefault(table, []).append(
+            f"ADD CONSTRAINT {table}_{column}_fkey FOREIGN KEY ({column}) "
+            f"REFERENCES {referenced} (id){deferred} NOT VALID"
+        )
+    for table, clauses in by_table.items():
+        op.execute(f"ALTER TABLE {table} " + ", ".join(clauses))
+
+
+def _validate_foreign_keys(foreign_keys: Sequence[tuple[str, str, str]]) -> None:
+    """Validate the NOT VALID FKs added above, one ALTER TABLE per table."""
+    by_table: dict[str, list[str]] = {}
+    for table, column, _ in foreign_keys:
+        by_table.setdefault(table, []).append(f"VALIDATE CONSTRAINT {table}_{column}_fkey")
+    for table, clauses in by_table.items():
+        op.execute(f"ALTER TABLE {table} " + ", ".join(clauses))
+
+
+def create_search_indexes() -> None:
+    """Full-text GIN index on events, built last (see revision 001)."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_events_search_vector "
+        "ON events USING GIN (search_vector) WITH (fastupdate = off)"
+    )
+
 
 def upgrade() -> None:
     # Create event_type enum
-    event_type = postgresql.ENUM(
-        'RETREAT', 'DINNER', 'LUNCH', 'OTHER',
-        name='event_type',
-        create_type=False
-    )
-    event_type.create(op.get_bind(), checkfirst=True)
+    EVENT_TYPE.create(op.get_bind(), checkfirst=True)
 
     # Events table
     op.create_table(
         'events',
-        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('name', sa.String(500), nullable=False),
-        sa.Column('event_type', postgresql.ENUM('RETREAT', 'DINNER', 'LUNCH', 'OTHER', name='event_type', create_type=False), nullable=False),
+        sa.Column('event_type', EVENT_TYPE, nullable=False),
         sa.Column('occurred_at', sa.DateTime(timezone=True), nullable=False),
         sa.Column('location', sa.String(500), nullable=True),
         sa.Column('description', sa.Text(), nullable=True),
         sa.Column('notes', sa.Text(), nullable=True),
-        sa.Column('classification', postgresql.ENUM('INTERNAL', 'CONFIDENTIAL', 'RESTRICTED', name='classification', create_type=False), nullable=False, server_default='INTERNAL'),
+        sa.Column('classification', CLASSIFICATION, nullable=False, server_default='INTERNAL'),
         sa.Column('owner_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('is_deleted', sa.Boolean(), nullable=False, server_default='false'),
@@ -45,11 +95,8 @@ def upgrade() -> None:
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True),
-        sa.ForeignKeyConstraint(['owner_id'], ['users.id']),
-        sa.ForeignKeyConstraint(['created_by'], ['users.id']),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_events_search_vector', 'events', ['search_vector'], postgresql_using='gin')
 
     # Event attendees table (M:N junction)
     op.create_table(
@@ -58,15 +105,13 @@ def upgrade() -> None:
         sa.Column('contact_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('role', sa.String(50), nullable=True),
         sa.Column('notes', sa.Text(), nullable=True),
-        sa.ForeignKeyConstraint(['event_id'], ['events.id']),
-        sa.ForeignKeyConstraint(['contact_id'], ['contacts.id']),
         sa.PrimaryKeyConstraint('event_id', 'contact_id')
     )
 
     # Event pitches table (stocks pitched at events)
     op.create_table(
         'event_pitches',
-        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('event_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('ticker', sa.String(20), nullable=True),
         sa.Column('company_name', sa.String(255), nullable=False),
@@ -76,9 +121,6 @@ def upgrade() -> None:
         sa.Column('is_bullish', sa.Boolean(), nullable=True),
         sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['event_id'], ['events.id']),
-        sa.ForeignKeyConstraint(['pitched_by'], ['contacts.id']),
-        sa.ForeignKeyConstraint(['created_by'], ['users.id']),
         sa.PrimaryKeyConstraint('id')
     )
 
@@ -89,26 +131,29 @@ def upgrade() -> None:
         sa.Column('tag_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('tagged_by', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('tagged_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['event_id'], ['events.id']),
-        sa.ForeignKeyConstraint(['tag_id'], ['tags.id']),
-        sa.ForeignKeyConstraint(['tagged_by'], ['users.id']),
         sa.PrimaryKeyConstraint('event_id', 'tag_id')
     )
 
     # Event versions table (append-only history)
     op.create_table(
         'event_versions',
-        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('event_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('version_number', sa.Integer(), nullable=False),
         sa.Column('snapshot', postgresql.JSONB(), nullable=False),
         sa.Column('changed_by', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['event_id'], ['events.id']),
-        sa.ForeignKeyConstraint(['changed_by'], ['users.id']),
         sa.PrimaryKeyConstraint('id')
     )
 
+    _add_foreign_keys(FOREIGN_KEYS)
+    _validate_foreign_keys(FOREIGN_KEYS)
+
+    # events is update-heavy; leave room on each page for HOT updates
+    op.execute("ALTER TABLE events SET (fillfactor = 85)")
+
+    create_search_indexes()
+
 
 def downgrade() -> None:
     op.drop_table('event_versions')
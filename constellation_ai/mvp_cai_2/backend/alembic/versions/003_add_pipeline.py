@@ -17,24 +17,58 @@ down_revision: Union[str, None] = '002'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Enum type, declared once and referenced by the column that uses it.
+PIPELINE_STATUS = postgresql.ENUM('ACTIVE', 'BACK_BURNER', 'PASSED', 'CONVERTED', name='pipeline_status', create_type=False)
+
+# Foreign keys as (table, column, referenced table); all reference the
+# parent's id. Added after the tables so creation doesn't wait on them.
+# FKs to users/organizations cross aggregates and are DEFERRABLE INITIALLY
+# DEFERRED, so bulk loads can insert in any order and check once at COMMIT.
+FOREIGN_KEYS = (
+    ('pipeline_items', 'organization_id', 'organizations'),
+    ('pipeline_items', 'primary_contact_id', 'contacts'),
+    ('pipeline_items', 'owner_id', 'users'),
+    ('pipeline_items', 'created_by', 'users'),
+    ('pipeline_stage_history', 'pipeline_item_id', 'pipeline_items'),
+    ('pipeline_stage_history', 'changed_by_id', 'users'),
+)
+DEFERRED_REFERENCES = {'users', 'organizations'}
+
+
+def _add_foreign_keys(foreign_keys: Sequence[tuple[str, str, str]]) -> None:
+    """Attach FKs as NOT VALID (no table scan), one ALTER TABLE per table."""
+    by_table: dict[str, list[str]] = {}
+    for table, column, referenced in foreign_keys:
+        deferred = " DEFERRABLE INITIALLY DEFERRED" if referenced in DEFERRED_REFERENCES else ""
+        by_table.setdefault(table, []).append(
+            f"ADD CONSTRAINT {table}_{column}_fkey FOREIGN KEY ({column}) "
+            f"REFERENCES {referenced} (id){deferred} NOT VALID"
+        )
+    for table, clauses in by_table.items():
+        op.execute(f"ALTER TABLE {table} " + ", ".join(clauses))
+
+
+def _validate_foreign_keys(foreign_keys: Sequence[tuple[str, str, str]]) -> None:
+    """Validate the NOT VALID FKs added above, one ALTER TABLE per table."""
+    by_table: dict[str, list[str]] = {}
+    for table, column, _ in foreign_keys:
+        by_table.setdefault(table, []).append(f"VALIDATE CONSTRAINT {table}_{column}_fkey")
+    for table, clauses in by_table.items():
+        op.execute(f"ALTER TABLE {table} " + ", ".join(clauses))
+
 
 def upgrade() -> None:
     # Create pipeline_status enum
-    pipeline_status = postgresql.ENUM(
-        'ACTIVE', 'BACK_BURNER', 'PASSED', 'CONVERTED',
-        name='pipeline_status',
-        create_type=False,
-    )
-    pipeline_status.create(op.get_bind(), checkfirst=True)
+    PIPELINE_STATUS.create(op.get_bind(), checkfirst=True)
 
     # Pipeline items table
     op.create_table(
         'pipeline_items',
-        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('organization_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('primary_contact_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('stage', sa.SmallInteger(), nullable=False, server_default='1'),
-        sa.Column('status', postgresql.ENUM('ACTIVE', 'BACK_BURNER', 'PASSED', 'CONVERTED', name='pipeline_status', create_type=False), nullable=False, server_default='ACTIVE'),
+        sa.Column('status', PIPELINE_STATUS, nullable=False, server_default='ACTIVE'),
         sa.Column('owner_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('back_burner_reason', sa.Text(), nullable=True),
@@ -46,25 +80,34 @@ def upgrade() -> None:
         sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id']),
-        sa.ForeignKeyConstraint(['primary_contact_id'], ['contacts.id']),
-        sa.ForeignKeyConstraint(['owner_id'], ['users.id']),
-        sa.ForeignKeyConstraint(['created_by'], ['users.id']),
         sa.CheckConstraint('stage >= 1 AND stage <= 6', name='ck_pipeline_items_stage_range'),
         sa.PrimaryKeyConstraint('id'),
     )
 
-    # Partial unique index: only one ACTIVE or BACK_BURNER item per org (excluding deleted)
+    # Partial unique index: only one ACTIVE or BACK_BURNER item per org (excluding deleted).
+    # INCLUDE carries the board columns so per-org lookups are index-only scans.
     op.execute(
         "CREATE UNIQUE INDEX uq_pipeline_org_active "
         "ON pipeline_items (organization_id) "
+        "INCLUDE (stage, owner_id, last_stage_change_at) "
+        "WITH (fillfactor = 90) "
         "WHERE status IN ('ACTIVE', 'BACK_BURNER') AND is_deleted = FALSE"
     )
 
+    # Stage/status churn is highest here; leave room on each page for HOT updates
+    op.execute("ALTER TABLE pipeline_items SET (fillfactor = 80)")
+
+    # Owner dashboard / owner+stage filters on live items
+    op.execute(
+        "CREATE INDEX ix_pipeline_items_owner_stage "
+        "ON pipeline_items (owner_id, stage) "
+        "WHERE is_deleted = FALSE"
+    )
+
     # Pipeline stage history table (append-only)
     op.create_table(
         'pipeline_stage_history',
-        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
         sa.Column('pipeline_item_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('from_stage', sa.SmallInteger(), nullable=True),
         sa.Column('to_stage', sa.SmallInteger(), nullable=False),
@@ -73,14 +116,16 @@ def upgrade() -> None:
         sa.Column('changed_by_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('note', sa.Text(), nullable=True),
         sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['pipeline_item_id'], ['pipeline_items.id']),
-        sa.ForeignKeyConstraint(['changed_by_id'], ['users.id']),
         sa.PrimaryKeyConstraint('id'),
     )
 
+    _add_foreign_keys(FOREIGN_KEYS)
+    _validate_foreign_keys(FOREIGN_KEYS)
+
 
 def downgrade() -> None:
     op.drop_table('pipeline_stage_history')
+    op.execute('DROP INDEX IF EXISTS ix_pipeline_items_owner_stage')
     op.execute('DROP INDEX IF EXISTS uq_pipeline_org_active')
     op.drop_table('pipeline_items')
     op.execute('DROP TYPE IF EXISTS pipeline_status')
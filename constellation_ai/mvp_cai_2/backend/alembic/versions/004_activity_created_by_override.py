@@ -0,0 +1,45 @@
+"""Store activities.created_by only when it differs from owner_id
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The creator is almost always the owner; keep it only when it isn't
+    op.add_column('activities', sa.Column('created_by_override', postgresql.UUID(as_uuid=True), nullable=True))
+    op.execute(
+        "UPDATE activities SET created_by_override = created_by "
+        "WHERE created_by <> owner_id"
+    )
+    op.execute(
+        "ALTER TABLE activities ADD CONSTRAINT activities_created_by_override_fkey "
+        "FOREIGN KEY (created_by_override) REFERENCES users (id) "
+        "DEFERRABLE INITIALLY DEFERRED NOT VALID"
+    )
+    op.execute("ALTER TABLE activities VALIDATE CONSTRAINT activities_created_by_override_fkey")
+    op.drop_column('activities', 'created_by')
+
+
+def downgrade() -> None:
+    op.add_column('activities', sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=True))
+    op.execute("UPDATE activities SET created_by = coalesce(created_by_override, owner_id)")
+    op.alter_column('activities', 'created_by', nullable=False)
+    op.execute(
+        "ALTER TABLE activities ADD CONSTRAINT activities_created_by_fkey "
+        "FOREIGN KEY (created_by) REFERENCES users (id) DEFERRABLE INITIALLY DEFERRED"
+    )
+    op.drop_column('activities', 'created_by_override')
@@ -0,0 +1,42 @@
+"""Partial indexes for listing non-deleted activities, attachments and contacts
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns). All skip soft-deleted rows, which list endpoints
+# never return, so the indexes stay small.
+ACTIVE_ROW_INDEXES = (
+    ('ix_activities_active_owner_occurred', 'activities', 'owner_id, occurred_at'),
+    ('ix_activities_active_class_occurred', 'activities', 'classification, occurred_at'),
+    ('ix_attachments_active_activity', 'attachments', 'activity_id'),
+    ('ix_contacts_active_org', 'contacts', 'organization_id'),
+    ('ix_contacts_active_class_name', 'contacts', 'classification, last_name, first_name'),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY so existing tables stay writable; it can't run in a transaction
+    with context.get_context().autocommit_block():
+        for name, table, columns in ACTIVE_ROW_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} ({columns}) WHERE is_deleted = false"
+            )
+
+
+def downgrade() -> None:
+    with context.get_context().autocommit_block():
+        for name, _, _ in ACTIVE_ROW_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
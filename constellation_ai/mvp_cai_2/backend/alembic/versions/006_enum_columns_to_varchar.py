@@ -0,0 +1,72 @@
+"""Store single-table enum columns as varchar with CHECK constraints
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, PG enum type, allowed values, server default). Each type is
+# used by exactly one column; a CHECK constraint keeps the same guarantees
+# without enum OID lookups, and new values no longer need ALTER TYPE.
+ENUM_COLUMNS = (
+    ('users', 'role', 'user_role', ('ADMIN', 'MANAGER', 'ANALYST', 'VIEWER'), None),
+    ('organizations', 'org_type', 'org_type',
+     ('ASSET_MANAGER', 'BROKER', 'CONSULTANT', 'CORPORATE', 'OTHER'), None),
+    ('followups', 'status', 'followup_status', ('OPEN', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED'), 'OPEN'),
+    ('events', 'event_type', 'event_type', ('RETREAT', 'DINNER', 'LUNCH', 'OTHER'), None),
+    ('pipeline_items', 'status', 'pipeline_status', ('ACTIVE', 'BACK_BURNER', 'PASSED', 'CONVERTED'), 'ACTIVE'),
+)
+
+# The predicate references pipeline_items.status, so the index has to be
+# rebuilt against the new column type
+UQ_PIPELINE_ORG_ACTIVE = (
+    "CREATE UNIQUE INDEX uq_pipeline_org_active "
+    "ON pipeline_items (organization_id) "
+    "INCLUDE (stage, owner_id, last_stage_change_at) "
+    "WITH (fillfactor = 90) "
+    "WHERE status IN ('ACTIVE', 'BACK_BURNER') AND is_deleted = FALSE"
+)
+
+
+def upgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS uq_pipeline_org_active')
+
+    for table, column, type_name, values, default in ENUM_COLUMNS:
+        if default is not None:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT')
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar(20) USING {column}::text')
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'")
+        labels = ', '.join(f"'{v}'" for v in values)
+        op.create_check_constraint(f'ck_{table}_{column}', table, f'{column} IN ({labels})')
+        op.execute(f'DROP TYPE {type_name}')
+
+    op.execute(UQ_PIPELINE_ORG_ACTIVE)
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS uq_pipeline_org_active')
+
+    for table, column, type_name, values, default in reversed(ENUM_COLUMNS):
+        labels = ', '.join(f"'{v}'" for v in values)
+        op.execute(f'CREATE TYPE {type_name} AS ENUM ({labels})')
+        op.drop_constraint(f'ck_{table}_{column}', table, type_='check')
+        if default is not None:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT')
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} USING {column}::{type_name}'
+        )
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'")
+
+    op.execute(UQ_PIPELINE_ORG_ACTIVE)
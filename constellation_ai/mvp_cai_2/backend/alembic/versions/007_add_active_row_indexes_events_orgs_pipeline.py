@@ -0,0 +1,45 @@
+"""Partial indexes for listing non-deleted events, organizations and pipeline items
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, index definition). All skip soft-deleted rows, which list
+# endpoints never return, so the indexes stay small.
+ACTIVE_ROW_INDEXES = (
+    ('ix_events_active_owner_occurred', 'events', '(owner_id, occurred_at)'),
+    ('ix_events_active_class_occurred', 'events', '(classification, occurred_at)'),
+    ('ix_organizations_active_owner', 'organizations', '(owner_id)'),
+    ('ix_organizations_active_class_name', 'organizations', '(classification, name)'),
+    # Pipeline list/board: filter by status, newest stage change first; the
+    # INCLUDE columns make the owner/stage checks index-only
+    ('ix_pipeline_items_active_status_changed', 'pipeline_items',
+     '(status, last_stage_change_at) INCLUDE (stage, owner_id)'),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY so existing tables stay writable; it can't run in a transaction
+    with context.get_context().autocommit_block():
+        for name, table, definition in ACTIVE_ROW_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} {definition} WHERE is_deleted = false"
+            )
+
+
+def downgrade() -> None:
+    with context.get_context().autocommit_block():
+        for name, _, _ in ACTIVE_ROW_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
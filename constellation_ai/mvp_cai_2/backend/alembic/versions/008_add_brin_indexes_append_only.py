@@ -0,0 +1,44 @@
+"""BRIN indexes on the timestamps of append-only history and tag tables
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, column). Rows are only ever appended, so the timestamp tracks
+# physical order and a BRIN index serves time-range scans at a tiny fraction
+# of a btree's size (same as ix_audit_log_created_brin).
+BRIN_INDEXES = (
+    ('ix_pipeline_stage_history_changed_brin', 'pipeline_stage_history', 'changed_at'),
+    ('ix_event_versions_changed_brin', 'event_versions', 'changed_at'),
+    ('ix_contact_tags_tagged_brin', 'contact_tags', 'tagged_at'),
+    ('ix_organization_tags_tagged_brin', 'organization_tags', 'tagged_at'),
+    ('ix_activity_tags_tagged_brin', 'activity_tags', 'tagged_at'),
+    ('ix_event_tags_tagged_brin', 'event_tags', 'tagged_at'),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY so existing tables stay writable; it can't run in a transaction
+    with context.get_context().autocommit_block():
+        for name, table, column in BRIN_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING BRIN ({column}) WITH (pages_per_range = 32)"
+            )
+
+
+def downgrade() -> None:
+    with context.get_context().autocommit_block():
+        for name, _, _ in BRIN_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,70 @@
+"""Store the remaining PG enum columns as varchar with CHECK constraints
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# PG enum type -> allowed values
+ENUM_TYPES = {
+    'classification': ('INTERNAL', 'CONFIDENTIAL', 'RESTRICTED'),
+    'activity_type': ('MEETING', 'CALL', 'EMAIL', 'NOTE', 'LLM_INTERACTION', 'SLACK_NOTE'),
+    'audit_action': ('CREATE', 'READ', 'UPDATE', 'DELETE'),
+}
+
+# (table, column, PG enum type, server default). Unlike revision 006 these
+# types are shared or mapped with SQLAlchemy's Enum, which keeps the Python
+# enum on the model but stores a plain varchar; a new value is then a CHECK
+# constraint swap instead of ALTER TYPE ... ADD VALUE.
+ENUM_COLUMNS = (
+    ('organizations', 'classification', 'classification', 'INTERNAL'),
+    ('contacts', 'classification', 'classification', 'INTERNAL'),
+    ('activities', 'classification', 'classification', 'INTERNAL'),
+    ('activities', 'activity_type', 'activity_type', None),
+    ('attachments', 'classification', 'classification', 'INTERNAL'),
+    ('events', 'classification', 'classification', 'INTERNAL'),
+    # Partitioned; the type change and the constraint propagate to the partitions
+    ('audit_log', 'action', 'audit_action', None),
+)
+
+
+def _labels(type_name: str) -> str:
+    return ', '.join(f"'{v}'" for v in ENUM_TYPES[type_name])
+
+
+def upgrade() -> None:
+    for table, column, type_name, default in ENUM_COLUMNS:
+        if default is not None:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT')
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar(32) USING {column}::text')
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'")
+        op.create_check_constraint(f'ck_{table}_{column}', table, f'{column} IN ({_labels(type_name)})')
+
+    for type_name in ENUM_TYPES:
+        op.execute(f'DROP TYPE {type_name}')
+
+
+def downgrade() -> None:
+    for type_name in ENUM_TYPES:
+        op.execute(f'CREATE TYPE {type_name} AS ENUM ({_labels(type_name)})')
+
+    for table, column, type_name, default in reversed(ENUM_COLUMNS):
+        op.drop_constraint(f'ck_{table}_{column}', table, type_='check')
+        if default is not None:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT')
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} USING {column}::{type_name}'
+        )
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'")
@@ -0,0 +1,42 @@
+"""(tag_id, tagged_at DESC) indexes for reverse lookups on tag link tables
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, entity column). The primary keys lead with the entity column, so
+# "entities tagged X, newest first" had no usable index; INCLUDE-ing the
+# entity id makes it an index-only scan.
+TAG_LINK_TABLES = (
+    ('contact_tags', 'contact_id'),
+    ('organization_tags', 'organization_id'),
+    ('activity_tags', 'activity_id'),
+    ('event_tags', 'event_id'),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY so existing tables stay writable; it can't run in a transaction
+    with context.get_context().autocommit_block():
+        for table, entity_column in TAG_LINK_TABLES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_tag_recent "
+                f"ON {table} (tag_id, tagged_at DESC) INCLUDE ({entity_column})"
+            )
+
+
+def downgrade() -> None:
+    with context.get_context().autocommit_block():
+        for table, _ in TAG_LINK_TABLES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_tag_recent")
@@ -0,0 +1,71 @@
+"""Store event_versions.snapshot as MessagePack bytea instead of JSONB
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import msgpack
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def _copy_snapshots(old_type, new_type, convert) -> None:
+    """Fill snapshot_new from snapshot, BATCH_SIZE rows at a time.
+
+    Snapshots are plain JSON values, so they convert losslessly both ways.
+    """
+    event_versions = sa.table(
+        'event_versions',
+        sa.column('id', postgresql.UUID(as_uuid=True)),
+        sa.column('snapshot', old_type),
+        sa.column('snapshot_new', new_type),
+    )
+    update = (
+        event_versions.update()
+        .where(event_versions.c.id == sa.bindparam('_id'))
+        .values(snapshot_new=sa.bindparam('_snapshot'))
+    )
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        stmt = (
+            sa.select(event_versions.c.id, event_versions.c.snapshot)
+            .order_by(event_versions.c.id)
+            .limit(BATCH_SIZE)
+        )
+        if last_id is not None:
+            stmt = stmt.where(event_versions.c.id > last_id)
+        rows = bind.execute(stmt).all()
+        if not rows:
+            break
+        bind.execute(update, [{'_id': id_, '_snapshot': convert(snapshot)} for id_, snapshot in rows])
+        last_id = rows[-1][0]
+
+
+def _swap_in_new_column() -> None:
+    op.drop_column('event_versions', 'snapshot')
+    op.alter_column('event_versions', 'snapshot_new', new_column_name='snapshot', nullable=False)
+
+
+def upgrade() -> None:
+    op.add_column('event_versions', sa.Column('snapshot_new', sa.LargeBinary(), nullable=True))
+    _copy_snapshots(postgresql.JSONB(), sa.LargeBinary(), msgpack.packb)
+    _swap_in_new_column()
+
+
+def downgrade() -> None:
+    op.add_column('event_versions', sa.Column('snapshot_new', postgresql.JSONB(), nullable=True))
+    _copy_snapshots(sa.LargeBinary(), postgresql.JSONB(), msgpack.unpackb)
+    _swap_in_new_column()
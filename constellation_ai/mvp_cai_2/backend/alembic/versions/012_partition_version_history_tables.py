@@ -0,0 +1,161 @@
+"""Range-partition event_versions and pipeline_stage_history by month
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months of partitions created ahead of the current one, as in revision 001
+PARTITION_MONTHS = 24
+
+# Foreign keys as (table, column, referenced table), recreated on the new
+# tables. Postgres can't add NOT VALID FKs to partitioned tables, so these are
+# added already validated.
+FOREIGN_KEYS = (
+    ('event_versions', 'event_id', 'events'),
+    ('event_versions', 'changed_by', 'users'),
+    ('pipeline_stage_history', 'pipeline_item_id', 'pipeline_items'),
+    ('pipeline_stage_history', 'changed_by_id', 'users'),
+)
+DEFERRED_REFERENCES = {'users', 'organizations'}
+
+# The new tables' id default. Revision 001 defines this function too, but
+# databases migrated to 003 before it did don't have it, so define it here
+# as well (same body as 001 and app.database).
+UUID_GENERATE_V7 = """
+DO $$ BEGIN
+IF current_setting('server_version_num')::int >= 180000 THEN
+    CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid
+    LANGUAGE sql VOLATILE AS 'SELECT uuidv7()';
+ELSE
+    CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid
+    LANGUAGE sql VOLATILE AS $fn$
+        SELECT encode(
+            set_bit(set_bit(
+                overlay(uuid_send(gen_random_uuid())
+                        placing substring(int8send((extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                        FROM 1 FOR 6),
+            52, 1), 53, 1),
+            'hex')::uuid
+    $fn$;
+END IF;
+END $$
+"""
+
+# (table, BRIN index from revision 008)
+BRIN_INDEXES = {
+    'event_versions': 'ix_event_versions_changed_brin',
+    'pipeline_stage_history': 'ix_pipeline_stage_history_changed_brin',
+}
+
+
+def _columns(table: str) -> list[sa.Column]:
+    if table == 'event_versions':
+        return [
+            sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
+            sa.Column('event_id', postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column('version_number', sa.Integer(), nullable=False),
+            sa.Column('snapshot', sa.LargeBinary(), nullable=False),
+            sa.Column('changed_by', postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        ]
+    return [
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False),
+        sa.Column('pipeline_item_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('from_stage', sa.SmallInteger(), nullable=True),
+        sa.Column('to_stage', sa.SmallInteger(), nullable=False),
+        sa.Column('from_status', sa.String(20), nullable=True),
+        sa.Column('to_status', sa.String(20), nullable=False),
+        sa.Column('changed_by_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('note', sa.Text(), nullable=True),
+        sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    ]
+
+
+def _add_foreign_keys(table: str) -> None:
+    clauses = []
+    for fk_table, column, referenced in FOREIGN_KEYS:
+        if fk_table != table:
+            continue
+        deferred = " DEFERRABLE INITIALLY DEFERRED" if referenced in DEFERRED_REFERENCES else ""
+        clauses.append(
+            f"ADD CONSTRAINT {table}_{column}_fkey FOREIGN KEY ({column}) "
+            f"REFERENCES {referenced} (id){deferred}"
+        )
+    op.execute(f"ALTER TABLE {table} " + ", ".join(clauses))
+
+
+def _create_monthly_partitions(table: str, start: date) -> None:
+    """Monthly partitions from ``start`` through PARTITION_MONTHS past today, plus a default.
+
+    Later months are added by app.database.create_upcoming_partitions at startup.
+    """
+    start = start.replace(day=1)
+    last = date.today().replace(day=1)
+    for _ in range(PARTITION_MONTHS):
+        last = date(last.year + last.month // 12, last.month % 12 + 1, 1)
+    while start < last:
+        end = date(start.year + start.month // 12, start.month % 12 + 1, 1)
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS {table}_y{start.year}m{start.month:02d} "
+            f"PARTITION OF {table} FOR VALUES FROM ('{start}') TO ('{end}')"
+        )
+        start = end
+    op.execute(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT")
+
+
+def _move_aside(table: str) -> str:
+    """Rename ``table`` out of the way, freeing its index names."""
+    old = f"{table}_old"
+    op.execute(f"DROP INDEX IF EXISTS {BRIN_INDEXES[table]}")
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    op.execute(f"ALTER TABLE {old} RENAME CONSTRAINT {table}_pkey TO {old}_pkey")
+    return old
+
+
+def _finish(table: str, old: str) -> None:
+    names = ", ".join(c.name for c in _columns(table))
+    op.execute(f"INSERT INTO {table} ({names}) SELECT {names} FROM {old}")
+    op.execute(f"DROP TABLE {old}")
+    _add_foreign_keys(table)
+    op.execute(
+        f"CREATE INDEX {BRIN_INDEXES[table]} ON {table} "
+        f"USING BRIN (changed_at) WITH (pages_per_range = 32)"
+    )
+
+
+def upgrade() -> None:
+    op.execute(UUID_GENERATE_V7)
+    bind = op.get_bind()
+    for table in BRIN_INDEXES:
+        oldest = bind.scalar(sa.text(f"SELECT min(changed_at) FROM {table}"))
+        old = _move_aside(table)
+        op.create_table(
+            table,
+            *_columns(table),
+            # The partition key must be part of the primary key
+            sa.PrimaryKeyConstraint('id', 'changed_at'),
+            postgresql_partition_by='RANGE (changed_at)',
+        )
+        _create_monthly_partitions(table, oldest.date() if oldest else date.today())
+        _finish(table, old)
+
+
+def downgrade() -> None:
+    for table in BRIN_INDEXES:
+        old = _move_aside(table)
+        op.create_table(table, *_columns(table), sa.PrimaryKeyConstraint('id'))
+        _finish(table, old)
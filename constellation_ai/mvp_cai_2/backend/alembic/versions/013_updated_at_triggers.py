@@ -0,0 +1,54 @@
+"""Maintain updated_at with a BEFORE UPDATE trigger
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables with an updated_at column; the models map it with server_onupdate
+UPDATED_AT_TABLES = (
+    'users',
+    'organizations',
+    'contacts',
+    'tag_sets',
+    'tags',
+    'activities',
+    'followups',
+    'events',
+    'pipeline_items',
+)
+
+# Kept in sync with SET_UPDATED_AT in app/database.py
+SET_UPDATED_AT = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.updated_at := now();
+    RETURN NEW;
+END $$
+"""
+
+
+def upgrade() -> None:
+    op.execute(SET_UPDATED_AT)
+    for table in UPDATED_AT_TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(UPDATED_AT_TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
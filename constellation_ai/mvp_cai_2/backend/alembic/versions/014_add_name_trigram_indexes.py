@@ -0,0 +1,44 @@
+"""Trigram GIN indexes on lower(name) for organization and tag lookups
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, column). Name searches filter on
+# lower(column) LIKE '%term%', which no btree can serve; a gin_trgm_ops index on
+# the same expression can. short_name sits in the same OR as name, so it needs
+# one too for the planner to use either.
+TRIGRAM_INDEXES = (
+    ('ix_organizations_name_trgm', 'organizations', 'name'),
+    ('ix_organizations_short_name_trgm', 'organizations', 'short_name'),
+    ('ix_tags_value_trgm', 'tags', 'value'),
+)
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # CONCURRENTLY so existing tables stay writable; it can't run in a transaction
+    with context.get_context().autocommit_block():
+        for name, table, column in TRIGRAM_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin (lower({column}) gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    with context.get_context().autocommit_block():
+        for name, _, _ in TRIGRAM_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    # The extension is left installed; other objects may depend on it
@@ -0,0 +1,70 @@
+"""Drop is_deleted from events, organizations and pipeline_items; deleted_at alone marks soft deletes
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('events', 'organizations', 'pipeline_items')
+
+# (name, table, index definition including any INCLUDE/WITH, extra predicate).
+# Every partial index on these tables filters out soft-deleted rows, so all of
+# them are dropped with is_deleted and rebuilt on deleted_at.
+LIVE_ROW_INDEXES = (
+    ('ix_events_active_owner_occurred', 'events', '(owner_id, occurred_at)', None),
+    ('ix_events_active_class_occurred', 'events', '(classification, occurred_at)', None),
+    ('ix_organizations_active_owner', 'organizations', '(owner_id)', None),
+    ('ix_organizations_active_class_name', 'organizations', '(classification, name)', None),
+    ('ix_pipeline_items_owner_stage', 'pipeline_items', '(owner_id, stage)', None),
+    ('ix_pipeline_items_active_status_changed', 'pipeline_items',
+     '(status, last_stage_change_at) INCLUDE (stage, owner_id)', None),
+    ('uq_pipeline_org_active', 'pipeline_items',
+     '(organization_id) INCLUDE (stage, owner_id, last_stage_change_at) WITH (fillfactor = 90)',
+     "status IN ('ACTIVE', 'BACK_BURNER')"),
+)
+
+
+def _create_indexes(live_predicate: str) -> None:
+    for name, table, definition, extra in LIVE_ROW_INDEXES:
+        unique = 'UNIQUE ' if name.startswith('uq_') else ''
+        predicate = f'{extra} AND {live_predicate}' if extra else live_predicate
+        op.execute(f'CREATE {unique}INDEX {name} ON {table} {definition} WHERE {predicate}')
+
+
+def _drop_indexes() -> None:
+    for name, _, _, _ in LIVE_ROW_INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+def upgrade() -> None:
+    _drop_indexes()
+    for table in TABLES:
+        # Rows flagged without a timestamp would otherwise come back to life
+        op.execute(
+            f'UPDATE {table} SET deleted_at = coalesce(updated_at, now()) '
+            f'WHERE is_deleted AND deleted_at IS NULL'
+        )
+        op.drop_column(table, 'is_deleted')
+    _create_indexes('deleted_at IS NULL')
+
+
+def downgrade() -> None:
+    _drop_indexes()
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column('is_deleted', sa.Boolean(), nullable=False, server_default='false'),
+        )
+        op.execute(f'UPDATE {table} SET is_deleted = true WHERE deleted_at IS NOT NULL')
+    _create_indexes('is_deleted = false')
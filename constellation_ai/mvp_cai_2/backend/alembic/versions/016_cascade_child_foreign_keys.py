@@ -0,0 +1,58 @@
+"""ON DELETE CASCADE on child rows owned by events, organizations, contacts, activities and pipeline items
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referenced table). The parent relationships are mapped with
+# passive_deletes=True, so deleting a parent is one DELETE and Postgres removes
+# the children instead of the ORM selecting and deleting them one by one.
+CASCADE_FOREIGN_KEYS = (
+    ('event_attendees', 'event_id', 'events'),
+    ('event_pitches', 'event_id', 'events'),
+    ('event_tags', 'event_id', 'events'),
+    ('event_versions', 'event_id', 'events'),
+    ('organization_tags', 'organization_id', 'organizations'),
+    ('contact_tags', 'contact_id', 'contacts'),
+    ('activity_attendees', 'activity_id', 'activities'),
+    ('activity_tags', 'activity_id', 'activities'),
+    ('pipeline_stage_history', 'pipeline_item_id', 'pipeline_items'),
+)
+DEFERRED_REFERENCES = {'organizations'}
+# Postgres can't add NOT VALID FKs to partitioned tables
+PARTITIONED_TABLES = {'event_versions', 'pipeline_stage_history'}
+
+
+def _replace_foreign_keys(on_delete: str) -> None:
+    for table, column, referenced in CASCADE_FOREIGN_KEYS:
+        name = f'{table}_{column}_fkey'
+        deferred = ' DEFERRABLE INITIALLY DEFERRED' if referenced in DEFERRED_REFERENCES else ''
+        not_valid = '' if table in PARTITIONED_TABLES else ' NOT VALID'
+        op.execute(
+            f'ALTER TABLE {table} DROP CONSTRAINT {name}, '
+            f'ADD CONSTRAINT {name} FOREIGN KEY ({column}) REFERENCES {referenced} (id)'
+            f'{on_delete}{deferred}{not_valid}'
+        )
+        if not_valid:
+            # Existing rows already satisfied the old constraint; validating
+            # separately avoids holding the stronger lock for the scan
+            op.execute(f'ALTER TABLE {table} VALIDATE CONSTRAINT {name}')
+
+
+def upgrade() -> None:
+    _replace_foreign_keys(' ON DELETE CASCADE')
+
+
+def downgrade() -> None:
+    _replace_foreign_keys('')
@@ -0,0 +1,59 @@
+"""(parent id, version_number) indexes on activity_versions and event_versions
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, parent id column). New versions are numbered with
+# max(version_number) + 1 for their parent, which without these scans every
+# monthly partition.
+VERSION_INDEXES = (
+    ('ix_activity_versions_activity_version', 'activity_versions', 'activity_id'),
+    ('ix_event_versions_event_version', 'event_versions', 'event_id'),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    partitions_by_index = {}
+    for name, table, column in VERSION_INDEXES:
+        # Both tables are partitioned, which CREATE INDEX CONCURRENTLY can't
+        # handle directly: create the parent index invalid and empty, build
+        # each partition's index concurrently, then attach them, which marks
+        # the parent index valid once every partition has one.
+        op.execute(f'CREATE INDEX IF NOT EXISTS {name} ON ONLY {table} ({column}, version_number)')
+        partitions_by_index[name] = bind.scalars(
+            sa.text(
+                'SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid '
+                'WHERE i.inhparent = CAST(:table AS regclass) ORDER BY c.relname'
+            ),
+            {'table': table},
+        ).all()
+
+    with context.get_context().autocommit_block():
+        for name, _, column in VERSION_INDEXES:
+            for partition in partitions_by_index[name]:
+                partition_index = f'{partition}_{column}_version_idx'
+                op.execute(
+                    f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition_index} '
+                    f'ON {partition} ({column}, version_number)'
+                )
+                op.execute(f'ALTER INDEX {name} ATTACH PARTITION {partition_index}')
+
+
+def downgrade() -> None:
+    # Dropping the parent index drops the attached partition indexes with it
+    for name, _, _ in VERSION_INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {name}')
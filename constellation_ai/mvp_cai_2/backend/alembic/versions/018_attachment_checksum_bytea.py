@@ -0,0 +1,33 @@
+"""Store attachments.checksum as raw SHA-256 bytes instead of hex
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '018'
+down_revision: Union[str, None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Half the size of the hex string, and the blob services hash with digest()
+    op.execute(
+        "ALTER TABLE attachments "
+        "ALTER COLUMN checksum TYPE bytea USING decode(checksum, 'hex'), "
+        "ADD CONSTRAINT ck_attachments_checksum_len CHECK (octet_length(checksum) = 32)"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE attachments "
+        "DROP CONSTRAINT IF EXISTS ck_attachments_checksum_len, "
+        "ALTER COLUMN checksum TYPE varchar(64) USING encode(checksum, 'hex')"
+    )
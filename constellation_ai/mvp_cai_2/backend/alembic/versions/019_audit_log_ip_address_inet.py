@@ -0,0 +1,46 @@
+"""Store audit_log.ip_address as INET
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '019'
+down_revision: Union[str, None] = '018'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rows written before get_client_ip validated its input can hold whatever
+    # X-Forwarded-For said; those become NULL, as get_client_ip now does,
+    # rather than failing the cast
+    op.execute(
+        """
+        CREATE FUNCTION pg_temp.try_inet(value text) RETURNS inet
+        LANGUAGE plpgsql IMMUTABLE AS $$
+        BEGIN
+            RETURN nullif(value, '')::inet;
+        EXCEPTION WHEN invalid_text_representation THEN
+            RETURN NULL;
+        END $$
+        """
+    )
+    # On a partitioned audit_log the type change propagates to the partitions
+    op.execute(
+        "ALTER TABLE audit_log "
+        "ALTER COLUMN ip_address TYPE inet USING pg_temp.try_inet(ip_address)"
+    )
+    op.execute("DROP FUNCTION pg_temp.try_inet(text)")
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE audit_log "
+        "ALTER COLUMN ip_address TYPE varchar(45) USING host(ip_address)"
+    )
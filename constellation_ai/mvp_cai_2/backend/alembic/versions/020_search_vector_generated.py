@@ -0,0 +1,56 @@
+"""Make activities.search_vector and events.search_vector generated columns
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '020'
+down_revision: Union[str, None] = '019'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (GIN index, tsvector expression). Same text columns the routers
+# used to concatenate in _update_search_vector.
+SEARCH_VECTORS = {
+    'activities': (
+        'ix_activities_search_vector',
+        "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(summary, '') || ' ' "
+        "|| coalesce(key_points, '') || ' ' || coalesce(description, ''))",
+    ),
+    'events': (
+        'ix_events_search_vector',
+        "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, '') || ' ' "
+        "|| coalesce(notes, ''))",
+    ),
+}
+
+
+def _create_index(table: str, index: str) -> None:
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS {index} "
+        f"ON {table} USING GIN (search_vector) WITH (fastupdate = off)"
+    )
+
+
+def upgrade() -> None:
+    # An existing column can't be turned into a generated one, so drop it
+    # (taking its GIN index along) and add it back; the ADD rewrites the
+    # table and computes every row.
+    for table, (index, expression) in SEARCH_VECTORS.items():
+        op.execute(
+            f"ALTER TABLE {table} DROP COLUMN search_vector, "
+            f"ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({expression}) STORED"
+        )
+        _create_index(table, index)
+
+
+def downgrade() -> None:
+    # Back to a plain column, keeping the current values and the index
+    for table in SEARCH_VECTORS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN search_vector DROP EXPRESSION")
@@ -1,5 +1,9 @@
-from app.auth.entra import verify_token, get_token_from_header
-from app.auth.rbac import require_role, require_classification, can_access_classification
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.auth.entra import verify_token, get_token_from_header
+    from app.auth.rbac import require_role, require_classification, can_access_classification
 
 __all__ = [
     "verify_token",
@@ -8,3 +12,26 @@ __all__ = [
     "require_classification",
     "can_access_classification",
 ]
+
+# Re-exports are resolved on first access (PEP 562), so importing a submodule
+# such as app.auth.rbac doesn't also pull in entra's PyJWT/httpx stack.
+_EXPORTS = {
+    "verify_token": "app.auth.entra",
+    "get_token_from_header": "app.auth.entra",
+    "require_role": "app.auth.rbac",
+    "require_classification": "app.auth.rbac",
+    "can_access_classification": "app.auth.rbac",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,35 +1,188 @@
+import asyncio
+import base64
+import binascii
+import hashlib
+import logging
+import time
 import httpx
-from datetime import datetime, timedelta
+import orjson
 from typing import Any
-from jose import jwt, jwk, JWTError
+import jwt
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
 from fastapi import HTTPException, status
 
-from app.config import settings
+from app.config import settings, DEV_MODE, AZURE_CLIENT_ID, JWKS_URL, TOKEN_ISSUER
 
+logger = logging.getLogger(__name__)
 
-# Cache for JWKS
-_jwks_cache: dict[str, Any] | None = None
-_jwks_cache_time: datetime | None = None
-JWKS_CACHE_TTL = timedelta(hours=1)
+# Seconds, measured on time.monotonic() so wall-clock jumps can't expire the keys
+JWKS_CACHE_TTL = 3600.0
+# Floor between forced refreshes for unknown kids, so bogus tokens can't
+# turn every request into a JWKS fetch.
+JWKS_MIN_REFRESH_INTERVAL = 60.0
 
+# Cache of verified claims, keyed by a hash of the token (never the raw token).
+# Entries live until the token expires or CLAIMS_CACHE_TTL, whichever is sooner.
+_claims_cache: dict[str, tuple[dict[str, Any], float]] = {}
+CLAIMS_CACHE_TTL = 300.0
+CLAIMS_CACHE_MAX_SIZE = 10_000
 
-async def get_jwks() -> dict[str, Any]:
-    """Fetch and cache JWKS from Azure AD."""
-    global _jwks_cache, _jwks_cache_time
+# Shared client for Azure AD calls, so JWKS refreshes reuse a pooled
+# keep-alive connection instead of a fresh TCP+TLS handshake each time.
+# Installed by the app lifespan; created lazily if nothing set one.
+_http_client: httpx.AsyncClient | None = None
 
-    if _jwks_cache is not None and _jwks_cache_time is not None:
-        if datetime.utcnow() - _jwks_cache_time < JWKS_CACHE_TTL:
-            return _jwks_cache
 
-    jwks_url = f"https://login.microsoftonline.com/{settings.azure_tenant_id}/discovery/v2.0/keys"
+def set_http_client(client: httpx.AsyncClient | None) -> None:
+    global _http_client
+    _http_client = client
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(jwks_url)
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(timeout=5.0)
+    return _http_client
+
+
+def _token_cache_key(token: str) -> str:
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
+def _get_cached_claims(cache_key: str) -> dict[str, Any] | None:
+    entry = _claims_cache.get(cache_key)
+    if entry is None:
+        return None
+    claims, expires_at = entry
+    if time.time() >= expires_at:
+        _claims_cache.pop(cache_key, None)
+        return None
+    return claims
+
+
+def _cache_claims(cache_key: str, claims: dict[str, Any]) -> None:
+    now = time.time()
+    expires_at = min(float(claims.get("exp", now)), now + CLAIMS_CACHE_TTL)
+    if expires_at <= now:
+        return
+    if len(_claims_cache) >= CLAIMS_CACHE_MAX_SIZE:
+        # Drop expired entries first; if still full, evict the oldest insert
+        for key in [k for k, (_, exp) in _claims_cache.items() if exp <= now]:
+            del _claims_cache[key]
+        if len(_claims_cache) >= CLAIMS_CACHE_MAX_SIZE:
+            del _claims_cache[next(iter(_claims_cache))]
+    _claims_cache[cache_key] = (claims, expires_at)
+
+
+def clear_claims_cache() -> None:
+    """Forget all verified tokens (e.g. after the signing keys rotate)."""
+    _claims_cache.clear()
+
+
+class JwksCache:
+    """Signing keys from Azure AD's JWKS, indexed by kid.
+
+    Each RSA key is converted to a cryptography ``RSAPublicKey`` once per
+    fetch, not once per request. Refreshed in the background (see ``run_refresh_loop``)
+    well before it expires; if a refresh fails the previous key set keeps
+    being served.
+    """
+
+    def __init__(self, ttl: float = JWKS_CACHE_TTL):
+        self.ttl = ttl
+        self.keys_by_kid: dict[str, RSAPublicKey] = {}
+        self.fetched_at: float | None = None
+        self.expires_at = 0.0
+        # Single-flight: concurrent requests that find the keys stale wait
+        # for one fetch instead of each hitting Azure AD.
+        self._lock = asyncio.Lock()
+
+    def _age(self) -> float | None:
+        if self.fetched_at is None:
+            return None
+        return time.monotonic() - self.fetched_at
+
+    async def _fetch(self) -> dict[str, Any]:
+        response = await _get_http_client().get(JWKS_URL)
         response.raise_for_status()
-        _jwks_cache = response.json()
-        _jwks_cache_time = datetime.utcnow()
+        return response.json()
+
+    async def refresh(self) -> None:
+        """Fetch the JWKS, keeping the cached keys if the fetch fails."""
+        try:
+            jwks = await self._fetch()
+        # ValueError covers a 200 whose body isn't JSON (a proxy or HTML error page)
+        except (httpx.HTTPError, ValueError) as e:
+            if self.fetched_at is None:
+                raise
+            logger.warning(f"JWKS refresh failed, serving cached keys: {e}")
+            return
+
+        keys_by_kid = {}
+        for k in jwks.get("keys", []):
+            if "kid" not in k or k.get("kty") != "RSA":
+                continue
+            try:
+                keys_by_kid[k["kid"]] = jwt.algorithms.RSAAlgorithm.from_jwk(k)
+            except jwt.PyJWTError as e:
+                logger.warning(f"Skipping unusable JWKS key {k['kid']}: {e}")
+
+        if self.fetched_at is not None and keys_by_kid.keys() != self.keys_by_kid.keys():
+            # Keys rotated: claims verified against the old set must be re-checked
+            clear_claims_cache()
+        self.keys_by_kid = keys_by_kid
+        self.fetched_at = time.monotonic()
+        self.expires_at = self.fetched_at + self.ttl
+
+    async def get_key(self, kid: str) -> RSAPublicKey | None:
+        """Return the verification key for ``kid``, fetching the JWKS if needed.
+
+        An unknown kid (typically a freshly rotated key) forces one refresh,
+        rate-limited by JWKS_MIN_REFRESH_INTERVAL.
+        """
+        if time.monotonic() >= self.expires_at:
+            async with self._lock:
+                # Re-check: another request may have refreshed while we waited
+                if time.monotonic() >= self.expires_at:
+                    await self.refresh()
+
+        key = self.keys_by_kid.get(kid)
+        age = self._age()
+        if key is None and age is not None and age >= JWKS_MIN_REFRESH_INTERVAL:
+            async with self._lock:
+                key = self.keys_by_kid.get(kid)
+                age = self._age()
+                if key is None and age is not None and age >= JWKS_MIN_REFRESH_INTERVAL:
+                    await self.refresh()
+                    key = self.keys_by_kid.get(kid)
+        return key
 
-    return _jwks_cache
+    async def run_refresh_loop(self) -> None:
+        """Refresh every half TTL so request handlers never wait on Azure AD."""
+        while True:
+            await asyncio.sleep(self.ttl / 2)
+            try:
+                await self.refresh()
+            # Anything short of cancellation must not end the loop, or the keys
+            # would only ever be refreshed on demand from then on
+            except Exception as e:
+                logger.warning(f"JWKS refresh failed: {e}")
+
+
+jwks_cache = JwksCache()
+
+
+def _peek_kid(token: str) -> str | None:
+    """Read ``kid`` from the token header without PyJWT's full header parsing.
+
+    Falls back to ``jwt.get_unverified_header`` if the header doesn't decode.
+    """
+    header_b64 = token.split(".", 1)[0]
+    try:
+        header = orjson.loads(base64.urlsafe_b64decode(header_b64 + "=" * (-len(header_b64) % 4)))
+        return header.get("kid")
+    except (binascii.Error, ValueError, AttributeError):
+        return jwt.get_unverified_header(token).get("kid")
 
 
 def get_token_from_header(authorization: str | None) -> str:
@@ -55,7 +208,7 @@ def get_token_from_header(authorization: str | None) -> str:
 async def verify_token(token: str) -> dict[str, Any]:
     """Verify JWT token from Azure AD."""
     # In dev mode, return mock claims
-    if settings.dev_mode:
+    if DEV_MODE:
         return {
             "oid": "dev-user-id",
             "preferred_username": settings.dev_user_email,
@@ -63,10 +216,15 @@ async def verify_token(token: str) -> dict[str, Any]:
             "email": settings.dev_user_email,
         }
 
+    # Tokens are reused across many requests; skip signature verification on a hit
+    cache_key = _token_cache_key(token)
+    cached = _get_cached_claims(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        # Get unverified header to find the key id
-        unverified_header = jwt.get_unverified_header(token)
-        kid = unverified_header.get("kid")
+        # Get the key id from the unverified header
+        kid = _peek_kid(token)
 
         if not kid:
             raise HTTPException(
@@ -74,35 +232,36 @@ async def verify_token(token: str) -> dict[str, Any]:
                 detail="Token missing key id",
             )
 
-        # Get JWKS and find the matching key
-        jwks = await get_jwks()
-        key = None
-        for k in jwks.get("keys", []):
-            if k.get("kid") == kid:
-                key = k
-                break
-
-        if not key:
+        # Look up the (already constructed) public key for this kid
+        try:
+            public_key = await jwks_cache.get_key(kid)
+        except (httpx.HTTPError, ValueError) as e:
+            # Only reachable with nothing cached (the warm-up fetch failed too):
+            # the token may be fine, we just can't check it yet
+            logger.warning(f"JWKS unavailable, cannot verify token: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Token signing keys unavailable",
+            )
+        if public_key is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Token signing key not found",
             )
 
-        # Construct the public key
-        public_key = jwk.construct(key)
-
         # Verify and decode the token
         claims = jwt.decode(
             token,
             public_key,
             algorithms=["RS256"],
-            audience=settings.azure_client_id,
-            issuer=f"https://login.microsoftonline.com/{settings.azure_tenant_id}/v2.0",
+            audience=AZURE_CLIENT_ID,
+            issuer=TOKEN_ISSUER,
         )
 
+        _cache_claims(cache_key, claims)
         return claims
 
-    except JWTError as e:
+    except jwt.PyJWTError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Token validation failed: {str(e)}",
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Callable
 from fastapi import HTTPException, status, Depends
 
@@ -17,22 +18,32 @@ ROLE_HIERARCHY = {
 # INTERNAL: all roles
 # CONFIDENTIAL: ANALYST, MANAGER, ADMIN
 # RESTRICTED: ADMIN only (for v1)
-CLASSIFICATION_ACCESS = {
-    Classification.INTERNAL: [UserRole.VIEWER, UserRole.ANALYST, UserRole.MANAGER, UserRole.ADMIN],
-    Classification.CONFIDENTIAL: [UserRole.ANALYST, UserRole.MANAGER, UserRole.ADMIN],
-    Classification.RESTRICTED: [UserRole.ADMIN],
+CLASSIFICATION_ACCESS: dict[Classification, frozenset[UserRole]] = {
+    Classification.INTERNAL: frozenset({UserRole.VIEWER, UserRole.ANALYST, UserRole.MANAGER, UserRole.ADMIN}),
+    Classification.CONFIDENTIAL: frozenset({UserRole.ANALYST, UserRole.MANAGER, UserRole.ADMIN}),
+    Classification.RESTRICTED: frozenset({UserRole.ADMIN}),
+}
+
+# Inverse of CLASSIFICATION_ACCESS: the classifications each role can see
+ROLE_CLASSIFICATIONS: dict[UserRole, tuple[Classification, ...]] = {
+    role: tuple(c for c, roles in CLASSIFICATION_ACCESS.items() if role in roles)
+    for role in UserRole
 }
 
 
 def can_access_classification(user_role: UserRole, classification: Classification) -> bool:
     """Check if a user role can access a given classification level."""
-    return user_role in CLASSIFICATION_ACCESS.get(classification, [])
+    return user_role in CLASSIFICATION_ACCESS.get(classification, frozenset())
 
 
+@lru_cache(maxsize=64)
 def require_role(*roles: UserRole) -> Callable:
     """
     Dependency factory that checks if the current user has one of the required roles.
 
+    Memoized, so the same roles always give the same checker and FastAPI's
+    per-request dependency cache can reuse its result.
+
     Usage:
         @router.get("/admin-only")
         async def admin_endpoint(current_user = Depends(require_role(UserRole.ADMIN))):
@@ -51,9 +62,11 @@ def require_role(*roles: UserRole) -> Callable:
     return role_checker
 
 
+@lru_cache(maxsize=64)
 def require_classification(classification: Classification) -> Callable:
     """
     Dependency factory that checks if the current user can access a classification level.
+    Memoized like require_role.
 
     Usage:
         @router.get("/confidential")
@@ -73,13 +86,9 @@ def require_classification(classification: Classification) -> Callable:
     return classification_checker
 
 
-def filter_by_classification(user: User) -> list[Classification]:
+def filter_by_classification(user: User) -> tuple[Classification, ...]:
     """
-    Return the list of classifications a user can access.
+    Return the classifications a user can access.
     Used to filter query results.
     """
-    accessible = []
-    for classification, roles in CLASSIFICATION_ACCESS.items():
-        if user.role in roles:
-            accessible.append(classification)
-    return accessible
+    return ROLE_CLASSIFICATIONS[user.role]
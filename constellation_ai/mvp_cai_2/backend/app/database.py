@@ -1,13 +1,65 @@
+import asyncio
+import logging
+import os
+import time
+import uuid
+from datetime import date
+
+import msgpack
+import orjson
+from sqlalchemy import DDL, LargeBinary, TypeDecorator, event, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import settings
 
 
+logger = logging.getLogger(__name__)
+
+
+def json_dumps(value) -> str:
+    """JSON/JSONB serializer; orjson handles datetime, UUID and enums natively."""
+    return orjson.dumps(value).decode()
+
+
+def _msgpack_default(value):
+    # Match the JSON forms orjson gives the same values
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__} to MessagePack")
+
+
+class MsgPack(TypeDecorator):
+    """A dict stored as MessagePack in a bytea column.
+
+    For write-once snapshots that are never filtered by JSON path: smaller
+    than JSONB on disk and no server-side JSONB parsing on read.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return msgpack.packb(value, default=_msgpack_default)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return msgpack.unpackb(value)
+
+
 engine = create_async_engine(
     settings.database_url,
     echo=False,
     pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    json_serializer=json_dumps,
+    json_deserializer=orjson.loads,
 )
 
 async_session_factory = async_sessionmaker(
@@ -21,9 +73,118 @@ class Base(DeclarativeBase):
     pass
 
 
-async def get_db() -> AsyncSession:
-    async with async_session_factory() as session:
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7): 48-bit ms timestamp, then random bits.
+
+    New primary keys land at the right edge of the btree instead of at random leaf pages.
+    Only for ids needed before the INSERT; otherwise let the uuid_generate_v7()
+    server default fill the key and read it back via RETURNING.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+# Server-side counterpart used by the id server defaults (uuidv7() is built in from PG 18).
+# Kept in sync with the definition in alembic revision 001.
+UUID_GENERATE_V7 = DDL(
+    """
+    DO $$ BEGIN
+    IF current_setting('server_version_num')::int >= 180000 THEN
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid
+        LANGUAGE sql VOLATILE AS 'SELECT uuidv7()';
+    ELSE
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid
+        LANGUAGE sql VOLATILE AS $fn$
+            SELECT encode(
+                set_bit(set_bit(
+                    overlay(uuid_send(gen_random_uuid())
+                            placing substring(int8send((extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                            FROM 1 FOR 6),
+                52, 1), 53, 1),
+                'hex')::uuid
+        $fn$;
+    END IF;
+    END $$
+    """
+)
+event.listen(Base.metadata, "before_create", UUID_GENERATE_V7)
+
+# gin_trgm_ops for the name search indexes (alembic revision 014)
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+# updated_at is maintained by a BEFORE UPDATE trigger rather than an ORM onupdate, so
+# flushes don't render it into every UPDATE and raw SQL updates bump it as well.
+# Kept in sync with alembic revision 013.
+SET_UPDATED_AT = DDL(
+    """
+    CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.updated_at := now();
+        RETURN NEW;
+    END $$
+    """
+)
+event.listen(Base.metadata, "before_create", SET_UPDATED_AT)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_updated_at_triggers(target, connection, **kw) -> None:
+    for table in kw["tables"]:
+        if "updated_at" in table.c:
+            connection.exec_driver_sql(
+                f"CREATE TRIGGER {table.name}_set_updated_at BEFORE UPDATE ON {table.name} "
+                f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+            )
+
+
+# Months of partitions kept ahead of the current one, as in alembic revisions 001 and 012
+PARTITION_MONTHS = 24
+PARTITION_CHECK_INTERVAL = 24 * 60 * 60
+
+
+async def create_upcoming_partitions(months: int = PARTITION_MONTHS) -> None:
+    """Create any missing monthly partitions from this month through `months` ahead.
+
+    The migrations only create partitions up to 24 months past the date they ran;
+    after that every row would land in the DEFAULT partition, and a month can't be
+    split back out of DEFAULT without moving its rows. Covers every range-partitioned
+    table in the schema, so it is a no-op on a create_all schema.
+    """
+    async with engine.begin() as conn:
+        # Serialize with other workers starting at the same time
+        await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('create_upcoming_partitions'))"))
+        tables = (
+            await conn.execute(
+                text(
+                    "SELECT c.relname FROM pg_partitioned_table p "
+                    "JOIN pg_class c ON c.oid = p.partrelid "
+                    "WHERE c.relnamespace = current_schema()::regnamespace AND p.partstrat = 'r'"
+                )
+            )
+        ).scalars().all()
+        for table in tables:
+            start = date.today().replace(day=1)
+            for _ in range(months):
+                end = date(start.year + start.month // 12, start.month % 12 + 1, 1)
+                await conn.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {table}_y{start.year}m{start.month:02d} "
+                        f"PARTITION OF {table} FOR VALUES FROM ('{start}') TO ('{end}')"
+                    )
+                )
+                start = end
+
+
+async def run_partition_loop(interval: float = PARTITION_CHECK_INTERVAL) -> None:
+    """Keep partitions ahead of the calendar for as long as the app runs."""
+    while True:
         try:
-            yield session
-        finally:
-            await session.close()
+            await create_upcoming_partitions()
+        # Anything short of cancellation must not end the loop
+        except Exception as e:
+            logger.warning(f"Creating upcoming partitions failed: {e}")
+        await asyncio.sleep(interval)
+
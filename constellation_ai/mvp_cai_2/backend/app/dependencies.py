@@ -1,3 +1,5 @@
+import ipaddress
+import time
 from typing import Annotated
 from uuid import UUID
 from fastapi import Depends, HTTPException, Header, Request, status
@@ -5,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.database import async_session_factory
-from app.config import settings
+from app.config import DEV_MODE
 from app.auth.entra import verify_token, get_token_from_header
 from app.models.user import User, UserRole
 
@@ -13,25 +15,41 @@ from app.models.user import User, UserRole
 async def get_db() -> AsyncSession:
     """Dependency to get database session."""
     async with async_session_factory() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 
-async def get_current_user(
-    request: Request,
-    authorization: Annotated[str | None, Header()] = None,
-    db: AsyncSession = Depends(get_db),
-) -> User:
-    """
-    Dependency to get the current authenticated user.
-    Auto-provisions new users on first login.
-    """
-    # Get and verify token
-    token = get_token_from_header(authorization)
-    claims = await verify_token(token)
+# In dev mode every request resolves to the same user; remember its id so
+# later requests do a primary-key get instead of the claims lookup.
+_dev_user_id: UUID | None = None
+
+# Recently resolved users: entra_object_id -> (user id, expires_at). Only the
+# id is cached; the row is re-read by primary key, so role and is_active
+# changes still apply on the next request and nothing needs invalidating.
+_user_id_cache: dict[str, tuple[UUID, float]] = {}
+USER_CACHE_TTL = 60.0
+USER_CACHE_MAX_SIZE = 5_000
 
+
+def _get_cached_user_id(entra_object_id: str) -> UUID | None:
+    entry = _user_id_cache.get(entra_object_id)
+    if entry is None:
+        return None
+    user_id, expires_at = entry
+    if time.monotonic() >= expires_at:
+        _user_id_cache.pop(entra_object_id, None)
+        return None
+    return user_id
+
+
+def _cache_user_id(entra_object_id: str, user_id: UUID) -> None:
+    if len(_user_id_cache) >= USER_CACHE_MAX_SIZE:
+        # Every entry has the same TTL, so the oldest insert expires first
+        del _user_id_cache[next(iter(_user_id_cache))]
+    _user_id_cache[entra_object_id] = (user_id, time.monotonic() + USER_CACHE_TTL)
+
+
+async def _user_from_claims(db: AsyncSession, claims: dict) -> User:
+    """Look up the user for verified token claims, provisioning on first login."""
     # Extract user info from claims
     entra_object_id = claims.get("oid")
     email = claims.get("preferred_username") or claims.get("email")
@@ -43,14 +61,18 @@ async def get_current_user(
             detail="Could not extract email from token",
         )
 
-    # Try to find existing user by entra_object_id or email
-    query = select(User).where(
-        (User.entra_object_id == entra_object_id) | (User.email == email)
-    )
-    result = await db.execute(query)
-    user = result.scalar_one_or_none()
-
-    # Auto-provision new user
+    # Look up by entra_object_id first (unique index point lookup); fall back
+    # to email for users created before their first login (e.g. via seed)
+    user = None
+    if entra_object_id:
+        result = await db.execute(select(User).where(User.entra_object_id == entra_object_id))
+        user = result.scalar_one_or_none()
+    if user is None:
+        result = await db.execute(select(User).where(User.email == email))
+        user = result.scalar_one_or_none()
+
+    # Only the provision and link paths write; an already-linked user is a
+    # read and is returned without committing
     if not user:
         user = User(
             entra_object_id=entra_object_id,
@@ -61,12 +83,45 @@ async def get_current_user(
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
     elif user.entra_object_id is None and entra_object_id:
         # Update entra_object_id if it was missing (e.g., user was created via seed)
         user.entra_object_id = entra_object_id
         await db.commit()
 
+    return user
+
+
+async def get_current_user(
+    request: Request,
+    authorization: Annotated[str | None, Header()] = None,
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """
+    Dependency to get the current authenticated user.
+    Auto-provisions new users on first login.
+    """
+    global _dev_user_id
+
+    token = get_token_from_header(authorization)
+
+    user = None
+    if DEV_MODE and _dev_user_id is not None:
+        # None if the row is gone (e.g. database was reset); resolve it again below
+        user = await db.get(User, _dev_user_id)
+
+    if user is None:
+        claims = await verify_token(token)
+        entra_object_id = claims.get("oid")
+        if entra_object_id and (cached_id := _get_cached_user_id(entra_object_id)):
+            user = await db.get(User, cached_id)
+
+        if user is None:
+            user = await _user_from_claims(db, claims)
+            if DEV_MODE:
+                _dev_user_id = user.id
+            elif user.entra_object_id:
+                _cache_user_id(user.entra_object_id, user.id)
+
     # Check if user is active
     if not user.is_active:
         raise HTTPException(
@@ -95,21 +150,31 @@ async def get_optional_user(
         return None
 
 
+def _parse_ip(value: str) -> str | None:
+    """Normalize an IP address string, or None if it isn't one (audit_log.ip_address is INET)."""
+    try:
+        return str(ipaddress.ip_address(value))
+    except ValueError:
+        return None
+
+
 def get_client_ip(request: Request) -> str | None:
     """Extract client IP address from request."""
     # Check for forwarded headers (if behind a proxy)
     forwarded = request.headers.get("x-forwarded-for")
     if forwarded:
-        return forwarded.split(",")[0].strip()
+        # Only the first hop (the client) matters; don't split the whole chain
+        first_hop, _, _ = forwarded.partition(",")
+        return _parse_ip(first_hop.strip())
 
     # Check for real IP header
     real_ip = request.headers.get("x-real-ip")
     if real_ip:
-        return real_ip
+        return _parse_ip(real_ip)
 
     # Fall back to direct client
     if request.client:
-        return request.client.host
+        return _parse_ip(request.client.host)
 
     return None
 
@@ -1,8 +1,13 @@
+import asyncio
+import logging
+import httpx
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.auth.entra import jwks_cache, set_http_client
 from app.config import settings
+from app.database import run_partition_loop
 from app.routers import (
     health,
     users,
@@ -21,11 +26,38 @@ from app.routers import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    app.state.http_client = httpx.AsyncClient(
+        timeout=5.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
+    set_http_client(app.state.http_client)
+
+    refresh_task = None
+    if not settings.dev_mode:
+        # Warm the JWKS so the first request doesn't pay for the fetch, then keep it fresh
+        try:
+            await jwks_cache.refresh()
+        except Exception as e:
+            logger.warning(f"Initial JWKS fetch failed, will retry on demand: {e}")
+        refresh_task = asyncio.create_task(jwks_cache.run_refresh_loop())
+
+    # Add next months' partitions now and daily, so rows never spill into DEFAULT
+    partition_task = asyncio.create_task(run_partition_loop())
+
     yield
+
     # Shutdown
+    partition_task.cancel()
+    if refresh_task is not None:
+        refresh_task.cancel()
+    set_http_client(None)
+    await app.state.http_client.aclose()
 
 
 app = FastAPI(
@@ -40,8 +72,10 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists: preflights become set lookups, and nothing beyond what
+    # the frontend sends is allowed
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With"],
 )
 
 # Include routers
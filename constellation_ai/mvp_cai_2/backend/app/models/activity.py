@@ -1,8 +1,9 @@
 import enum
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, Boolean, Enum, DateTime, Integer, ForeignKey, func, Index
+from sqlalchemy import String, Text, Boolean, Enum, DateTime, Integer, ForeignKey, FetchedValue, func, CheckConstraint, Index, Computed, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -20,18 +21,46 @@ class ActivityType(str, enum.Enum):
 
 class Activity(Base):
     __tablename__ = "activities"
+    # id and the timestamps come back via RETURNING on INSERT/UPDATE, so
+    # create/update can build their response without a refresh
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
-        Index("ix_activities_search_vector", "search_vector", postgresql_using="gin"),
+        CheckConstraint(
+            "activity_type IN ('MEETING', 'CALL', 'EMAIL', 'NOTE', 'LLM_INTERACTION', 'SLACK_NOTE')",
+            name="ck_activities_activity_type",
+        ),
+        CheckConstraint(
+            "classification IN ('INTERNAL', 'CONFIDENTIAL', 'RESTRICTED')",
+            name="ck_activities_classification",
+        ),
+        Index(
+            "ix_activities_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_with={"fastupdate": "off"},
+        ),
+        # List endpoints only ever read non-deleted rows
+        Index(
+            "ix_activities_active_owner_occurred",
+            "owner_id",
+            "occurred_at",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_activities_active_class_occurred",
+            "classification",
+            "occurred_at",
+            postgresql_where=text("is_deleted = false"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=func.gen_random_uuid(),
+        server_default=func.uuid_generate_v7(),
     )
     activity_type: Mapped[ActivityType] = mapped_column(
-        Enum(ActivityType, name="activity_type"),
+        Enum(ActivityType, native_enum=False, length=32, validate_strings=True),
         nullable=False,
     )
     title: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -41,19 +70,20 @@ class Activity(Base):
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     key_points: Mapped[str | None] = mapped_column(Text, nullable=True)
     classification: Mapped[Classification] = mapped_column(
-        Enum(Classification, name="classification", create_type=False),
+        Enum(Classification, native_enum=False, length=32, validate_strings=True),
         default=Classification.INTERNAL,
         nullable=False,
     )
     owner_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
-    created_by: Mapped[uuid.UUID] = mapped_column(
+    # Creator, stored only when it isn't the owner; read through created_by
+    created_by_override: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
-        nullable=False,
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
+        nullable=True,
     )
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -65,11 +95,33 @@ class Activity(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
-    # Full-text search vector
-    search_vector: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True)
+    # Full-text search vector, computed by Postgres from the text columns.
+    # Only used in WHERE clauses, so it's never loaded with the row.
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(summary, '') || ' ' || coalesce(key_points, '') || ' ' || coalesce(description, ''))",
+            persisted=True,
+        ),
+        nullable=True,
+        deferred=True,
+    )
+
+    @hybrid_property
+    def created_by(self) -> uuid.UUID:
+        return self.created_by_override or self.owner_id
+
+    @created_by.inplace.setter
+    def _created_by_setter(self, value: uuid.UUID) -> None:
+        self.created_by_override = None if value == self.owner_id else value
+
+    @created_by.inplace.expression
+    @classmethod
+    def _created_by_expression(cls):
+        return func.coalesce(cls.created_by_override, cls.owner_id)
 
     # Relationships
     owner: Mapped["User"] = relationship(
@@ -77,16 +129,17 @@ class Activity(Base):
         back_populates="owned_activities",
         foreign_keys=[owner_id],
     )
-    creator: Mapped["User"] = relationship("User", foreign_keys=[created_by])
     attendees: Mapped[list["ActivityAttendee"]] = relationship(
         "ActivityAttendee",
         back_populates="activity",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     tags: Mapped[list["ActivityTag"]] = relationship(
         "ActivityTag",
         back_populates="activity",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     attachments: Mapped[list["Attachment"]] = relationship(
         "Attachment",
@@ -108,7 +161,7 @@ class ActivityAttendee(Base):
 
     activity_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("activities.id"),
+        ForeignKey("activities.id", ondelete="CASCADE"),
         primary_key=True,
     )
     contact_id: Mapped[uuid.UUID] = mapped_column(
@@ -124,13 +177,19 @@ class ActivityAttendee(Base):
 
 
 class ActivityVersion(Base):
+    # Range-partitioned by month on changed_at in the migration (primary key
+    # there is (id, changed_at)); id alone is still unique per row.
     __tablename__ = "activity_versions"
+    __table_args__ = (
+        # Serves both the version history listing and the MAX() that numbers
+        # each new version
+        Index("ix_activity_versions_activity_version", "activity_id", "version_number"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=func.gen_random_uuid(),
+        server_default=func.uuid_generate_v7(),
     )
     activity_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -138,10 +197,11 @@ class ActivityVersion(Base):
         nullable=False,
     )
     version_number: Mapped[int] = mapped_column(Integer, nullable=False)
-    snapshot: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    # Loaded on demand (undefer) by the endpoints that return it
+    snapshot: Mapped[dict] = mapped_column(JSONB, nullable=False, deferred=True)
     changed_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
     changed_at: Mapped[datetime] = mapped_column(
@@ -152,4 +212,3 @@ class ActivityVersion(Base):
 
     # Relationships
     activity: Mapped["Activity"] = relationship("Activity", back_populates="versions")
-    changer: Mapped["User"] = relationship("User")
@@ -1,31 +1,38 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, BigInteger, Integer, Enum, DateTime, ForeignKey, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, Text, BigInteger, Integer, Enum, DateTime, ForeignKey, func, CheckConstraint, Index, text
+from sqlalchemy.dialects.postgresql import UUID, BYTEA
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 from app.models.organization import Classification
 
 
-ALLOWED_CONTENT_TYPES = [
+ALLOWED_CONTENT_TYPES: frozenset[str] = frozenset({
     "application/pdf",
     "application/vnd.ms-powerpoint",
     "application/vnd.openxmlformats-officedocument.presentationml.presentation",
     "application/vnd.ms-excel",
     "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     "application/vnd.ms-outlook",
-]
+})
 
 
 class Attachment(Base):
     __tablename__ = "attachments"
+    __table_args__ = (
+        CheckConstraint(
+            "classification IN ('INTERNAL', 'CONFIDENTIAL', 'RESTRICTED')",
+            name="ck_attachments_classification",
+        ),
+        CheckConstraint("octet_length(checksum) = 32", name="ck_attachments_checksum_len"),
+        Index("ix_attachments_active_activity", "activity_id", postgresql_where=text("is_deleted = false")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=func.gen_random_uuid(),
+        server_default=func.uuid_generate_v7(),
     )
     activity_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -36,7 +43,8 @@ class Attachment(Base):
     content_type: Mapped[str] = mapped_column(String(255), nullable=False)
     file_size_bytes: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     blob_path: Mapped[str] = mapped_column(Text, nullable=False)
-    checksum: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # Raw SHA-256 digest (32 bytes); exposed as hex by AttachmentResponse
+    checksum: Mapped[bytes | None] = mapped_column(BYTEA, nullable=True)
     version_number: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
     parent_attachment_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
@@ -44,13 +52,13 @@ class Attachment(Base):
         nullable=True,
     )
     classification: Mapped[Classification] = mapped_column(
-        Enum(Classification, name="classification", create_type=False),
+        Enum(Classification, native_enum=False, length=32, validate_strings=True),
         default=Classification.INTERNAL,
         nullable=False,
     )
     uploaded_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
     is_deleted: Mapped[bool] = mapped_column(default=False, nullable=False)
@@ -63,7 +71,6 @@ class Attachment(Base):
 
     # Relationships
     activity: Mapped["Activity"] = relationship("Activity", back_populates="attachments")
-    uploader: Mapped["User"] = relationship("User")
     parent: Mapped["Attachment | None"] = relationship(
         "Attachment",
         remote_side=[id],
@@ -1,9 +1,10 @@
 import enum
+import ipaddress
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, Enum, DateTime, ForeignKey, func, Index
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Text, Enum, DateTime, ForeignKey, func, CheckConstraint, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB, INET
+from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
 
@@ -16,36 +17,46 @@ class AuditAction(str, enum.Enum):
 
 
 class AuditLog(Base):
+    # Range-partitioned by month on created_at in the migration (primary key
+    # there is (id, created_at)); id alone is still unique per row.
     __tablename__ = "audit_log"
     __table_args__ = (
+        CheckConstraint(
+            "action IN ('CREATE', 'READ', 'UPDATE', 'DELETE')",
+            name="ck_audit_log_action",
+        ),
         Index("ix_audit_log_entity", "entity_type", "entity_id"),
-        Index("ix_audit_log_user_created", "user_id", "created_at"),
+        Index("ix_audit_log_user", "user_id"),
+        Index(
+            "ix_audit_log_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=func.gen_random_uuid(),
+        server_default=func.uuid_generate_v7(),
     )
     user_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=True,
     )
     action: Mapped[AuditAction] = mapped_column(
-        Enum(AuditAction, name="audit_action"),
+        Enum(AuditAction, native_enum=False, length=32, validate_strings=True),
         nullable=False,
     )
     entity_type: Mapped[str] = mapped_column(String(100), nullable=False)
     entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     details: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
-    ip_address: Mapped[str | None] = mapped_column(String(45), nullable=True)
+    ip_address: Mapped[ipaddress.IPv4Address | ipaddress.IPv6Address | None] = mapped_column(
+        INET, nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False,
     )
-
-    # Relationships
-    user: Mapped["User | None"] = relationship("User")
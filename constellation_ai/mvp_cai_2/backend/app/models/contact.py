@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, Boolean, Enum, DateTime, ForeignKey, func
+from sqlalchemy import String, Text, Boolean, Enum, DateTime, ForeignKey, FetchedValue, func, CheckConstraint, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,12 +10,26 @@ from app.models.organization import Classification
 
 class Contact(Base):
     __tablename__ = "contacts"
+    # List endpoints only ever read non-deleted rows
+    __table_args__ = (
+        CheckConstraint(
+            "classification IN ('INTERNAL', 'CONFIDENTIAL', 'RESTRICTED')",
+            name="ck_contacts_classification",
+        ),
+        Index("ix_contacts_active_org", "organization_id", postgresql_where=text("is_deleted = false")),
+        Index(
+            "ix_contacts_active_class_name",
+            "classification",
+            "last_name",
+            "first_name",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=func.gen_random_uuid(),
+        server_default=func.uuid_generate_v7(),
     )
     first_name: Mapped[str] = mapped_column(String(255), nullable=False)
     last_name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -24,23 +38,23 @@ class Contact(Base):
     title: Mapped[str | None] = mapped_column(String(255), nullable=True)
     organization_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("organizations.id"),
+        ForeignKey("organizations.id", deferrable=True, initially="DEFERRED"),
         nullable=True,
     )
     classification: Mapped[Classification] = mapped_column(
-        Enum(Classification, name="classification", create_type=False),
+        Enum(Classification, native_enum=False, length=32, validate_strings=True),
         default=Classification.INTERNAL,
         nullable=False,
     )
     owner_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=True,
     )
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -53,7 +67,7 @@ class Contact(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
@@ -67,11 +81,11 @@ class Contact(Base):
         back_populates="owned_contacts",
         foreign_keys=[owner_id],
     )
-    creator: Mapped["User"] = relationship("User", foreign_keys=[created_by])
     tags: Mapped[list["ContactTag"]] = relationship(
         "ContactTag",
         back_populates="contact",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     activity_attendances: Mapped[list["ActivityAttendee"]] = relationship(
         "ActivityAttendee",
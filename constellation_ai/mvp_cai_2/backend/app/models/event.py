@@ -1,11 +1,15 @@
 import enum
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, Boolean, Enum, DateTime, Integer, ForeignKey, func, Index
-from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy import (
+    String, Text, Boolean, Enum, DateTime, Integer, ForeignKey,
+    CheckConstraint, FetchedValue, Index, Computed, func, text,
+)
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, MsgPack
 from app.models.organization import Classification
 
 
@@ -18,19 +22,47 @@ class EventType(str, enum.Enum):
 
 class Event(Base):
     __tablename__ = "events"
+    # Fetch server-generated columns via RETURNING on INSERT/UPDATE, so writes
+    # don't need a refresh round-trip before the response is built
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
-        Index("ix_events_search_vector", "search_vector", postgresql_using="gin"),
+        CheckConstraint(
+            "classification IN ('INTERNAL', 'CONFIDENTIAL', 'RESTRICTED')",
+            name="ck_events_classification",
+        ),
+        CheckConstraint(
+            "event_type IN ('RETREAT', 'DINNER', 'LUNCH', 'OTHER')",
+            name="ck_events_event_type",
+        ),
+        Index(
+            "ix_events_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_with={"fastupdate": "off"},
+        ),
+        # List endpoints only ever read non-deleted rows
+        Index(
+            "ix_events_active_owner_occurred",
+            "owner_id",
+            "occurred_at",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_events_active_class_occurred",
+            "classification",
+            "occurred_at",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=func.gen_random_uuid(),
+        server_default=func.uuid_generate_v7(),
     )
     name: Mapped[str] = mapped_column(String(500), nullable=False)
     event_type: Mapped[EventType] = mapped_column(
-        Enum(EventType, name="event_type"),
+        Enum(EventType, native_enum=False, length=20, validate_strings=True),
         nullable=False,
     )
     occurred_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -38,21 +70,20 @@ class Event(Base):
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     classification: Mapped[Classification] = mapped_column(
-        Enum(Classification, name="classification", create_type=False),
+        Enum(Classification, native_enum=False, length=32, validate_strings=True),
         default=Classification.INTERNAL,
         nullable=False,
     )
     owner_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=True,
     )
     created_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
-    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -62,11 +93,29 @@ class Event(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
-    # Full-text search vector
-    search_vector: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True)
+    # Full-text search vector, computed by Postgres from the text columns.
+    # Only used in WHERE clauses, so it's never loaded with the row.
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, '') || ' ' || coalesce(notes, ''))",
+            persisted=True,
+        ),
+        nullable=True,
+        deferred=True,
+    )
+
+    @hybrid_property
+    def is_deleted(self) -> bool:
+        return self.deleted_at is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deleted_at.is_not(None)
 
     # Relationships
     owner: Mapped["User"] = relationship(
@@ -74,26 +123,33 @@ class Event(Base):
         back_populates="owned_events",
         foreign_keys=[owner_id],
     )
-    creator: Mapped["User"] = relationship("User", foreign_keys=[created_by])
     attendees: Mapped[list["EventAttendee"]] = relationship(
         "EventAttendee",
         back_populates="event",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     pitches: Mapped[list["EventPitch"]] = relationship(
         "EventPitch",
         back_populates="event",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     tags: Mapped[list["EventTag"]] = relationship(
         "EventTag",
         back_populates="event",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     versions: Mapped[list["EventVersion"]] = relationship(
         "EventVersion",
         back_populates="event",
         order_by="EventVersion.version_number",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
 
@@ -102,7 +158,7 @@ class EventAttendee(Base):
 
     event_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("events.id"),
+        ForeignKey("events.id", ondelete="CASCADE"),
         primary_key=True,
     )
     contact_id: Mapped[uuid.UUID] = mapped_column(
@@ -124,12 +180,11 @@ class EventPitch(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=func.gen_random_uuid(),
+        server_default=func.uuid_generate_v7(),
     )
     event_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("events.id"),
+        ForeignKey("events.id", ondelete="CASCADE"),
         nullable=False,
     )
     ticker: Mapped[str | None] = mapped_column(String(20), nullable=True)
@@ -144,7 +199,7 @@ class EventPitch(Base):
     is_bullish: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
     created_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
     created_at: Mapped[datetime] = mapped_column(
@@ -156,15 +211,29 @@ class EventPitch(Base):
     # Relationships
     event: Mapped["Event"] = relationship("Event", back_populates="pitches")
     pitcher: Mapped["Contact"] = relationship("Contact")
-    creator: Mapped["User"] = relationship("User")
 
 
 class EventTag(Base):
     __tablename__ = "event_tags"
+    __table_args__ = (
+        # Append-only, like the other tag link tables
+        Index(
+            "ix_event_tags_tagged_brin",
+            "tagged_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_event_tags_tag_recent",
+            "tag_id",
+            text("tagged_at DESC"),
+            postgresql_include=["event_id"],
+        ),
+    )
 
     event_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("events.id"),
+        ForeignKey("events.id", ondelete="CASCADE"),
         primary_key=True,
     )
     tag_id: Mapped[uuid.UUID] = mapped_column(
@@ -174,7 +243,7 @@ class EventTag(Base):
     )
     tagged_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
     tagged_at: Mapped[datetime] = mapped_column(
@@ -186,28 +255,37 @@ class EventTag(Base):
     # Relationships
     event: Mapped["Event"] = relationship("Event", back_populates="tags")
     tag: Mapped["Tag"] = relationship("Tag")
-    tagger: Mapped["User"] = relationship("User")
 
 
 class EventVersion(Base):
+    # Range-partitioned by month on changed_at in the migration (primary key
+    # there is (id, changed_at)); id alone is still unique per row.
     __tablename__ = "event_versions"
+    __table_args__ = (
+        Index(
+            "ix_event_versions_changed_brin",
+            "changed_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index("ix_event_versions_event_version", "event_id", "version_number"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=func.gen_random_uuid(),
+        server_default=func.uuid_generate_v7(),
     )
     event_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("events.id"),
+        ForeignKey("events.id", ondelete="CASCADE"),
         nullable=False,
     )
     version_number: Mapped[int] = mapped_column(Integer, nullable=False)
-    snapshot: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    snapshot: Mapped[dict] = mapped_column(MsgPack, nullable=False)
     changed_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
     changed_at: Mapped[datetime] = mapped_column(
@@ -218,4 +296,3 @@ class EventVersion(Base):
 
     # Relationships
     event: Mapped["Event"] = relationship("Event", back_populates="versions")
-    changer: Mapped["User"] = relationship("User")
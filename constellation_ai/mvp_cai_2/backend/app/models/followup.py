@@ -1,7 +1,7 @@
 import enum
 import uuid
 from datetime import datetime, date
-from sqlalchemy import String, Text, Enum, DateTime, Date, ForeignKey, func
+from sqlalchemy import String, Text, Enum, DateTime, Date, ForeignKey, CheckConstraint, FetchedValue, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -17,12 +17,17 @@ class FollowUpStatus(str, enum.Enum):
 
 class FollowUp(Base):
     __tablename__ = "followups"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('OPEN', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED')",
+            name="ck_followups_status",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=func.gen_random_uuid(),
+        server_default=func.uuid_generate_v7(),
     )
     activity_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -32,19 +37,20 @@ class FollowUp(Base):
     description: Mapped[str] = mapped_column(Text, nullable=False)
     assigned_to: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=True,
     )
     due_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     status: Mapped[FollowUpStatus] = mapped_column(
-        Enum(FollowUpStatus, name="followup_status"),
+        Enum(FollowUpStatus, native_enum=False, length=20, validate_strings=True),
         default=FollowUpStatus.OPEN,
+        server_default=FollowUpStatus.OPEN.value,
         nullable=False,
     )
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
     created_at: Mapped[datetime] = mapped_column(
@@ -55,7 +61,7 @@ class FollowUp(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
@@ -66,4 +72,3 @@ class FollowUp(Base):
         back_populates="assigned_followups",
         foreign_keys=[assigned_to],
     )
-    creator: Mapped["User"] = relationship("User", foreign_keys=[created_by])
@@ -1,8 +1,9 @@
 import enum
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, Boolean, Enum, DateTime, ForeignKey, func
+from sqlalchemy import String, Text, Enum, DateTime, ForeignKey, CheckConstraint, FetchedValue, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -24,37 +25,71 @@ class Classification(str, enum.Enum):
 
 class Organization(Base):
     __tablename__ = "organizations"
+    # Fetch created_at/updated_at via RETURNING on INSERT/UPDATE, so writes
+    # don't need a refresh round-trip before the response is built
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        CheckConstraint(
+            "classification IN ('INTERNAL', 'CONFIDENTIAL', 'RESTRICTED')",
+            name="ck_organizations_classification",
+        ),
+        CheckConstraint(
+            "org_type IN ('ASSET_MANAGER', 'BROKER', 'CONSULTANT', 'CORPORATE', 'OTHER')",
+            name="ck_organizations_org_type",
+        ),
+        # List endpoints only ever read non-deleted rows
+        Index(
+            "ix_organizations_active_owner",
+            "owner_id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_organizations_active_class_name",
+            "classification",
+            "name",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Substring search on lower(name) / lower(short_name) (LIKE '%term%')
+        Index(
+            "ix_organizations_name_trgm",
+            text("lower(name) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+        Index(
+            "ix_organizations_short_name_trgm",
+            text("lower(short_name) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=func.gen_random_uuid(),
+        server_default=func.uuid_generate_v7(),
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     short_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
     org_type: Mapped[OrgType | None] = mapped_column(
-        Enum(OrgType, name="org_type"),
+        Enum(OrgType, native_enum=False, length=20, validate_strings=True),
         nullable=True,
     )
     website: Mapped[str | None] = mapped_column(String(500), nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     classification: Mapped[Classification] = mapped_column(
-        Enum(Classification, name="classification"),
+        Enum(Classification, native_enum=False, length=32, validate_strings=True),
         default=Classification.INTERNAL,
         nullable=False,
     )
     owner_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=True,
     )
     created_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
-    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -64,17 +99,27 @@ class Organization(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
+    # Soft-deleted rows are the ones with a deleted_at; filters use
+    # deleted_at IS NULL directly so they match the partial index predicates
+    @hybrid_property
+    def is_deleted(self) -> bool:
+        return self.deleted_at is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deleted_at.is_not(None)
+
     # Relationships
     owner: Mapped["User | None"] = relationship(
         "User",
         back_populates="owned_organizations",
         foreign_keys=[owner_id],
     )
-    creator: Mapped["User"] = relationship("User", foreign_keys=[created_by])
     contacts: Mapped[list["Contact"]] = relationship(
         "Contact",
         back_populates="organization",
@@ -83,4 +128,5 @@ class Organization(Base):
         "OrganizationTag",
         back_populates="organization",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
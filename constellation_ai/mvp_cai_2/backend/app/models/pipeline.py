@@ -2,15 +2,18 @@ import enum
 import uuid
 from datetime import datetime
 from sqlalchemy import (
-    String, Text, Boolean, SmallInteger, Enum, DateTime, ForeignKey,
-    CheckConstraint, Index, func,
+    String, Text, SmallInteger, Enum, DateTime, ForeignKey,
+    CheckConstraint, FetchedValue, Index, func,
 )
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
 
+# Named stage numbers for comparisons in code. Stages are stored, loaded and
+# returned as plain ints; values read from the database are never wrapped in this.
 class PipelineStage(int, enum.Enum):
     FIRST_MEETING = 1
     QUANTITATIVE_DILIGENCE = 2
@@ -27,32 +30,45 @@ class PipelineStatus(str, enum.Enum):
     CONVERTED = "CONVERTED"
 
 
-STAGE_LABELS: dict[int, str] = {
-    1: "First Meeting",
-    2: "Quantitative Diligence",
-    3: "Patrick Meeting",
-    4: "Live Diligence",
-    5: "References",
-    6: "Docs",
-}
+# Indexed by stage number (1-6); slot 0 is unused so no offset is needed
+STAGE_LABELS: tuple[str, ...] = (
+    "",
+    "First Meeting",
+    "Quantitative Diligence",
+    "Patrick Meeting",
+    "Live Diligence",
+    "References",
+    "Docs",
+)
+
+
+def label_for_stage(stage: int) -> str:
+    return STAGE_LABELS[stage]
 
 
 class PipelineItem(Base):
     __tablename__ = "pipeline_items"
+    # Fetch updated_at and the other server defaults via RETURNING on
+    # INSERT/UPDATE, so stage changes can answer without re-selecting the item
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         CheckConstraint("stage >= 1 AND stage <= 6", name="ck_pipeline_items_stage_range"),
-        # The partial unique index is created in the migration via raw SQL
+        CheckConstraint(
+            "status IN ('ACTIVE', 'BACK_BURNER', 'PASSED', 'CONVERTED')",
+            name="ck_pipeline_items_status",
+        ),
+        # The partial indexes (uq_pipeline_org_active, ix_pipeline_items_owner_stage,
+        # ix_pipeline_items_active_status_changed) are created in the migrations via raw SQL
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=func.gen_random_uuid(),
+        server_default=func.uuid_generate_v7(),
     )
     organization_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("organizations.id"),
+        ForeignKey("organizations.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
     primary_contact_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -67,19 +83,19 @@ class PipelineItem(Base):
         server_default="1",
     )
     status: Mapped[PipelineStatus] = mapped_column(
-        Enum(PipelineStatus, name="pipeline_status", create_type=False),
+        Enum(PipelineStatus, native_enum=False, length=20, validate_strings=True),
         nullable=False,
         default=PipelineStatus.ACTIVE,
         server_default="ACTIVE",
     )
     owner_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
     created_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
     back_burner_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -95,7 +111,6 @@ class PipelineItem(Base):
         server_default=func.now(),
         nullable=False,
     )
-    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -105,10 +120,19 @@ class PipelineItem(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
+    @hybrid_property
+    def is_deleted(self) -> bool:
+        return self.deleted_at is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deleted_at.is_not(None)
+
     # Relationships
     organization: Mapped["Organization"] = relationship(
         "Organization",
@@ -122,38 +146,51 @@ class PipelineItem(Base):
         "User",
         foreign_keys=[owner_id],
     )
-    created_by_user: Mapped["User"] = relationship(
-        "User",
-        foreign_keys=[created_by],
-    )
     stage_history: Mapped[list["PipelineStageHistory"]] = relationship(
         "PipelineStageHistory",
         back_populates="pipeline_item",
         order_by="PipelineStageHistory.changed_at",
+        passive_deletes=True,
     )
 
 
 class PipelineStageHistory(Base):
+    # Range-partitioned by month on changed_at in the migration (primary key
+    # there is (id, changed_at)); id alone is still unique per row.
     __tablename__ = "pipeline_stage_history"
+    __table_args__ = (
+        # Append-only, so changed_at tracks physical order
+        Index(
+            "ix_pipeline_stage_history_changed_brin",
+            "changed_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=func.gen_random_uuid(),
+        server_default=func.uuid_generate_v7(),
     )
     pipeline_item_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("pipeline_items.id"),
+        ForeignKey("pipeline_items.id", ondelete="CASCADE"),
         nullable=False,
     )
     from_stage: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
     to_stage: Mapped[int] = mapped_column(SmallInteger, nullable=False)
-    from_status: Mapped[str | None] = mapped_column(String(20), nullable=True)
-    to_status: Mapped[str] = mapped_column(String(20), nullable=False)
+    from_status: Mapped[PipelineStatus | None] = mapped_column(
+        Enum(PipelineStatus, native_enum=False, length=20, validate_strings=True),
+        nullable=True,
+    )
+    to_status: Mapped[PipelineStatus] = mapped_column(
+        Enum(PipelineStatus, native_enum=False, length=20, validate_strings=True),
+        nullable=False,
+    )
     changed_by_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
     note: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -168,4 +205,3 @@ class PipelineStageHistory(Base):
         "PipelineItem",
         back_populates="stage_history",
     )
-    changed_by: Mapped["User"] = relationship("User")
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, func, UniqueConstraint
+from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, FetchedValue, func, text, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -13,8 +13,7 @@ class TagSet(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=func.gen_random_uuid(),
+        server_default=func.uuid_generate_v7(),
     )
     name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -27,7 +26,7 @@ class TagSet(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
@@ -43,13 +42,13 @@ class Tag(Base):
     __tablename__ = "tags"
     __table_args__ = (
         UniqueConstraint("tag_set_id", "value", name="uq_tag_set_value"),
+        Index("ix_tags_value_trgm", text("lower(value) gin_trgm_ops"), postgresql_using="gin"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=func.gen_random_uuid(),
+        server_default=func.uuid_generate_v7(),
     )
     tag_set_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -66,7 +65,7 @@ class Tag(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
@@ -88,10 +87,27 @@ class Tag(Base):
 
 class ContactTag(Base):
     __tablename__ = "contact_tags"
+    __table_args__ = (
+        # Link rows are only ever appended, so tagged_at follows physical order
+        # and a BRIN index covers time-range scans. The primary key leads with
+        # the entity, so "recently tagged with X" needs its own tag_id index.
+        Index(
+            "ix_contact_tags_tagged_brin",
+            "tagged_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_contact_tags_tag_recent",
+            "tag_id",
+            text("tagged_at DESC"),
+            postgresql_include=["contact_id"],
+        ),
+    )
 
     contact_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("contacts.id"),
+        ForeignKey("contacts.id", ondelete="CASCADE"),
         primary_key=True,
     )
     tag_id: Mapped[uuid.UUID] = mapped_column(
@@ -101,7 +117,7 @@ class ContactTag(Base):
     )
     tagged_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
     tagged_at: Mapped[datetime] = mapped_column(
@@ -113,15 +129,28 @@ class ContactTag(Base):
     # Relationships
     contact: Mapped["Contact"] = relationship("Contact", back_populates="tags")
     tag: Mapped["Tag"] = relationship("Tag", back_populates="contact_tags")
-    tagger: Mapped["User"] = relationship("User")
 
 
 class OrganizationTag(Base):
     __tablename__ = "organization_tags"
+    __table_args__ = (
+        Index(
+            "ix_organization_tags_tagged_brin",
+            "tagged_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_organization_tags_tag_recent",
+            "tag_id",
+            text("tagged_at DESC"),
+            postgresql_include=["organization_id"],
+        ),
+    )
 
     organization_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("organizations.id"),
+        ForeignKey("organizations.id", ondelete="CASCADE", deferrable=True, initially="DEFERRED"),
         primary_key=True,
     )
     tag_id: Mapped[uuid.UUID] = mapped_column(
@@ -131,7 +160,7 @@ class OrganizationTag(Base):
     )
     tagged_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
     tagged_at: Mapped[datetime] = mapped_column(
@@ -143,15 +172,28 @@ class OrganizationTag(Base):
     # Relationships
     organization: Mapped["Organization"] = relationship("Organization", back_populates="tags")
     tag: Mapped["Tag"] = relationship("Tag", back_populates="organization_tags")
-    tagger: Mapped["User"] = relationship("User")
 
 
 class ActivityTag(Base):
     __tablename__ = "activity_tags"
+    __table_args__ = (
+        Index(
+            "ix_activity_tags_tagged_brin",
+            "tagged_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_activity_tags_tag_recent",
+            "tag_id",
+            text("tagged_at DESC"),
+            postgresql_include=["activity_id"],
+        ),
+    )
 
     activity_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("activities.id"),
+        ForeignKey("activities.id", ondelete="CASCADE"),
         primary_key=True,
     )
     tag_id: Mapped[uuid.UUID] = mapped_column(
@@ -161,7 +203,7 @@ class ActivityTag(Base):
     )
     tagged_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("users.id"),
+        ForeignKey("users.id", deferrable=True, initially="DEFERRED"),
         nullable=False,
     )
     tagged_at: Mapped[datetime] = mapped_column(
@@ -173,4 +215,3 @@ class ActivityTag(Base):
     # Relationships
     activity: Mapped["Activity"] = relationship("Activity", back_populates="tags")
     tag: Mapped["Tag"] = relationship("Tag", back_populates="activity_tags")
-    tagger: Mapped["User"] = relationship("User")
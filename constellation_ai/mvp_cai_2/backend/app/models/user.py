@@ -1,7 +1,7 @@
 import enum
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Boolean, Enum, DateTime, func
+from sqlalchemy import String, Boolean, Enum, DateTime, CheckConstraint, FetchedValue, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -17,18 +17,23 @@ class UserRole(str, enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        CheckConstraint("role IN ('ADMIN', 'MANAGER', 'ANALYST', 'VIEWER')", name="ck_users_role"),
+    )
+    # Fetch created_at/updated_at via RETURNING on INSERT/UPDATE, so auth's
+    # provision/link paths don't need a refresh round-trip afterwards
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=func.gen_random_uuid(),
+        server_default=func.uuid_generate_v7(),
     )
     entra_object_id: Mapped[str | None] = mapped_column(String(255), unique=True, nullable=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     display_name: Mapped[str] = mapped_column(String(255), nullable=False)
     role: Mapped[UserRole] = mapped_column(
-        Enum(UserRole, name="user_role"),
+        Enum(UserRole, native_enum=False, length=20, validate_strings=True),
         default=UserRole.VIEWER,
         nullable=False,
     )
@@ -41,33 +46,40 @@ class User(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
-    # Relationships
+    # Relationships. The collections are never needed when a user is loaded
+    # (auth does that on every request), so touching one without an explicit
+    # loader option raises instead of quietly issuing a query.
     owned_organizations: Mapped[list["Organization"]] = relationship(
         "Organization",
         back_populates="owner",
         foreign_keys="Organization.owner_id",
+        lazy="raise_on_sql",
     )
     owned_contacts: Mapped[list["Contact"]] = relationship(
         "Contact",
         back_populates="owner",
         foreign_keys="Contact.owner_id",
+        lazy="raise_on_sql",
     )
     owned_activities: Mapped[list["Activity"]] = relationship(
         "Activity",
         back_populates="owner",
         foreign_keys="Activity.owner_id",
+        lazy="raise_on_sql",
     )
     assigned_followups: Mapped[list["FollowUp"]] = relationship(
         "FollowUp",
         back_populates="assigned_to_user",
         foreign_keys="FollowUp.assigned_to",
+        lazy="raise_on_sql",
     )
     owned_events: Mapped[list["Event"]] = relationship(
         "Event",
         back_populates="owner",
         foreign_keys="Event.owner_id",
+        lazy="raise_on_sql",
     )
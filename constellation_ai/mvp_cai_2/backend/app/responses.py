@@ -0,0 +1,18 @@
+import uuid
+
+import orjson
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+
+
+def _orjson_default(value):
+    # asyncpg hands back its own uuid.UUID subclass, which orjson won't encode
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__} to JSON")
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """FastAPI's ORJSONResponse, also accepting asyncpg's UUID values."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
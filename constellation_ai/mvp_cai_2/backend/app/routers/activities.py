@@ -1,17 +1,22 @@
 import json
+from time import monotonic
 from uuid import UUID
-from datetime import datetime, date
+from datetime import date, datetime, time, timedelta, timezone
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, text
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload, undefer, joinedload, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.dependencies import get_db, CurrentUser, get_client_ip
+from app.responses import ORJSONResponse
 from app.models.user import User
 from app.models.contact import Contact
 from app.models.activity import Activity, ActivityType, ActivityAttendee, ActivityVersion
 from app.models.tag import Tag, ActivityTag
 from app.models.followup import FollowUp
+from app.models.attachment import Attachment
 from app.models.audit import AuditAction
 from app.auth.rbac import filter_by_classification
 from app.services.audit_service import log_action, log_read
@@ -29,8 +34,49 @@ from app.schemas.followup import FollowUpResponse
 
 router = APIRouter()
 
-
-@router.get("", response_model=ActivityListResponse)
+# Serialized list pages, keyed on the caller's visible classifications and the
+# query parameters. The cache is per process: this process's writes clear it,
+# and the TTL bounds how long another worker's writes can go unseen.
+_list_cache: dict[tuple, tuple[dict, float]] = {}
+# Bumped on every clear, so a list query that started before a write can't
+# store its (now stale) page afterwards.
+_list_cache_generation = 0
+LIST_CACHE_TTL = 30.0
+LIST_CACHE_MAX_SIZE = 1_000
+
+
+def _get_cached_list(cache_key: tuple) -> dict | None:
+    entry = _list_cache.get(cache_key)
+    if entry is None:
+        return None
+    page, expires_at = entry
+    if monotonic() >= expires_at:
+        _list_cache.pop(cache_key, None)
+        return None
+    return page
+
+
+def _cache_list(cache_key: tuple, page: dict, generation: int) -> None:
+    if generation != _list_cache_generation:
+        return
+    now = monotonic()
+    if len(_list_cache) >= LIST_CACHE_MAX_SIZE:
+        # Drop expired entries first, then the oldest insertion
+        for key in [k for k, (_, exp) in _list_cache.items() if exp <= now]:
+            del _list_cache[key]
+        if len(_list_cache) >= LIST_CACHE_MAX_SIZE:
+            del _list_cache[next(iter(_list_cache))]
+    _list_cache[cache_key] = (page, now + LIST_CACHE_TTL)
+
+
+def clear_list_cache() -> None:
+    """Forget all cached activity list pages (after any activity write)."""
+    global _list_cache_generation
+    _list_cache_generation += 1
+    _list_cache.clear()
+
+
+@router.get("", response_model=ActivityListResponse, response_class=ORJSONResponse)
 async def list_activities(
     page: int = 1,
     page_size: int = 25,
@@ -41,44 +87,69 @@ async def list_activities(
     tag_ids: str | None = None,
     current_user: CurrentUser = None,
     db: AsyncSession = Depends(get_db),
-) -> dict:
+) -> ORJSONResponse:
     """List activities with pagination and filtering."""
     offset = (page - 1) * page_size
     accessible_classifications = filter_by_classification(current_user)
+    tag_id_list = [UUID(tid.strip()) for tid in tag_ids.split(",")] if tag_ids else None
+
+    cache_key = (
+        tuple(sorted(accessible_classifications)),
+        page,
+        page_size,
+        activity_type,
+        from_date,
+        to_date,
+        owner_id,
+        tuple(sorted(tag_id_list)) if tag_id_list else None,
+    )
+    cached = _get_cached_list(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    generation = _list_cache_generation
 
-    stmt = select(Activity).where(
+    # The window count rides along with the page, so the total needs no second query
+    stmt = select(Activity, func.count().over().label("total_count")).where(
         Activity.is_deleted == False,
         Activity.classification.in_(accessible_classifications),
     )
 
     if activity_type:
         stmt = stmt.where(Activity.activity_type == activity_type)
+    # Compared as a half-open UTC range rather than date(occurred_at), which
+    # would hide the column from the occurred_at indexes
     if from_date:
-        stmt = stmt.where(func.date(Activity.occurred_at) >= from_date)
+        stmt = stmt.where(Activity.occurred_at >= datetime.combine(from_date, time.min, timezone.utc))
     if to_date:
-        stmt = stmt.where(func.date(Activity.occurred_at) <= to_date)
+        day_after = datetime.combine(to_date + timedelta(days=1), time.min, timezone.utc)
+        stmt = stmt.where(Activity.occurred_at < day_after)
     if owner_id:
         stmt = stmt.where(Activity.owner_id == owner_id)
-    if tag_ids:
-        tag_id_list = [UUID(tid.strip()) for tid in tag_ids.split(",")]
+    if tag_id_list:
         stmt = stmt.join(ActivityTag).where(ActivityTag.tag_id.in_(tag_id_list))
 
-    # Get total count
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_result = await db.execute(count_stmt)
-    total = total_result.scalar()
+    page_stmt = stmt.offset(offset).limit(page_size).order_by(Activity.occurred_at.desc())
+    rows = (await db.execute(page_stmt)).all()
+    if rows:
+        total = rows[0].total_count
+    elif offset:
+        # Past the last page there is no row to carry the count
+        total = await db.scalar(
+            select(func.count()).select_from(stmt.with_only_columns(Activity.id).subquery())
+        )
+    else:
+        total = 0
 
-    # Get activities
-    stmt = stmt.offset(offset).limit(page_size).order_by(Activity.occurred_at.desc())
-    result = await db.execute(stmt)
-    activities = result.scalars().all()
-
-    return {
-        "items": activities,
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-    }
+    data = ActivityListResponse.model_validate(
+        {
+            "items": [row.Activity for row in rows],
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+        }
+    ).model_dump(mode="json")
+    _cache_list(cache_key, data, generation)
+    return ORJSONResponse(data)
 
 
 @router.post("", response_model=ActivityResponse, status_code=status.HTTP_201_CREATED)
@@ -99,45 +170,43 @@ async def create_activity(
         key_points=activity_data.key_points,
         classification=activity_data.classification,
         owner_id=current_user.id,
-        created_by=current_user.id,
     )
     db.add(activity)
     await db.flush()
 
-    # Update search vector
-    await _update_search_vector(db, activity)
-
-    # Add attendees
+    # Add attendees, tags and followups, one executemany per table
     if activity_data.attendees:
-        for attendee in activity_data.attendees:
-            activity_attendee = ActivityAttendee(
-                activity_id=activity.id,
-                contact_id=attendee.contact_id,
-                role=attendee.role,
-            )
-            db.add(activity_attendee)
-
-    # Add tags
+        await db.execute(
+            insert(ActivityAttendee),
+            [
+                {"activity_id": activity.id, "contact_id": a.contact_id, "role": a.role}
+                for a in activity_data.attendees
+            ],
+        )
     if activity_data.tag_ids:
-        for tag_id in activity_data.tag_ids:
-            activity_tag = ActivityTag(
-                activity_id=activity.id,
-                tag_id=tag_id,
-                tagged_by=current_user.id,
-            )
-            db.add(activity_tag)
+        await db.execute(
+            pg_insert(ActivityTag).on_conflict_do_nothing(index_elements=["activity_id", "tag_id"]),
+            [
+                {"activity_id": activity.id, "tag_id": tag_id, "tagged_by": current_user.id}
+                for tag_id in activity_data.tag_ids
+            ],
+        )
 
     # Add followups
     if activity_data.followups:
-        for followup_data in activity_data.followups:
-            followup = FollowUp(
-                activity_id=activity.id,
-                description=followup_data.description,
-                assigned_to=followup_data.assigned_to,
-                due_date=followup_data.due_date,
-                created_by=current_user.id,
-            )
-            db.add(followup)
+        await db.execute(
+            insert(FollowUp),
+            [
+                {
+                    "activity_id": activity.id,
+                    "description": f.description,
+                    "assigned_to": f.assigned_to,
+                    "due_date": f.due_date,
+                    "created_by": current_user.id,
+                }
+                for f in activity_data.followups
+            ],
+        )
 
     # Log creation
     await log_action(
@@ -150,19 +219,19 @@ async def create_activity(
     )
 
     await db.commit()
-    await db.refresh(activity)
+    clear_list_cache()
 
     return activity
 
 
-@router.get("/{activity_id}", response_model=ActivityDetail)
+@router.get("/{activity_id}", response_model=ActivityDetail, response_class=ORJSONResponse)
 async def get_activity(
     activity_id: UUID,
     request: Request,
     current_user: CurrentUser = None,
     db: AsyncSession = Depends(get_db),
 ) -> dict:
-    """Get activity details with attendees, attachments, followups, and versions."""
+    """Get activity details with attendees, tags, attachments, and followups."""
     accessible_classifications = filter_by_classification(current_user)
 
     stmt = (
@@ -173,12 +242,14 @@ async def get_activity(
             Activity.classification.in_(accessible_classifications),
         )
         .options(
-            selectinload(Activity.owner),
-            selectinload(Activity.attendees).selectinload(ActivityAttendee.contact).selectinload(Contact.organization),
-            selectinload(Activity.tags).selectinload(ActivityTag.tag),
-            selectinload(Activity.attachments),
-            selectinload(Activity.followups).selectinload(FollowUp.assigned_to_user),
-            selectinload(Activity.versions),
+            joinedload(Activity.owner),
+            selectinload(Activity.attendees).joinedload(ActivityAttendee.contact).joinedload(Contact.organization),
+            selectinload(Activity.tags).joinedload(ActivityTag.tag),
+            selectinload(Activity.attachments.and_(Attachment.is_deleted == False)),
+            selectinload(Activity.followups).joinedload(FollowUp.assigned_to_user),
+            # Anything the response touches must be listed above; versions are
+            # served by /versions
+            raiseload("*"),
         )
     )
     result = await db.execute(stmt)
@@ -225,7 +296,7 @@ async def get_activity(
             )
             for at in activity.tags
         ],
-        "attachments": [a for a in activity.attachments if not a.is_deleted],
+        "attachments": activity.attachments,
         "followups": [
             FollowUpResponse(
                 id=f.id,
@@ -242,16 +313,6 @@ async def get_activity(
             )
             for f in activity.followups
         ],
-        "versions": [
-            ActivityVersionResponse(
-                id=v.id,
-                version_number=v.version_number,
-                snapshot=v.snapshot,
-                changed_by=v.changed_by,
-                changed_at=v.changed_at,
-            )
-            for v in activity.versions
-        ],
     }
 
 
@@ -273,7 +334,6 @@ async def update_activity(
             Activity.is_deleted == False,
             Activity.classification.in_(accessible_classifications),
         )
-        .options(selectinload(Activity.versions))
     )
     result = await db.execute(stmt)
     activity = result.scalar_one_or_none()
@@ -284,40 +344,52 @@ async def update_activity(
             detail="Activity not found",
         )
 
-    # Create version snapshot before updating
-    version_number = len(activity.versions) + 1
+    # Version snapshot of the row as it is before the update
     snapshot = {
         "title": activity.title,
-        "activity_type": activity.activity_type.value,
-        "occurred_at": activity.occurred_at.isoformat(),
+        "activity_type": activity.activity_type,
+        "occurred_at": activity.occurred_at,
         "description": activity.description,
         "location": activity.location,
         "summary": activity.summary,
         "key_points": activity.key_points,
-        "classification": activity.classification.value,
+        "classification": activity.classification,
     }
-    version = ActivityVersion(
+    new_version = insert(ActivityVersion).values(
         activity_id=activity.id,
-        version_number=version_number,
+        # Numbered inside the INSERT, so the existing versions are never read
+        version_number=(
+            select(func.coalesce(func.max(ActivityVersion.version_number), 0) + 1)
+            .where(ActivityVersion.activity_id == activity.id)
+            .scalar_subquery()
+        ),
         snapshot=snapshot,
         changed_by=current_user.id,
     )
-    db.add(version)
 
     # Track changes for audit
     changes = {}
+    new_values = {}
     update_data = activity_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         old_value = getattr(activity, field)
         if old_value != value:
             changes[field] = {"old": str(old_value), "new": str(value)}
-            setattr(activity, field, value)
-
-    # Update search vector if relevant fields changed
-    if any(f in changes for f in ["title", "summary", "key_points", "description"]):
-        await _update_search_vector(db, activity)
+            new_values[field] = value
+
+    if new_values:
+        # The version INSERT runs as a CTE of the UPDATE, so both writes are one
+        # statement. The loaded activity takes the new values in place; only the
+        # trigger-set updated_at has to come back from the database.
+        updated_at = await db.scalar(
+            update(Activity)
+            .where(Activity.id == activity.id)
+            .values(**new_values)
+            .add_cte(new_version.cte("new_version"))
+            .returning(Activity.updated_at)
+        )
+        set_committed_value(activity, "updated_at", updated_at)
 
-    if changes:
         await log_action(
             db=db,
             user_id=current_user.id,
@@ -327,9 +399,11 @@ async def update_activity(
             details=changes,
             ip_address=get_client_ip(request),
         )
+    else:
+        await db.execute(new_version)
 
     await db.commit()
-    await db.refresh(activity)
+    clear_list_cache()
 
     return activity
 
@@ -359,7 +433,7 @@ async def delete_activity(
         )
 
     activity.is_deleted = True
-    activity.deleted_at = datetime.utcnow()
+    activity.deleted_at = func.now()
 
     await log_action(
         db=db,
@@ -371,6 +445,7 @@ async def delete_activity(
     )
 
     await db.commit()
+    clear_list_cache()
 
 
 @router.get("/{activity_id}/versions", response_model=list[ActivityVersionResponse])
@@ -400,28 +475,10 @@ async def get_activity_versions(
         select(ActivityVersion)
         .where(ActivityVersion.activity_id == activity_id)
         .order_by(ActivityVersion.version_number.desc())
+        .options(undefer(ActivityVersion.snapshot))
     )
     result = await db.execute(stmt)
     versions = result.scalars().all()
 
     return versions
 
-
-async def _update_search_vector(db: AsyncSession, activity: Activity) -> None:
-    """Update the search vector for full-text search."""
-    # Combine searchable text
-    text_parts = [
-        activity.title or "",
-        activity.summary or "",
-        activity.key_points or "",
-        activity.description or "",
-    ]
-    combined_text = " ".join(text_parts)
-
-    # Update using raw SQL for tsvector
-    await db.execute(
-        text(
-            "UPDATE activities SET search_vector = to_tsvector('english', :text) WHERE id = :id"
-        ),
-        {"text": combined_text, "id": activity.id},
-    )
@@ -1,11 +1,12 @@
-from uuid import UUID, uuid4
-from datetime import datetime
+import asyncio
+from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, File, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func
+from sqlalchemy.orm import joinedload
 
+from app.database import uuid7
 from app.dependencies import get_db, CurrentUser, get_client_ip
 from app.models.user import User
 from app.models.activity import Activity
@@ -18,6 +19,8 @@ from app.schemas.attachment import AttachmentResponse, AttachmentUploadResponse
 
 router = APIRouter()
 
+MAX_CONCURRENT_UPLOADS = 8
+
 
 def get_blob_svc() -> BlobService:
     return get_blob_service()
@@ -54,24 +57,43 @@ async def upload_attachments(
             detail="Activity not found",
         )
 
-    uploaded = []
     errors = []
-
+    valid_files = []
     for file in files:
-        # Validate content type
         if file.content_type not in ALLOWED_CONTENT_TYPES:
             errors.append(f"File '{file.filename}' has unsupported content type: {file.content_type}")
-            continue
-
-        try:
-            attachment_id = uuid4()
-            blob_path = BlobService.generate_path(activity_id, attachment_id, file.filename)
+        else:
+            valid_files.append(file)
+
+    # The blob path needs the id before the row is inserted
+    attachment_ids = [uuid7() for _ in valid_files]
+    blob_paths = [
+        BlobService.generate_path(activity_id, attachment_id, file.filename)
+        for attachment_id, file in zip(attachment_ids, valid_files)
+    ]
+
+    # Blob uploads are independent network/disk I/O, so run them together,
+    # capped so one request can't open an unbounded number of connections
+    upload_slots = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+
+    async def upload(file: UploadFile, blob_path: str) -> tuple[str, bytes, int]:
+        async with upload_slots:
+            return await blob_service.upload(file, blob_path)
+
+    results = await asyncio.gather(
+        *(upload(file, blob_path) for file, blob_path in zip(valid_files, blob_paths)),
+        return_exceptions=True,
+    )
 
-            # Upload to blob storage
-            _, checksum, file_size = await blob_service.upload(file, blob_path)
+    uploaded = []
+    for file, attachment_id, blob_path, result in zip(valid_files, attachment_ids, blob_paths, results):
+        if isinstance(result, Exception):
+            errors.append(f"Failed to upload '{file.filename}': {str(result)}")
+            continue
 
-            # Create attachment record
-            attachment = Attachment(
+        _, checksum, file_size = result
+        uploaded.append(
+            Attachment(
                 id=attachment_id,
                 activity_id=activity_id,
                 filename=file.filename,
@@ -82,24 +104,21 @@ async def upload_attachments(
                 classification=activity.classification,
                 uploaded_by=current_user.id,
             )
-            db.add(attachment)
-            await db.flush()
-
-            # Log upload
-            await log_action(
-                db=db,
-                user_id=current_user.id,
-                action=AuditAction.CREATE,
-                entity_type="attachment",
-                entity_id=attachment.id,
-                details={"filename": file.filename, "activity_id": str(activity_id)},
-                ip_address=get_client_ip(request),
-            )
-
-            uploaded.append(attachment)
+        )
 
-        except Exception as e:
-            errors.append(f"Failed to upload '{file.filename}': {str(e)}")
+    # Flushed together by the first log_action below
+    db.add_all(uploaded)
+
+    for attachment in uploaded:
+        await log_action(
+            db=db,
+            user_id=current_user.id,
+            action=AuditAction.CREATE,
+            entity_type="attachment",
+            entity_id=attachment.id,
+            details={"filename": attachment.filename, "activity_id": str(activity_id)},
+            ip_address=get_client_ip(request),
+        )
 
     await db.commit()
 
@@ -116,7 +135,7 @@ async def download_attachment(
     current_user: CurrentUser = None,
     db: AsyncSession = Depends(get_db),
     blob_service: BlobService = Depends(get_blob_svc),
-) -> StreamingResponse:
+) -> Response:
     """Download an attachment."""
     accessible_classifications = filter_by_classification(current_user)
 
@@ -126,7 +145,7 @@ async def download_attachment(
             Attachment.id == attachment_id,
             Attachment.is_deleted == False,
         )
-        .options(selectinload(Attachment.activity))
+        .options(joinedload(Attachment.activity))
     )
     result = await db.execute(stmt)
     attachment = result.scalar_one_or_none()
@@ -196,7 +215,7 @@ async def delete_attachment(
 
     # Soft delete in database
     attachment.is_deleted = True
-    attachment.deleted_at = datetime.utcnow()
+    attachment.deleted_at = func.now()
 
     # Soft delete in blob storage
     await blob_service.delete(attachment.blob_path)
@@ -1,9 +1,9 @@
 from uuid import UUID
-from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload, joinedload
 
 from app.dependencies import get_db, CurrentUser, get_client_ip
 from app.models.user import User
@@ -47,7 +47,7 @@ async def list_contacts(
             Contact.is_deleted == False,
             Contact.classification.in_(accessible_classifications),
         )
-        .options(selectinload(Contact.organization))
+        .options(joinedload(Contact.organization))
     )
 
     # Apply filters
@@ -109,13 +109,13 @@ async def create_contact(
 
     # Add tags if provided
     if contact_data.tag_ids:
-        for tag_id in contact_data.tag_ids:
-            contact_tag = ContactTag(
-                contact_id=contact.id,
-                tag_id=tag_id,
-                tagged_by=current_user.id,
-            )
-            db.add(contact_tag)
+        await db.execute(
+            pg_insert(ContactTag).on_conflict_do_nothing(index_elements=["contact_id", "tag_id"]),
+            [
+                {"contact_id": contact.id, "tag_id": tag_id, "tagged_by": current_user.id}
+                for tag_id in contact_data.tag_ids
+            ],
+        )
 
     # Log creation
     await log_action(
@@ -134,10 +134,13 @@ async def create_contact(
         select(Contact)
         .where(Contact.id == contact.id)
         .options(
-            selectinload(Contact.organization),
-            selectinload(Contact.owner),
-            selectinload(Contact.tags).selectinload(ContactTag.tag),
+            joinedload(Contact.organization),
+            joinedload(Contact.owner),
+            selectinload(Contact.tags).joinedload(ContactTag.tag),
         )
+        # The contact is already in the identity map; without this its
+        # unloaded relationships are left as-is instead of eager-loaded
+        .execution_options(populate_existing=True)
     )
     result = await db.execute(stmt)
     contact = result.scalar_one()
@@ -163,9 +166,9 @@ async def get_contact(
             Contact.classification.in_(accessible_classifications),
         )
         .options(
-            selectinload(Contact.organization),
-            selectinload(Contact.owner),
-            selectinload(Contact.tags).selectinload(ContactTag.tag),
+            joinedload(Contact.organization),
+            joinedload(Contact.owner),
+            selectinload(Contact.tags).joinedload(ContactTag.tag),
         )
     )
     result = await db.execute(stmt)
@@ -247,7 +250,7 @@ async def update_contact(
             Contact.is_deleted == False,
             Contact.classification.in_(accessible_classifications),
         )
-        .options(selectinload(Contact.organization))
+        .options(joinedload(Contact.organization))
     )
     result = await db.execute(stmt)
     contact = result.scalar_one_or_none()
@@ -309,7 +312,7 @@ async def delete_contact(
         )
 
     contact.is_deleted = True
-    contact.deleted_at = datetime.utcnow()
+    contact.deleted_at = func.now()
 
     await log_action(
         db=db,
@@ -348,21 +351,16 @@ async def add_contact_tags(
             detail="Contact not found",
         )
 
-    for tag_id in tag_ids:
-        # Check if tag already exists
-        existing = await db.execute(
-            select(ContactTag).where(
-                ContactTag.contact_id == contact_id,
-                ContactTag.tag_id == tag_id,
-            )
+    if tag_ids:
+        # Tags the contact already has are skipped by the primary key
+        await db.execute(
+            pg_insert(ContactTag)
+            .values([
+                {"contact_id": contact_id, "tag_id": tag_id, "tagged_by": current_user.id}
+                for tag_id in tag_ids
+            ])
+            .on_conflict_do_nothing(index_elements=["contact_id", "tag_id"])
         )
-        if not existing.scalar_one_or_none():
-            contact_tag = ContactTag(
-                contact_id=contact_id,
-                tag_id=tag_id,
-                tagged_by=current_user.id,
-            )
-            db.add(contact_tag)
 
     await log_action(
         db=db,
@@ -375,9 +373,16 @@ async def add_contact_tags(
     )
 
     await db.commit()
-    await db.refresh(contact)
 
-    return contact
+    # Reload for the response; updated_at and organization aren't loaded after the commit
+    stmt = (
+        select(Contact)
+        .where(Contact.id == contact.id)
+        .options(joinedload(Contact.organization))
+        .execution_options(populate_existing=True)
+    )
+    result = await db.execute(stmt)
+    return result.scalar_one()
 
 
 @router.delete("/{contact_id}/tags/{tag_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -1,9 +1,10 @@
 from uuid import UUID
-from datetime import datetime, date
+from datetime import date, datetime, time, timedelta, timezone
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, text
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload, joinedload
 
 from app.dependencies import get_db, CurrentUser, get_client_ip
 from app.models.user import User
@@ -46,17 +47,30 @@ async def list_events(
     offset = (page - 1) * page_size
     accessible_classifications = filter_by_classification(current_user)
 
-    stmt = select(Event).where(
-        Event.is_deleted == False,
+    # Plain column rows: EventResponse reads them by attribute, and the list
+    # skips ORM instance construction
+    stmt = select(
+        Event.id,
+        Event.name,
+        Event.event_type,
+        Event.occurred_at,
+        Event.location,
+        Event.classification,
+        Event.owner_id,
+        Event.created_at,
+        Event.updated_at,
+    ).where(
+        Event.deleted_at.is_(None),
         Event.classification.in_(accessible_classifications),
     )
 
     if event_type:
         stmt = stmt.where(Event.event_type == event_type)
     if from_date:
-        stmt = stmt.where(func.date(Event.occurred_at) >= from_date)
+        stmt = stmt.where(Event.occurred_at >= datetime.combine(from_date, time.min, timezone.utc))
     if to_date:
-        stmt = stmt.where(func.date(Event.occurred_at) <= to_date)
+        day_after = datetime.combine(to_date + timedelta(days=1), time.min, timezone.utc)
+        stmt = stmt.where(Event.occurred_at < day_after)
     if owner_id:
         stmt = stmt.where(Event.owner_id == owner_id)
     if tag_ids:
@@ -71,7 +85,7 @@ async def list_events(
     # Get events
     stmt = stmt.offset(offset).limit(page_size).order_by(Event.occurred_at.desc())
     result = await db.execute(stmt)
-    events = result.scalars().all()
+    events = result.all()
 
     return {
         "items": events,
@@ -103,21 +117,20 @@ async def create_event(
     db.add(event)
     await db.flush()
 
-    # Update search vector
-    await _update_search_vector(db, event)
-
-    # Add attendees
+    # Add attendees, resolving each to a contact first, then one executemany
     if event_data.attendees:
+        attendee_rows = []
         for attendee_data in event_data.attendees:
             contact_id = await _resolve_attendee_contact(db, attendee_data, current_user)
             if contact_id:
-                event_attendee = EventAttendee(
-                    event_id=event.id,
-                    contact_id=contact_id,
-                    role=attendee_data.role,
-                    notes=attendee_data.notes,
-                )
-                db.add(event_attendee)
+                attendee_rows.append({
+                    "event_id": event.id,
+                    "contact_id": contact_id,
+                    "role": attendee_data.role,
+                    "notes": attendee_data.notes,
+                })
+        if attendee_rows:
+            await db.execute(insert(EventAttendee), attendee_rows)
 
     # Add pitches
     if event_data.pitches:
@@ -136,13 +149,13 @@ async def create_event(
 
     # Add tags
     if event_data.tag_ids:
-        for tag_id in event_data.tag_ids:
-            event_tag = EventTag(
-                event_id=event.id,
-                tag_id=tag_id,
-                tagged_by=current_user.id,
-            )
-            db.add(event_tag)
+        await db.execute(
+            pg_insert(EventTag).on_conflict_do_nothing(index_elements=["event_id", "tag_id"]),
+            [
+                {"event_id": event.id, "tag_id": tag_id, "tagged_by": current_user.id}
+                for tag_id in event_data.tag_ids
+            ],
+        )
 
     # Log creation
     await log_action(
@@ -155,7 +168,6 @@ async def create_event(
     )
 
     await db.commit()
-    await db.refresh(event)
 
     return event
 
@@ -174,14 +186,14 @@ async def get_event(
         select(Event)
         .where(
             Event.id == event_id,
-            Event.is_deleted == False,
+            Event.deleted_at.is_(None),
             Event.classification.in_(accessible_classifications),
         )
         .options(
-            selectinload(Event.owner),
-            selectinload(Event.attendees).selectinload(EventAttendee.contact).selectinload(Contact.organization),
-            selectinload(Event.pitches).selectinload(EventPitch.pitcher),
-            selectinload(Event.tags).selectinload(EventTag.tag),
+            joinedload(Event.owner),
+            selectinload(Event.attendees).joinedload(EventAttendee.contact).joinedload(Contact.organization),
+            selectinload(Event.pitches).joinedload(EventPitch.pitcher),
+            selectinload(Event.tags).joinedload(EventTag.tag),
             selectinload(Event.versions),
         )
     )
@@ -273,10 +285,9 @@ async def update_event(
         select(Event)
         .where(
             Event.id == event_id,
-            Event.is_deleted == False,
+            Event.deleted_at.is_(None),
             Event.classification.in_(accessible_classifications),
         )
-        .options(selectinload(Event.versions))
     )
     result = await db.execute(stmt)
     event = result.scalar_one_or_none()
@@ -288,19 +299,22 @@ async def update_event(
         )
 
     # Create version snapshot before updating
-    version_number = len(event.versions) + 1
     snapshot = {
         "name": event.name,
-        "event_type": event.event_type.value,
-        "occurred_at": event.occurred_at.isoformat(),
+        "event_type": event.event_type,
+        "occurred_at": event.occurred_at,
         "location": event.location,
         "description": event.description,
         "notes": event.notes,
-        "classification": event.classification.value,
+        "classification": event.classification,
     }
     version = EventVersion(
         event_id=event.id,
-        version_number=version_number,
+        version_number=(
+            select(func.coalesce(func.max(EventVersion.version_number), 0) + 1)
+            .where(EventVersion.event_id == event.id)
+            .scalar_subquery()
+        ),
         snapshot=snapshot,
         changed_by=current_user.id,
     )
@@ -315,10 +329,6 @@ async def update_event(
             changes[field] = {"old": str(old_value), "new": str(value)}
             setattr(event, field, value)
 
-    # Update search vector if relevant fields changed
-    if any(f in changes for f in ["name", "description", "notes"]):
-        await _update_search_vector(db, event)
-
     if changes:
         await log_action(
             db=db,
@@ -331,7 +341,6 @@ async def update_event(
         )
 
     await db.commit()
-    await db.refresh(event)
 
     return event
 
@@ -348,7 +357,7 @@ async def delete_event(
 
     stmt = select(Event).where(
         Event.id == event_id,
-        Event.is_deleted == False,
+        Event.deleted_at.is_(None),
         Event.classification.in_(accessible_classifications),
     )
     result = await db.execute(stmt)
@@ -360,8 +369,7 @@ async def delete_event(
             detail="Event not found",
         )
 
-    event.is_deleted = True
-    event.deleted_at = datetime.utcnow()
+    event.deleted_at = func.now()
 
     await log_action(
         db=db,
@@ -389,7 +397,7 @@ async def add_event_attendee(
     # Verify event exists
     stmt = select(Event).where(
         Event.id == event_id,
-        Event.is_deleted == False,
+        Event.deleted_at.is_(None),
         Event.classification.in_(accessible_classifications),
     )
     result = await db.execute(stmt)
@@ -435,7 +443,7 @@ async def add_event_attendee(
     contact_stmt = (
         select(Contact)
         .where(Contact.id == contact_id)
-        .options(selectinload(Contact.organization))
+        .options(joinedload(Contact.organization))
     )
     contact_result = await db.execute(contact_stmt)
     contact = contact_result.scalar_one()
@@ -465,7 +473,7 @@ async def add_event_pitch(
     # Verify event exists
     stmt = select(Event).where(
         Event.id == event_id,
-        Event.is_deleted == False,
+        Event.deleted_at.is_(None),
         Event.classification.in_(accessible_classifications),
     )
     result = await db.execute(stmt)
@@ -527,7 +535,7 @@ async def get_event_versions(
     # First verify access to the event
     event_stmt = select(Event).where(
         Event.id == event_id,
-        Event.is_deleted == False,
+        Event.deleted_at.is_(None),
         Event.classification.in_(accessible_classifications),
     )
     event_result = await db.execute(event_stmt)
@@ -582,21 +590,3 @@ async def _resolve_attendee_contact(
 
     return None
 
-
-async def _update_search_vector(db: AsyncSession, event: Event) -> None:
-    """Update the search vector for full-text search."""
-    # Combine searchable text
-    text_parts = [
-        event.name or "",
-        event.description or "",
-        event.notes or "",
-    ]
-    combined_text = " ".join(text_parts)
-
-    # Update using raw SQL for tsvector
-    await db.execute(
-        text(
-            "UPDATE events SET search_vector = to_tsvector('english', :text) WHERE id = :id"
-        ),
-        {"text": combined_text, "id": event.id},
-    )
@@ -1,9 +1,9 @@
 from uuid import UUID
-from datetime import datetime, date
+from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from app.dependencies import get_db, CurrentUser, get_client_ip
 from app.models.user import User
@@ -45,7 +45,7 @@ async def list_followups(
             Activity.is_deleted == False,
             Activity.classification.in_(accessible_classifications),
         )
-        .options(selectinload(FollowUp.assigned_to_user))
+        .options(joinedload(FollowUp.assigned_to_user))
     )
 
     if assigned_to:
@@ -196,7 +196,7 @@ async def update_followup(
             Activity.is_deleted == False,
             Activity.classification.in_(accessible_classifications),
         )
-        .options(selectinload(FollowUp.assigned_to_user))
+        .options(joinedload(FollowUp.assigned_to_user))
     )
     result = await db.execute(stmt)
     followup = result.scalar_one_or_none()
@@ -219,7 +219,7 @@ async def update_followup(
 
     # Set completed_at if status changed to COMPLETED
     if followup_update.status == FollowUpStatus.COMPLETED and followup.completed_at is None:
-        followup.completed_at = datetime.utcnow()
+        followup.completed_at = func.now()
     elif followup_update.status and followup_update.status != FollowUpStatus.COMPLETED:
         followup.completed_at = None
 
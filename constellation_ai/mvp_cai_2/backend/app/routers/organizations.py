@@ -1,13 +1,13 @@
 from uuid import UUID
-from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload, joinedload
 
 from app.dependencies import get_db, CurrentUser, get_client_ip
 from app.models.user import User
-from app.models.organization import Organization
+from app.models.organization import Organization, OrgType
 from app.models.tag import OrganizationTag
 from app.models.audit import AuditAction
 from app.auth.rbac import filter_by_classification
@@ -28,7 +28,7 @@ router = APIRouter()
 async def list_organizations(
     page: int = 1,
     page_size: int = 25,
-    org_type: str | None = None,
+    org_type: OrgType | None = None,
     owner_id: UUID | None = None,
     search: str | None = None,
     current_user: CurrentUser = None,
@@ -38,9 +38,20 @@ async def list_organizations(
     offset = (page - 1) * page_size
     accessible_classifications = filter_by_classification(current_user)
 
-    # Base query
-    stmt = select(Organization).where(
-        Organization.is_deleted == False,
+    # Base query; plain column rows, since OrganizationResponse reads them by
+    # attribute and the list skips ORM instance construction
+    stmt = select(
+        Organization.id,
+        Organization.name,
+        Organization.short_name,
+        Organization.org_type,
+        Organization.website,
+        Organization.classification,
+        Organization.owner_id,
+        Organization.created_at,
+        Organization.updated_at,
+    ).where(
+        Organization.deleted_at.is_(None),
         Organization.classification.in_(accessible_classifications),
     )
 
@@ -64,7 +75,7 @@ async def list_organizations(
     # Get organizations
     stmt = stmt.offset(offset).limit(page_size).order_by(Organization.name)
     result = await db.execute(stmt)
-    organizations = result.scalars().all()
+    organizations = result.all()
 
     return {
         "items": organizations,
@@ -97,13 +108,13 @@ async def create_organization(
 
     # Add tags if provided
     if org_data.tag_ids:
-        for tag_id in org_data.tag_ids:
-            org_tag = OrganizationTag(
-                organization_id=org.id,
-                tag_id=tag_id,
-                tagged_by=current_user.id,
-            )
-            db.add(org_tag)
+        await db.execute(
+            pg_insert(OrganizationTag).on_conflict_do_nothing(index_elements=["organization_id", "tag_id"]),
+            [
+                {"organization_id": org.id, "tag_id": tag_id, "tagged_by": current_user.id}
+                for tag_id in org_data.tag_ids
+            ],
+        )
 
     # Log creation
     await log_action(
@@ -116,7 +127,6 @@ async def create_organization(
     )
 
     await db.commit()
-    await db.refresh(org)
 
     return org
 
@@ -135,13 +145,13 @@ async def get_organization(
         select(Organization)
         .where(
             Organization.id == org_id,
-            Organization.is_deleted == False,
+            Organization.deleted_at.is_(None),
             Organization.classification.in_(accessible_classifications),
         )
         .options(
-            selectinload(Organization.owner),
+            joinedload(Organization.owner),
             selectinload(Organization.contacts),
-            selectinload(Organization.tags).selectinload(OrganizationTag.tag),
+            selectinload(Organization.tags).joinedload(OrganizationTag.tag),
         )
     )
     result = await db.execute(stmt)
@@ -195,7 +205,7 @@ async def update_organization(
 
     stmt = select(Organization).where(
         Organization.id == org_id,
-        Organization.is_deleted == False,
+        Organization.deleted_at.is_(None),
         Organization.classification.in_(accessible_classifications),
     )
     result = await db.execute(stmt)
@@ -228,7 +238,6 @@ async def update_organization(
         )
 
     await db.commit()
-    await db.refresh(org)
 
     return org
 
@@ -245,7 +254,7 @@ async def delete_organization(
 
     stmt = select(Organization).where(
         Organization.id == org_id,
-        Organization.is_deleted == False,
+        Organization.deleted_at.is_(None),
         Organization.classification.in_(accessible_classifications),
     )
     result = await db.execute(stmt)
@@ -257,8 +266,7 @@ async def delete_organization(
             detail="Organization not found",
         )
 
-    org.is_deleted = True
-    org.deleted_at = datetime.utcnow()
+    org.deleted_at = func.now()
 
     await log_action(
         db=db,
@@ -3,8 +3,8 @@ from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import select, func, case
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, case, Row, Select
+from sqlalchemy.orm import selectinload, joinedload
 
 from app.dependencies import get_db, CurrentUser, get_client_ip
 from app.models.user import User, UserRole
@@ -15,7 +15,7 @@ from app.models.pipeline import (
     PipelineStageHistory,
     PipelineStatus,
     PipelineStage,
-    STAGE_LABELS,
+    label_for_stage,
 )
 from app.models.audit import AuditAction
 from app.services.audit_service import log_action
@@ -57,8 +57,8 @@ async def _record_stage_history(
     item_id: UUID,
     from_stage: int | None,
     to_stage: int,
-    from_status: str | None,
-    to_status: str,
+    from_status: PipelineStatus | None,
+    to_status: PipelineStatus,
     changed_by_id: UUID,
     note: str | None = None,
 ) -> PipelineStageHistory:
@@ -75,6 +75,16 @@ async def _record_stage_history(
     return history
 
 
+async def _user_names(db: AsyncSession, user_ids: set[UUID]) -> dict[UUID, str]:
+    """Map user ids to display names in one query, without loading User objects."""
+    if not user_ids:
+        return {}
+    result = await db.execute(
+        select(User.id, User.display_name).where(User.id.in_(user_ids))
+    )
+    return dict(result.all())
+
+
 def _compute_days(dt: datetime) -> int:
     now = datetime.now(timezone.utc)
     if dt.tzinfo is None:
@@ -97,7 +107,7 @@ def _build_item_response(item: PipelineItem) -> dict:
         "primary_contact_id": item.primary_contact_id,
         "primary_contact_name": contact_name,
         "stage": item.stage,
-        "stage_label": STAGE_LABELS.get(item.stage),
+        "stage_label": label_for_stage(item.stage),
         "status": item.status,
         "owner_id": item.owner_id,
         "owner_name": owner_name,
@@ -114,6 +124,51 @@ def _build_item_response(item: PipelineItem) -> dict:
     }
 
 
+# Columns of a PipelineItemResponse that list views read as plain rows, so
+# dashboard-sized pulls skip ORM identity-map and instance construction.
+_ITEM_ROW_COLUMNS = (
+    PipelineItem.id,
+    PipelineItem.organization_id,
+    Organization.name.label("organization_name"),
+    PipelineItem.primary_contact_id,
+    (Contact.first_name + " " + Contact.last_name).label("primary_contact_name"),
+    PipelineItem.stage,
+    PipelineItem.status,
+    PipelineItem.owner_id,
+    User.display_name.label("owner_name"),
+    PipelineItem.created_by,
+    PipelineItem.back_burner_reason,
+    PipelineItem.passed_reason,
+    PipelineItem.notes,
+    PipelineItem.entered_pipeline_at,
+    PipelineItem.last_stage_change_at,
+    PipelineItem.created_at,
+    PipelineItem.updated_at,
+)
+
+
+def _item_rows_stmt(*where) -> Select:
+    """Select non-deleted pipeline items as rows of ``_ITEM_ROW_COLUMNS``."""
+    return (
+        select(*_ITEM_ROW_COLUMNS)
+        .select_from(PipelineItem)
+        .outerjoin(Organization, Organization.id == PipelineItem.organization_id)
+        .outerjoin(Contact, Contact.id == PipelineItem.primary_contact_id)
+        .outerjoin(User, User.id == PipelineItem.owner_id)
+        .where(PipelineItem.deleted_at.is_(None), *where)
+    )
+
+
+def _build_row_response(row: Row) -> dict:
+    """Build a PipelineItemResponse-compatible dict from an ``_item_rows_stmt`` row."""
+    return {
+        **row._mapping,
+        "stage_label": label_for_stage(row.stage),
+        "days_in_stage": _compute_days(row.last_stage_change_at),
+        "days_in_pipeline": _compute_days(row.entered_pipeline_at),
+    }
+
+
 async def _get_item(
     db: AsyncSession,
     item_id: UUID,
@@ -122,19 +177,16 @@ async def _get_item(
 ) -> PipelineItem:
     """Fetch a non-deleted pipeline item or raise 404."""
     options = [
-        selectinload(PipelineItem.organization),
-        selectinload(PipelineItem.primary_contact),
-        selectinload(PipelineItem.owner),
+        joinedload(PipelineItem.organization),
+        joinedload(PipelineItem.primary_contact),
+        joinedload(PipelineItem.owner),
     ]
     if load_history:
-        options.append(
-            selectinload(PipelineItem.stage_history)
-            .selectinload(PipelineStageHistory.changed_by)
-        )
+        options.append(selectinload(PipelineItem.stage_history))
 
     stmt = (
         select(PipelineItem)
-        .where(PipelineItem.id == item_id, PipelineItem.is_deleted == False)
+        .where(PipelineItem.id == item_id, PipelineItem.deleted_at.is_(None))
         .options(*options)
     )
     result = await db.execute(stmt)
@@ -160,7 +212,7 @@ async def create_pipeline_item(
     """Create a new pipeline item with initial history entry."""
     # Verify organization exists
     org_stmt = select(Organization).where(
-        Organization.id == data.organization_id, Organization.is_deleted == False
+        Organization.id == data.organization_id, Organization.deleted_at.is_(None)
     )
     org_result = await db.execute(org_stmt)
     if not org_result.scalar_one_or_none():
@@ -202,7 +254,7 @@ async def create_pipeline_item(
         from_stage=None,
         to_stage=item.stage,
         from_status=None,
-        to_status=PipelineStatus.ACTIVE.value,
+        to_status=PipelineStatus.ACTIVE,
         changed_by_id=current_user.id,
         note="Pipeline item created",
     )
@@ -236,35 +288,30 @@ async def list_pipeline_items(
     """List pipeline items with pagination and filtering."""
     offset = (page - 1) * page_size
 
-    stmt = (
-        select(PipelineItem)
-        .where(PipelineItem.is_deleted == False)
-        .options(
-            selectinload(PipelineItem.organization),
-            selectinload(PipelineItem.primary_contact),
-            selectinload(PipelineItem.owner),
-        )
-    )
-
+    filters = []
     if status_filter:
-        stmt = stmt.where(PipelineItem.status == status_filter)
+        filters.append(PipelineItem.status == status_filter)
     if stage is not None:
-        stmt = stmt.where(PipelineItem.stage == stage)
+        filters.append(PipelineItem.stage == stage)
     if owner_id:
-        stmt = stmt.where(PipelineItem.owner_id == owner_id)
+        filters.append(PipelineItem.owner_id == owner_id)
 
-    # Count
-    count_stmt = select(func.count()).select_from(stmt.subquery())
+    # Count (the display-name joins don't change it)
+    count_stmt = select(func.count()).where(PipelineItem.deleted_at.is_(None), *filters)
     total_result = await db.execute(count_stmt)
     total = total_result.scalar()
 
     # Fetch
-    stmt = stmt.offset(offset).limit(page_size).order_by(PipelineItem.last_stage_change_at.desc())
+    stmt = (
+        _item_rows_stmt(*filters)
+        .offset(offset)
+        .limit(page_size)
+        .order_by(PipelineItem.last_stage_change_at.desc())
+    )
     result = await db.execute(stmt)
-    items = result.scalars().all()
 
     return {
-        "items": [_build_item_response(i) for i in items],
+        "items": [_build_row_response(row) for row in result],
         "total": total,
         "page": page,
         "page_size": page_size,
@@ -279,60 +326,48 @@ async def get_pipeline_board(
     """Get Kanban board view: ACTIVE items grouped by stage, plus BACK_BURNER items."""
     # Fetch all non-deleted ACTIVE items
     active_stmt = (
-        select(PipelineItem)
-        .where(
-            PipelineItem.is_deleted == False,
-            PipelineItem.status == PipelineStatus.ACTIVE,
-        )
-        .options(
-            selectinload(PipelineItem.organization),
-            selectinload(PipelineItem.primary_contact),
-            selectinload(PipelineItem.owner),
-        )
+        _item_rows_stmt(PipelineItem.status == PipelineStatus.ACTIVE)
         .order_by(PipelineItem.last_stage_change_at.asc())
     )
     active_result = await db.execute(active_stmt)
-    active_items = active_result.scalars().all()
 
     # Group by stage
     stage_groups: dict[int, list[dict]] = {s: [] for s in range(1, 7)}
-    for item in active_items:
-        stage_groups[item.stage].append(_build_item_response(item))
+    for row in active_result:
+        stage_groups[row.stage].append(_build_row_response(row))
 
     stages = [
-        PipelineBoardStage(stage=s, label=STAGE_LABELS[s], items=stage_groups[s])
+        PipelineBoardStage(stage=s, label=label_for_stage(s), items=stage_groups[s])
         for s in range(1, 7)
     ]
 
-    # Fetch BACK_BURNER items with history to derive stage_when_shelved
+    # Fetch BACK_BURNER items
     bb_stmt = (
-        select(PipelineItem)
-        .where(
-            PipelineItem.is_deleted == False,
-            PipelineItem.status == PipelineStatus.BACK_BURNER,
-        )
-        .options(
-            selectinload(PipelineItem.organization),
-            selectinload(PipelineItem.primary_contact),
-            selectinload(PipelineItem.owner),
-            selectinload(PipelineItem.stage_history),
-        )
+        _item_rows_stmt(PipelineItem.status == PipelineStatus.BACK_BURNER)
         .order_by(PipelineItem.last_stage_change_at.desc())
     )
-    bb_result = await db.execute(bb_stmt)
-    bb_items = bb_result.scalars().all()
+    bb_rows = (await db.execute(bb_stmt)).all()
+
+    # Derive stage_when_shelved from the last history entry where to_status == BACK_BURNER;
+    # rows come oldest first, so later entries overwrite earlier ones
+    shelved_stages: dict[UUID, int | None] = {}
+    if bb_rows:
+        shelved_stmt = (
+            select(PipelineStageHistory.pipeline_item_id, PipelineStageHistory.from_stage)
+            .where(
+                PipelineStageHistory.pipeline_item_id.in_([row.id for row in bb_rows]),
+                PipelineStageHistory.to_status == PipelineStatus.BACK_BURNER,
+            )
+            .order_by(PipelineStageHistory.changed_at, PipelineStageHistory.id)
+        )
+        shelved_stages = dict((await db.execute(shelved_stmt)).tuples().all())
 
     back_burner_list: list[dict] = []
-    for item in bb_items:
-        resp = _build_item_response(item)
-        # Derive stage_when_shelved from last history entry where to_status == BACK_BURNER
-        shelved_stage: int | None = None
-        for h in reversed(item.stage_history):
-            if h.to_status == PipelineStatus.BACK_BURNER.value:
-                shelved_stage = h.from_stage
-                break
+    for row in bb_rows:
+        resp = _build_row_response(row)
+        shelved_stage = shelved_stages.get(row.id)
         resp["stage_when_shelved"] = shelved_stage
-        resp["stage_when_shelved_label"] = STAGE_LABELS.get(shelved_stage) if shelved_stage else None
+        resp["stage_when_shelved_label"] = label_for_stage(shelved_stage) if shelved_stage else None
         back_burner_list.append(resp)
 
     # Summary counts
@@ -341,7 +376,7 @@ async def get_pipeline_board(
         func.count().filter(PipelineItem.status == PipelineStatus.BACK_BURNER).label("back_burner"),
         func.count().filter(PipelineItem.status == PipelineStatus.PASSED).label("passed"),
         func.count().filter(PipelineItem.status == PipelineStatus.CONVERTED).label("converted"),
-    ).where(PipelineItem.is_deleted == False)
+    ).where(PipelineItem.deleted_at.is_(None))
     count_result = await db.execute(count_stmt)
     counts = count_result.one()
 
@@ -366,6 +401,7 @@ async def get_pipeline_item(
     """Get pipeline item detail with full stage history."""
     item = await _get_item(db, item_id, load_history=True)
     resp = _build_item_response(item)
+    changer_names = await _user_names(db, {h.changed_by_id for h in item.stage_history})
 
     resp["stage_history"] = [
         PipelineStageHistoryResponse(
@@ -376,9 +412,9 @@ async def get_pipeline_item(
             from_status=h.from_status,
             to_status=h.to_status,
             changed_by_id=h.changed_by_id,
-            changed_by_name=h.changed_by.display_name if h.changed_by else None,
-            from_stage_label=STAGE_LABELS.get(h.from_stage) if h.from_stage else None,
-            to_stage_label=STAGE_LABELS.get(h.to_stage),
+            changed_by_name=changer_names.get(h.changed_by_id),
+            from_stage_label=label_for_stage(h.from_stage) if h.from_stage else None,
+            to_stage_label=label_for_stage(h.to_stage),
             note=h.note,
             changed_at=h.changed_at,
         )
@@ -422,7 +458,7 @@ async def update_pipeline_item(
 
     if "stage" in changes:
         stage_changed = True
-        item.last_stage_change_at = datetime.now(timezone.utc)
+        item.last_stage_change_at = func.now()
 
     if "status" in changes:
         status_changed = True
@@ -433,8 +469,8 @@ async def update_pipeline_item(
             item_id=item.id,
             from_stage=old_stage,
             to_stage=item.stage,
-            from_status=old_status.value if isinstance(old_status, PipelineStatus) else str(old_status),
-            to_status=item.status.value if isinstance(item.status, PipelineStatus) else str(item.status),
+            from_status=old_status,
+            to_status=item.status,
             changed_by_id=current_user.id,
         )
 
@@ -465,11 +501,9 @@ async def delete_pipeline_item(
     item = await _get_item(db, item_id)
     _check_can_modify(current_user, item)
 
-    now = datetime.now(timezone.utc)
     item.status = PipelineStatus.PASSED
     item.passed_reason = item.passed_reason or "Removed"
-    item.is_deleted = True
-    item.deleted_at = now
+    item.deleted_at = func.now()
 
     await log_action(
         db=db,
@@ -501,7 +535,7 @@ async def advance_pipeline_item(
             detail="Cannot advance a CONVERTED pipeline item",
         )
 
-    if item.stage >= 6:
+    if item.stage >= PipelineStage.DOCS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Pipeline item is already at the final stage (6 - Docs)",
@@ -509,15 +543,15 @@ async def advance_pipeline_item(
 
     old_stage = item.stage
     item.stage = old_stage + 1
-    item.last_stage_change_at = datetime.now(timezone.utc)
+    item.last_stage_change_at = func.now()
 
     await _record_stage_history(
         db=db,
         item_id=item.id,
         from_stage=old_stage,
         to_stage=item.stage,
-        from_status=item.status.value,
-        to_status=item.status.value,
+        from_status=item.status,
+        to_status=item.status,
         changed_by_id=current_user.id,
         note=data.note,
     )
@@ -533,7 +567,6 @@ async def advance_pipeline_item(
     )
 
     await db.commit()
-    item = await _get_item(db, item.id)
     return _build_item_response(item)
 
 
@@ -555,7 +588,7 @@ async def revert_pipeline_item(
             detail="Cannot revert a CONVERTED pipeline item",
         )
 
-    if item.stage <= 1:
+    if item.stage <= PipelineStage.FIRST_MEETING:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Pipeline item is already at the first stage (1 - First Meeting)",
@@ -563,15 +596,15 @@ async def revert_pipeline_item(
 
     old_stage = item.stage
     item.stage = old_stage - 1
-    item.last_stage_change_at = datetime.now(timezone.utc)
+    item.last_stage_change_at = func.now()
 
     await _record_stage_history(
         db=db,
         item_id=item.id,
         from_stage=old_stage,
         to_stage=item.stage,
-        from_status=item.status.value,
-        to_status=item.status.value,
+        from_status=item.status,
+        to_status=item.status,
         changed_by_id=current_user.id,
         note=data.note,
     )
@@ -587,7 +620,6 @@ async def revert_pipeline_item(
     )
 
     await db.commit()
-    item = await _get_item(db, item.id)
     return _build_item_response(item)
 
 
@@ -600,7 +632,7 @@ async def reactivate_pipeline_item(
     db: AsyncSession = Depends(get_db),
 ) -> dict:
     """Reactivate a BACK_BURNER or PASSED item back to ACTIVE."""
-    item = await _get_item(db, item_id, load_history=True)
+    item = await _get_item(db, item_id)
     _check_can_modify(current_user, item)
 
     if item.status == PipelineStatus.CONVERTED:
@@ -622,17 +654,26 @@ async def reactivate_pipeline_item(
     if data.stage is not None:
         target_stage = data.stage
     else:
-        # Try to restore the stage from before it was shelved/passed
-        target_stage = old_stage  # fallback: keep current stage
-        for h in reversed(item.stage_history):
-            if h.to_status in (PipelineStatus.BACK_BURNER.value, PipelineStatus.PASSED.value):
-                if h.from_stage is not None:
-                    target_stage = h.from_stage
-                break
+        # Try to restore the stage from before it was shelved/passed: only the
+        # latest such transition matters, so let Postgres find it
+        shelved_stmt = (
+            select(PipelineStageHistory.from_stage)
+            .where(
+                PipelineStageHistory.pipeline_item_id == item.id,
+                PipelineStageHistory.to_status.in_(
+                    (PipelineStatus.BACK_BURNER, PipelineStatus.PASSED)
+                ),
+            )
+            .order_by(PipelineStageHistory.changed_at.desc(), PipelineStageHistory.id.desc())
+            .limit(1)
+        )
+        shelved_stage = await db.scalar(shelved_stmt)
+        # fallback: keep current stage
+        target_stage = shelved_stage if shelved_stage is not None else old_stage
 
     item.status = PipelineStatus.ACTIVE
     item.stage = target_stage
-    item.last_stage_change_at = datetime.now(timezone.utc)
+    item.last_stage_change_at = func.now()
     item.back_burner_reason = None
     item.passed_reason = None
 
@@ -641,8 +682,8 @@ async def reactivate_pipeline_item(
         item_id=item.id,
         from_stage=old_stage,
         to_stage=item.stage,
-        from_status=old_status.value,
-        to_status=PipelineStatus.ACTIVE.value,
+        from_status=old_status,
+        to_status=PipelineStatus.ACTIVE,
         changed_by_id=current_user.id,
         note=data.note,
     )
@@ -661,5 +702,4 @@ async def reactivate_pipeline_item(
     )
 
     await db.commit()
-    item = await _get_item(db, item.id)
     return _build_item_response(item)
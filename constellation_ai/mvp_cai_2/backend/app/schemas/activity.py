@@ -107,7 +107,6 @@ class ActivityDetail(ActivityResponse):
     tags: list[TagResponse] = []
     attachments: list[AttachmentSummary] = []
     followups: list[FollowUpResponse] = []
-    versions: list[ActivityVersionResponse] = []
 
     class Config:
         from_attributes = True
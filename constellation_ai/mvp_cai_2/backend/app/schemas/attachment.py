@@ -1,6 +1,6 @@
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 from app.models.organization import Classification
 
@@ -18,6 +18,12 @@ class AttachmentResponse(BaseModel):
     uploaded_by: UUID
     created_at: datetime
 
+    @field_validator("checksum", mode="before")
+    @classmethod
+    def checksum_to_hex(cls, v: bytes | str | None) -> str | None:
+        # Stored as the raw digest; the API keeps returning hex
+        return v.hex() if isinstance(v, bytes) else v
+
     class Config:
         from_attributes = True
 
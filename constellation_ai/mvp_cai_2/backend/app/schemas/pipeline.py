@@ -2,7 +2,7 @@ from datetime import datetime, date
 from uuid import UUID
 from pydantic import BaseModel, field_validator, model_validator
 
-from app.models.pipeline import PipelineStatus, STAGE_LABELS
+from app.models.pipeline import PipelineStatus
 
 
 # --- Request schemas ---
@@ -74,8 +74,8 @@ class PipelineStageHistoryResponse(BaseModel):
     pipeline_item_id: UUID
     from_stage: int | None
     to_stage: int
-    from_status: str | None
-    to_status: str
+    from_status: PipelineStatus | None
+    to_status: PipelineStatus
     changed_by_id: UUID
     changed_by_name: str | None = None
     from_stage_label: str | None = None
@@ -5,7 +5,7 @@ from uuid import UUID
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer, joinedload
 
 from app.models.user import User
 from app.models.contact import Contact
@@ -58,7 +58,7 @@ class ExportService:
             select(Contact)
             .where(Contact.id == contact_id)
             .options(
-                selectinload(Contact.organization),
+                joinedload(Contact.organization),
                 selectinload(Contact.tags),
             )
         )
@@ -147,7 +147,7 @@ class ExportService:
                 selectinload(Activity.attendees),
                 selectinload(Activity.tags),
                 selectinload(Activity.attachments),
-                selectinload(Activity.versions),
+                selectinload(Activity.versions).options(undefer(ActivityVersion.snapshot)),
                 selectinload(Activity.followups),
             )
         )
@@ -246,7 +246,7 @@ class ExportService:
                 "user_id": str(a.user_id) if a.user_id else None,
                 "action": a.action.value,
                 "details": a.details,
-                "ip_address": a.ip_address,
+                "ip_address": str(a.ip_address) if a.ip_address else None,
                 "created_at": a.created_at.isoformat(),
             }
             for a in audit_entries
@@ -1,8 +1,8 @@
 from uuid import UUID
-from datetime import date
+from datetime import date, datetime, time, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, or_, and_, text
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from app.models.user import User
 from app.models.contact import Contact
@@ -91,7 +91,7 @@ class SearchService:
                     func.lower(Contact.notes).like(search_term),
                 ),
             )
-            .options(selectinload(Contact.organization))
+            .options(joinedload(Contact.organization))
         )
 
         if organization_id:
@@ -131,7 +131,7 @@ class SearchService:
         search_term = f"%{query.lower()}%"
 
         stmt = select(Organization).where(
-            Organization.is_deleted == False,
+            Organization.deleted_at.is_(None),
             Organization.classification.in_(self.accessible_classifications),
             or_(
                 func.lower(Organization.name).like(search_term),
@@ -187,10 +187,11 @@ class SearchService:
         )
 
         if from_date:
-            stmt = stmt.where(func.date(Activity.occurred_at) >= from_date)
+            stmt = stmt.where(Activity.occurred_at >= datetime.combine(from_date, time.min, timezone.utc))
 
         if to_date:
-            stmt = stmt.where(func.date(Activity.occurred_at) <= to_date)
+            day_after = datetime.combine(to_date + timedelta(days=1), time.min, timezone.utc)
+            stmt = stmt.where(Activity.occurred_at < day_after)
 
         if activity_type:
             stmt = stmt.where(Activity.activity_type == activity_type)
@@ -262,7 +263,7 @@ class SearchService:
         ts_query = func.plainto_tsquery("english", query)
 
         stmt = select(Event).where(
-            Event.is_deleted == False,
+            Event.deleted_at.is_(None),
             Event.classification.in_(self.accessible_classifications),
             or_(
                 Event.search_vector.op("@@")(ts_query),
@@ -271,10 +272,11 @@ class SearchService:
         )
 
         if from_date:
-            stmt = stmt.where(func.date(Event.occurred_at) >= from_date)
+            stmt = stmt.where(Event.occurred_at >= datetime.combine(from_date, time.min, timezone.utc))
 
         if to_date:
-            stmt = stmt.where(func.date(Event.occurred_at) <= to_date)
+            day_after = datetime.combine(to_date + timedelta(days=1), time.min, timezone.utc)
+            stmt = stmt.where(Event.occurred_at < day_after)
 
         if event_type:
             stmt = stmt.where(Event.event_type == event_type)
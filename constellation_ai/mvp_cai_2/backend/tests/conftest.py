@@ -8,11 +8,13 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
 )
 from sqlalchemy import text
+import orjson
 
 from app.main import app as fastapi_app
-from app.database import Base
+from app.database import Base, json_dumps
 from app.dependencies import get_db, get_current_user
 from app.models.user import User, UserRole
+from app.routers.activities import clear_list_cache
 
 # Import all models so that Base.metadata knows about them
 import app.models  # noqa: F401
@@ -36,7 +38,9 @@ def event_loop():
 @pytest.fixture(scope="function")
 async def test_engine():
     """Create a fresh engine per test and ensure tables exist."""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    engine = create_async_engine(
+        TEST_DATABASE_URL, echo=False, json_serializer=json_dumps, json_deserializer=orjson.loads
+    )
     # Ensure all tables exist
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -46,6 +50,8 @@ async def test_engine():
         if table_names:
             tables_str = ", ".join(table_names)
             await conn.execute(text(f"TRUNCATE TABLE {tables_str} CASCADE"))
+    # Cached list pages would outlive the truncate
+    clear_list_cache()
     yield engine
     await engine.dispose()
 
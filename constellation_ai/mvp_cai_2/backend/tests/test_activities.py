@@ -210,7 +210,8 @@ async def test_get_activity_detail(client: AsyncClient):
     assert "tags" in data
     assert "attachments" in data
     assert "followups" in data
-    assert "versions" in data
+    # Version history is served by /versions only
+    assert "versions" not in data
 
 
 @pytest.mark.asyncio
@@ -246,6 +247,9 @@ async def test_update_activity(client: AsyncClient):
     assert len(versions) == 1
     assert versions[0]["version_number"] == 1
     assert versions[0]["snapshot"]["title"] == "Original Title"
+    # Enums and datetimes are stored in their JSON forms
+    assert versions[0]["snapshot"]["activity_type"] == "MEETING"
+    assert versions[0]["snapshot"]["occurred_at"] == created["occurred_at"].replace("Z", "+00:00")
 
 
 @pytest.mark.asyncio
@@ -275,6 +279,35 @@ async def test_update_activity_multiple_versions(client: AsyncClient):
     assert versions[1]["version_number"] == 1
 
 
+@pytest.mark.asyncio
+async def test_update_activity_bumps_updated_at(client: AsyncClient):
+    """Test that the response carries the updated_at set by the database trigger."""
+    created = await _create_activity(client, "Timestamped")
+
+    response = await client.patch(
+        f"/api/activities/{created['id']}",
+        json={"title": "Timestamped Again"},
+    )
+    assert response.status_code == 200
+    assert response.json()["updated_at"] > created["updated_at"]
+
+
+@pytest.mark.asyncio
+async def test_update_activity_without_changes(client: AsyncClient):
+    """Test that an update changing nothing still snapshots but leaves the row alone."""
+    created = await _create_activity(client, "Unchanged")
+
+    response = await client.patch(
+        f"/api/activities/{created['id']}",
+        json={"title": "Unchanged"},
+    )
+    assert response.status_code == 200
+    assert response.json()["updated_at"] == created["updated_at"]
+
+    versions = (await client.get(f"/api/activities/{created['id']}/versions")).json()
+    assert [v["version_number"] for v in versions] == [1]
+
+
 @pytest.mark.asyncio
 async def test_update_activity_not_found(client: AsyncClient):
     """Test updating a non-existent activity."""
@@ -330,6 +363,61 @@ async def test_list_activities_pagination(client: AsyncClient):
     assert data["page_size"] == 2
 
 
+@pytest.mark.asyncio
+async def test_list_activities_total_past_last_page(client: AsyncClient):
+    """Test that an empty page past the end still reports the total."""
+    for i in range(3):
+        await _create_activity(client, f"Paginated {i}")
+
+    response = await client.get("/api/activities?page=5&page_size=2")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 3
+    assert data["items"] == []
+
+
+@pytest.mark.asyncio
+async def test_list_activities_reflects_writes(client: AsyncClient):
+    """Test that cached list pages are dropped when activities change."""
+    activity = await _create_activity(client, "Cached")
+    response = await client.get("/api/activities")
+    assert response.json()["total"] == 1
+
+    await client.patch(f"/api/activities/{activity['id']}", json={"title": "Renamed"})
+    response = await client.get("/api/activities")
+    assert response.json()["items"][0]["title"] == "Renamed"
+
+    await client.delete(f"/api/activities/{activity['id']}")
+    response = await client.get("/api/activities")
+    assert response.json()["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_list_activities_filter_by_date_range(client: AsyncClient):
+    """Test that from/to dates include the whole of the end day."""
+    await client.post(
+        "/api/activities",
+        json={
+            "title": "Late Meeting",
+            "activity_type": "MEETING",
+            "occurred_at": "2026-03-10T23:30:00+00:00",
+            "classification": "INTERNAL",
+        },
+    )
+
+    response = await client.get("/api/activities?from_date=2026-03-10&to_date=2026-03-10")
+    assert response.status_code == 200
+    assert response.json()["total"] == 1
+
+    response = await client.get("/api/activities?from_date=2026-03-11")
+    assert response.status_code == 200
+    assert response.json()["total"] == 0
+
+    response = await client.get("/api/activities?to_date=2026-03-09")
+    assert response.status_code == 200
+    assert response.json()["total"] == 0
+
+
 @pytest.mark.asyncio
 async def test_list_activities_filter_by_type(client: AsyncClient):
     """Test filtering activities by type."""
@@ -370,3 +458,29 @@ async def test_get_activity_versions_empty(client: AsyncClient):
     response = await client.get(f"/api/activities/{activity_id}/versions")
     assert response.status_code == 200
     assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_created_by_defaults_to_owner(test_session, test_user):
+    """created_by is only stored when it differs from the owner."""
+    from sqlalchemy import select
+    from app.models.activity import Activity, ActivityType
+
+    other_id = uuid4()
+    own = Activity(
+        title="Own", activity_type=ActivityType.NOTE, occurred_at=datetime.now(timezone.utc),
+        owner_id=test_user.id, created_by=test_user.id,
+    )
+    delegated = Activity(
+        title="Delegated", activity_type=ActivityType.NOTE, occurred_at=datetime.now(timezone.utc),
+        owner_id=test_user.id, created_by=other_id,
+    )
+
+    assert own.created_by_override is None
+    assert own.created_by == test_user.id
+    assert delegated.created_by_override == other_id
+
+    test_session.add(own)
+    await test_session.flush()
+    found = await test_session.scalar(select(Activity.id).where(Activity.created_by == test_user.id))
+    assert found == own.id
@@ -4,8 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.main import app as fastapi_app
-from app.database import get_db
-from app.dependencies import get_current_user
+from app.dependencies import get_db, get_current_user
 from app.models.user import User, UserRole
 from app.models.audit import AuditLog, AuditAction
 
@@ -225,3 +224,67 @@ async def test_multiple_operations_create_multiple_audit_entries(
     assert AuditAction.UPDATE in actions
     assert AuditAction.DELETE in actions
     assert len(entries) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "forwarded_for, expected_ip",
+    [
+        ("203.0.113.7, 10.0.0.1", "203.0.113.7"),
+        ("2001:db8::1", "2001:db8::1"),
+        ("not-an-ip", None),
+    ],
+)
+async def test_audit_entry_records_client_ip(
+    test_session: AsyncSession,
+    test_user: User,
+    client: AsyncClient,
+    forwarded_for: str,
+    expected_ip: str | None,
+):
+    """The forwarded client IP is stored as INET; unparseable values are dropped."""
+    resp = await client.post(
+        "/api/contacts",
+        json={"first_name": "Ip", "last_name": "Check"},
+        headers={"x-forwarded-for": forwarded_for},
+    )
+    assert resp.status_code == 201
+    contact_id = resp.json()["id"]
+
+    result = await test_session.execute(
+        select(AuditLog).where(
+            AuditLog.entity_type == "contact",
+            AuditLog.entity_id == contact_id,
+            AuditLog.action == AuditAction.CREATE,
+        )
+    )
+    entry = result.scalar_one()
+    if expected_ip is None:
+        assert entry.ip_address is None
+    else:
+        assert str(entry.ip_address) == expected_ip
+
+
+@pytest.mark.asyncio
+async def test_query_audit_log_items(client: AsyncClient, test_user: User):
+    """The audit log endpoint returns JSON-ready entries with the client IP as text."""
+    resp = await client.post(
+        "/api/contacts",
+        json={"first_name": "Listed", "last_name": "Entry"},
+        headers={"x-forwarded-for": "203.0.113.7"},
+    )
+    assert resp.status_code == 201
+    contact_id = resp.json()["id"]
+
+    resp = await client.get(f"/api/audit?entity_id={contact_id}")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["total"] == 1
+    entry = data["items"][0]
+    assert entry["action"] == "CREATE"
+    assert entry["entity_type"] == "contact"
+    assert entry["user_id"] == str(test_user.id)
+    assert entry["ip_address"] == "203.0.113.7"
+    assert set(entry) == {
+        "id", "user_id", "action", "entity_type", "entity_id", "details", "ip_address", "created_at",
+    }
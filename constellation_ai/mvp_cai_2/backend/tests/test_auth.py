@@ -4,8 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.main import app as fastapi_app
-from app.database import get_db
-from app.dependencies import get_current_user
+from app.dependencies import get_db, get_current_user
 from app.models.user import User, UserRole
 
 app = fastapi_app
@@ -130,3 +129,310 @@ async def test_inactive_user_returns_403(test_session: AsyncSession):
         assert resp.status_code == 403
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def rsa_signing(monkeypatch):
+    """Sign real RS256 tokens against a stubbed JWKS, with dev mode off."""
+    import asyncio
+    import base64
+    import time
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    import jwt
+
+    from app import dependencies
+    from app.auth import entra
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    numbers = private_key.public_key().public_numbers()
+
+    def b64(n: int) -> str:
+        return base64.urlsafe_b64encode(n.to_bytes((n.bit_length() + 7) // 8, "big")).rstrip(b"=").decode()
+
+    jwks = {"keys": [{"kty": "RSA", "kid": "test-kid", "use": "sig", "alg": "RS256", "n": b64(numbers.n), "e": b64(numbers.e)}]}
+    fetches = []
+
+    async def fake_fetch():
+        fetches.append(1)
+        await asyncio.sleep(0)  # yield like a real network call would
+        return jwks
+
+    cache = entra.JwksCache()
+    monkeypatch.setattr(cache, "_fetch", fake_fetch)
+
+    monkeypatch.setattr(entra, "DEV_MODE", False)
+    monkeypatch.setattr(dependencies, "DEV_MODE", False)
+    monkeypatch.setattr(entra, "AZURE_CLIENT_ID", "client")
+    monkeypatch.setattr(entra, "TOKEN_ISSUER", "https://login.microsoftonline.com/tenant/v2.0")
+    monkeypatch.setattr(entra, "jwks_cache", cache)
+    entra.clear_claims_cache()
+
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+    def sign(**overrides) -> str:
+        claims = {
+            "oid": "oid-1",
+            "preferred_username": "signed@eastrock.com",
+            "aud": "client",
+            "iss": "https://login.microsoftonline.com/tenant/v2.0",
+            "exp": int(time.time()) + 600,
+            **overrides,
+        }
+        return jwt.encode(claims, pem, algorithm="RS256", headers={"kid": "test-kid"})
+
+    yield sign, fetches
+    entra.clear_claims_cache()
+
+
+@pytest.mark.asyncio
+async def test_verify_token_caches_verified_claims(rsa_signing):
+    """A token verified once is served from the claims cache afterwards."""
+    from app.auth.entra import verify_token
+
+    sign, fetches = rsa_signing
+    token = sign()
+
+    first = await verify_token(token)
+    second = await verify_token(token)
+
+    assert first["oid"] == "oid-1"
+    assert second == first
+    assert len(fetches) == 1
+
+
+@pytest.mark.asyncio
+async def test_verify_token_rejects_bad_audience(rsa_signing):
+    """Signature-valid tokens for another audience are still rejected."""
+    from fastapi import HTTPException
+    from app.auth.entra import verify_token
+
+    sign, _ = rsa_signing
+    with pytest.raises(HTTPException) as exc_info:
+        await verify_token(sign(aud="someone-else"))
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_jwks_refresh_uses_shared_client_and_keeps_keys_on_error(monkeypatch):
+    """JWKS fetches go through the shared client; a failed refresh keeps the old keys."""
+    import httpx
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from jwt.algorithms import RSAAlgorithm
+    from app.auth import entra
+
+    public_key = rsa.generate_private_key(public_exponent=65537, key_size=2048).public_key()
+    jwks = {"keys": [{**RSAAlgorithm.to_jwk(public_key, as_dict=True), "kid": "k1"}]}
+    responses = [httpx.Response(200, json=jwks), httpx.Response(503)]
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(entra, "_http_client", client)
+    cache = entra.JwksCache()
+
+    await cache.refresh()
+    await cache.refresh()
+
+    assert len(requests) == 2
+    assert "k1" in cache.keys_by_kid
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_jwks_malformed_body_keeps_keys_and_refresh_loop(monkeypatch):
+    """A non-JSON 200 keeps the cached keys, and never stops the background refresh."""
+    import asyncio
+    import httpx
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from jwt.algorithms import RSAAlgorithm
+    from app.auth import entra
+
+    public_key = rsa.generate_private_key(public_exponent=65537, key_size=2048).public_key()
+    jwks = {"keys": [{**RSAAlgorithm.to_jwk(public_key, as_dict=True), "kid": "k1"}]}
+    html = httpx.Response(200, text="<html>Sign in to the proxy</html>")
+    responses = [httpx.Response(200, json=jwks), html]
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: responses.pop(0)))
+    monkeypatch.setattr(entra, "_http_client", client)
+
+    cache = entra.JwksCache()
+    await cache.refresh()
+    await cache.refresh()
+    assert "k1" in cache.keys_by_kid
+
+    # With nothing cached the same body raises out of refresh(); the loop carries on
+    attempts = []
+    cold = entra.JwksCache(ttl=0.02)
+
+    async def malformed_fetch():
+        attempts.append(1)
+        return httpx.Response(200, text="<html></html>").json()
+
+    monkeypatch.setattr(cold, "_fetch", malformed_fetch)
+    task = asyncio.create_task(cold.run_refresh_loop())
+    await asyncio.sleep(0.1)
+    assert len(attempts) >= 2
+    assert not task.done()
+    task.cancel()
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_lookups_fetch_jwks_once(rsa_signing):
+    """Requests racing on an empty cache share a single JWKS fetch."""
+    import asyncio
+    from app.auth import entra
+
+    _, fetches = rsa_signing
+    keys = await asyncio.gather(*(entra.jwks_cache.get_key("test-kid") for _ in range(20)))
+
+    assert all(k is not None for k in keys)
+    assert len(fetches) == 1
+
+
+@pytest.mark.asyncio
+async def test_verify_token_jwks_unreachable_is_503(rsa_signing, monkeypatch):
+    """With no keys cached and Azure AD unreachable, verification fails with a 503."""
+    import httpx
+    from fastapi import HTTPException
+    from app.auth import entra
+
+    sign, _ = rsa_signing
+
+    async def failing_fetch():
+        raise httpx.ConnectError("unreachable")
+
+    monkeypatch.setattr(entra.jwks_cache, "_fetch", failing_fetch)
+    with pytest.raises(HTTPException) as exc_info:
+        await entra.verify_token(sign())
+    assert exc_info.value.status_code == 503
+
+
+def test_peek_kid_reads_header_and_rejects_garbage():
+    """_peek_kid matches PyJWT for well-formed tokens and raises DecodeError otherwise."""
+    import jwt
+    from app.auth.entra import _peek_kid
+
+    token = jwt.encode({"sub": "x"}, "secret", algorithm="HS256", headers={"kid": "abc"})
+    assert _peek_kid(token) == "abc"
+    assert _peek_kid(jwt.encode({"sub": "x"}, "secret", algorithm="HS256")) is None
+
+    with pytest.raises(jwt.DecodeError):
+        _peek_kid("not-a-token")
+
+
+@pytest.mark.asyncio
+async def test_dev_mode_reuses_resolved_user(test_session: AsyncSession, monkeypatch):
+    """In dev mode the user is resolved once, then fetched by primary key."""
+    from app import dependencies
+    from app.auth import entra
+
+    monkeypatch.setattr(entra, "DEV_MODE", True)
+    monkeypatch.setattr(dependencies, "DEV_MODE", True)
+    monkeypatch.setattr(dependencies, "_dev_user_id", None)
+
+    async def override_get_db():
+        yield test_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides.pop(get_current_user, None)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        first = await ac.get("/api/users/me", headers={"Authorization": "Bearer a"})
+        assert first.status_code == 200
+        assert str(dependencies._dev_user_id) == first.json()["id"]
+
+        async def fail_verify(token):
+            raise AssertionError("claims lookup should be skipped")
+
+        monkeypatch.setattr(dependencies, "verify_token", fail_verify)
+        second = await ac.get("/api/users/me", headers={"Authorization": "Bearer b"})
+        assert second.status_code == 200
+        assert second.json()["id"] == first.json()["id"]
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_user_from_claims_links_seeded_user_by_email(test_session: AsyncSession):
+    """A user seeded without an oid is found by email and gets the oid attached."""
+    from app.dependencies import _user_from_claims
+
+    seeded = User(email="seeded@eastrock.com", display_name="Seeded", role=UserRole.VIEWER, is_active=True)
+    test_session.add(seeded)
+    await test_session.commit()
+
+    claims = {"oid": "oid-seeded", "preferred_username": "seeded@eastrock.com"}
+    user = await _user_from_claims(test_session, claims)
+    assert user.id == seeded.id
+    assert user.entra_object_id == "oid-seeded"
+    # Server-side timestamps come back with the write, no refresh needed
+    assert user.updated_at is not None
+
+    provisioned = await _user_from_claims(test_session, {"oid": "oid-new", "preferred_username": "new@eastrock.com"})
+    assert provisioned.created_at is not None
+
+    # Subsequent logins resolve through the oid
+    again = await _user_from_claims(test_session, claims)
+    assert again.id == seeded.id
+
+
+@pytest.mark.asyncio
+async def test_resolved_user_is_reloaded_by_primary_key(test_session: AsyncSession, rsa_signing, monkeypatch):
+    """Once resolved, a user's id is cached by oid; role changes still show up."""
+    from app import dependencies
+
+    sign, _ = rsa_signing
+    monkeypatch.setattr(dependencies, "_user_id_cache", {})
+
+    async def override_get_db():
+        yield test_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides.pop(get_current_user, None)
+
+    headers = {"Authorization": f"Bearer {sign()}"}
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        first = await ac.get("/api/users/me", headers=headers)
+        assert first.status_code == 200
+        assert "oid-1" in dependencies._user_id_cache
+
+        user = await test_session.get(User, dependencies._user_id_cache["oid-1"][0])
+        user.role = UserRole.ANALYST
+        await test_session.commit()
+
+        async def fail_lookup(db, claims):
+            raise AssertionError("claims lookup should be skipped")
+
+        monkeypatch.setattr(dependencies, "_user_from_claims", fail_lookup)
+        second = await ac.get("/api/users/me", headers=headers)
+        assert second.status_code == 200
+        assert second.json()["role"] == "ANALYST"
+
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_user_collections_refuse_lazy_load(test_session: AsyncSession, test_user: User):
+    """A user's owned-* collections must be loaded explicitly, never lazily."""
+    from sqlalchemy.exc import InvalidRequestError
+    from sqlalchemy.orm import selectinload
+
+    user = await test_session.get(User, test_user.id, populate_existing=True)
+    with pytest.raises(InvalidRequestError, match="raise_on_sql"):
+        user.owned_events
+
+    stmt = select(User).where(User.id == test_user.id).options(selectinload(User.owned_events))
+    user = (await test_session.execute(stmt.execution_options(populate_existing=True))).scalar_one()
+    assert user.owned_events == []
@@ -118,6 +118,29 @@ async def test_create_followup_nonexistent_activity(client: AsyncClient):
     assert response.status_code == 404
 
 
+@pytest.mark.asyncio
+async def test_create_followups_with_activity(client: AsyncClient):
+    """Test creating followups inline when creating the activity."""
+    response = await client.post(
+        "/api/activities",
+        json={
+            "title": "Meeting with followups",
+            "activity_type": "MEETING",
+            "occurred_at": datetime.now(timezone.utc).isoformat(),
+            "followups": [
+                {"description": "Send deck"},
+                {"description": "Book next call", "due_date": date.today().isoformat()},
+            ],
+        },
+    )
+    assert response.status_code == 201
+
+    detail = (await client.get(f"/api/activities/{response.json()['id']}")).json()
+    followups = sorted(detail["followups"], key=lambda f: f["description"])
+    assert [f["description"] for f in followups] == ["Book next call", "Send deck"]
+    assert all(f["status"] == "OPEN" for f in followups)
+
+
 @pytest.mark.asyncio
 async def test_create_followup_missing_description(client: AsyncClient):
     """Test creating a followup without required description."""
@@ -153,6 +153,23 @@ async def test_update_organization(client: AsyncClient):
     assert data["org_type"] == "CORPORATE"  # unchanged
 
 
+@pytest.mark.asyncio
+async def test_update_organization_bumps_updated_at(client: AsyncClient):
+    """Test that the database trigger advances updated_at on update."""
+    create_response = await client.post(
+        "/api/organizations",
+        json={"name": "Timestamped", "classification": "INTERNAL"},
+    )
+    created = create_response.json()
+
+    response = await client.patch(
+        f"/api/organizations/{created['id']}",
+        json={"name": "Timestamped Again"},
+    )
+    assert response.status_code == 200
+    assert response.json()["updated_at"] > created["updated_at"]
+
+
 @pytest.mark.asyncio
 async def test_update_organization_not_found(client: AsyncClient):
     """Test updating a non-existent organization."""
@@ -3,8 +3,7 @@ from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app as fastapi_app
-from app.database import get_db
-from app.dependencies import get_current_user
+from app.dependencies import get_db, get_current_user
 from app.models.user import User, UserRole
 from app.models.organization import Classification
 from app.models.contact import Contact
@@ -300,3 +299,23 @@ async def test_manager_can_create_organization(test_session: AsyncSession):
         assert resp.status_code == 201
 
     app.dependency_overrides.clear()
+
+
+# --- Classification tables ---
+
+@pytest.mark.parametrize("role", list(UserRole))
+def test_role_classifications_match_access_table(role: UserRole):
+    """ROLE_CLASSIFICATIONS is the exact inverse of CLASSIFICATION_ACCESS."""
+    from app.auth.rbac import ROLE_CLASSIFICATIONS, can_access_classification
+
+    expected = {c for c in Classification if can_access_classification(role, c)}
+    assert set(ROLE_CLASSIFICATIONS[role]) == expected
+
+
+def test_dependency_factories_are_memoized():
+    """Identical arguments give the same checker, so FastAPI can dedupe it per request."""
+    from app.auth.rbac import require_role, require_classification
+
+    assert require_role(UserRole.ADMIN) is require_role(UserRole.ADMIN)
+    assert require_role(UserRole.ADMIN) is not require_role(UserRole.ADMIN, UserRole.MANAGER)
+    assert require_classification(Classification.RESTRICTED) is require_classification(Classification.RESTRICTED)
@@ -253,3 +253,20 @@ async def test_same_tag_value_different_sets(client: AsyncClient):
 
     # They should be different tags
     assert tag_a["id"] != tag_b["id"]
+
+
+@pytest.mark.asyncio
+async def test_add_contact_tags_is_idempotent(client: AsyncClient):
+    """Test that re-adding a tag a contact already has is a no-op."""
+    tag_set = await _create_tag_set(client, "Contact Set")
+    tag = await _create_tag(client, tag_set["id"], "Contact Tag")
+    contact = (
+        await client.post("/api/contacts", json={"first_name": "Ada", "last_name": "Lovelace"})
+    ).json()
+
+    for _ in range(2):
+        response = await client.post(f"/api/contacts/{contact['id']}/tags", json=[tag["id"]])
+        assert response.status_code == 200
+
+    detail = (await client.get(f"/api/contacts/{contact['id']}")).json()
+    assert [t["id"] for t in detail["tags"]] == [tag["id"]]
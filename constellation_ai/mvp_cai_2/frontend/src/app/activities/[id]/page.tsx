@@ -39,7 +39,7 @@ import {
   getClassificationColor,
   getFollowUpStatusColor,
 } from "@/lib/utils";
-import type { Activity, User, PaginatedResponse, FollowUpStatus } from "@/types";
+import type { Activity, ActivityVersion, User, PaginatedResponse, FollowUpStatus } from "@/types";
 
 const ALLOWED_CONTENT_TYPES = [
   "application/pdf",
@@ -58,6 +58,7 @@ export default function ActivityDetailPage() {
   const activityId = params.id as string;
   const { getToken } = useAuth();
   const [activity, setActivity] = useState<Activity | null>(null);
+  const [versions, setVersions] = useState<ActivityVersion[]>([]);
   const [isLoading, setIsLoading] = useState(true);
   const [isDeleting, setIsDeleting] = useState(false);
   const [deleteError, setDeleteError] = useState<string | null>(null);
@@ -81,8 +82,12 @@ export default function ActivityDetailPage() {
   async function fetchActivity() {
     try {
       const token = await getToken();
-      const data = await api.getActivity(token, activityId);
+      const [data, versionData] = await Promise.all([
+        api.getActivity(token, activityId),
+        api.getActivityVersions(token, activityId),
+      ]);
       setActivity(data);
+      setVersions(versionData);
     } catch (error) {
       console.error("Failed to fetch activity:", error);
     } finally {
@@ -539,7 +544,7 @@ export default function ActivityDetailPage() {
           </Card>
 
           {/* Version History */}
-          {activity.versions && activity.versions.length > 0 && (
+          {versions.length > 0 && (
             <Card>
               <CardHeader>
                 <CardTitle className="flex items-center gap-2">
@@ -549,7 +554,7 @@ export default function ActivityDetailPage() {
               </CardHeader>
               <CardContent>
                 <div className="space-y-2">
-                  {activity.versions.map((version) => (
+                  {versions.map((version) => (
                     <div
                       key={version.id}
                       className="text-sm p-2 rounded-lg border"
@@ -106,7 +106,6 @@ export interface Activity {
   tags?: Tag[];
   attachments?: Attachment[];
   followups?: FollowUp[];
-  versions?: ActivityVersion[];
 }
 
 export interface ActivitySummary {